@@ -1,17 +1,68 @@
+import logging
+import time
 from datetime import datetime
+from typing import Optional
 from uuid import UUID
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
+from jose import JWTError, jwt
+from redis import RedisError
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from starlette.datastructures import Headers
+from app.core.config import settings
 from app.schemas.user import UserResponse
 from app.models.user import User
+from app.auth import redis as token_blacklist
+from app.database import SessionLocal, get_db, read_session
+from app.core.server_timing import timed
+
+logger = logging.getLogger(__name__)
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/token")
 
+BLACKLIST_RETRY_SECONDS = 5.0  # Skip the blacklist check this long after Redis failed
+_blacklist_down_until = 0.0
+
+async def is_token_revoked(token: str) -> bool:
+    """
+    Check a verified token's jti against the Redis blacklist (see DELETE /users/me).
+
+    While Redis is unreachable the check is skipped for BLACKLIST_RETRY_SECONDS,
+    so an outage does not lock everyone out or add a failed connect to
+    every request. Writes stay protected meanwhile: get_current_writer
+    refuses inactive users.
+    """
+    global _blacklist_down_until
+    try:
+        jti = jwt.get_unverified_claims(token).get("jti")
+    except JWTError:
+        return False
+    if jti is None or time.monotonic() < _blacklist_down_until:
+        return False
+    try:
+        return await token_blacklist.is_blacklisted(jti)
+    except (RedisError, OSError) as e:
+        _blacklist_down_until = time.monotonic() + BLACKLIST_RETRY_SECONDS
+        logger.warning(f"Token blacklist unavailable, not checked for {BLACKLIST_RETRY_SECONDS:.0f}s: {e}")
+        return False
+
+async def get_unrevoked_token(token: str = Depends(oauth2_scheme)) -> str:
+    """Dependency: the bearer token, unless it was revoked (401)."""
+    if await is_token_revoked(token):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return token
+
 def get_current_user(
-    token: str = Depends(oauth2_scheme)
+    token: str = Depends(get_unrevoked_token)
 ) -> UserResponse:
     """
     Dependency to get the current user from the JWT token without a database lookup.
+    Revoked tokens are rejected by get_unrevoked_token before this runs.
     This function supports two types of payloads:
       - A full payload as a dict containing user info.
       - A minimal payload, either as a dict with only a 'sub' key or directly as a UUID.
@@ -22,7 +73,8 @@ def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    token_data = User.verify_token(token)
+    with timed("auth"):
+        token_data = User.verify_token(token)
     if token_data is None:
         raise credentials_exception
 
@@ -79,3 +131,78 @@ def get_current_active_user(
             detail="Inactive user"
         )
     return current_user
+
+def get_current_writer(
+    current_user: UserResponse = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+) -> UserResponse:
+    """
+    Dependency for endpoints that write: the token's user must still exist and be active.
+
+    get_current_user trusts the token and the blacklist, and a deleted
+    account may hold tokens other than the one it revoked (or Redis may
+    be down). Writes check the primary, so such a user cannot add rows
+    that the purge would then trip over.
+    """
+    is_active = db.execute(select(User.is_active).where(User.id == current_user.id)).scalar()
+    if not is_active:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return current_user
+
+def get_current_admin_user(
+    current_user: UserResponse = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+) -> User:
+    """
+    Dependency for the /admin endpoints: the current user must be listed in ADMIN_USERNAMES.
+
+    Tokens only carry the user id, so the username is looked up on the primary.
+    """
+    user = find_admin(db, current_user.id)
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin privileges required"
+        )
+    return user
+
+def find_admin(db: Session, user_id: UUID) -> Optional[User]:
+    """Return the user if they are active and listed in ADMIN_USERNAMES, else None."""
+    if not settings.ADMIN_USERNAMES:
+        return None
+    user = db.get(User, user_id)
+    if user is None or not user.is_active or user.username not in settings.ADMIN_USERNAMES:
+        return None
+    return user
+
+def is_admin_request(headers: Headers) -> bool:
+    """
+    Check the bearer token of a request for an admin, outside FastAPI's dependencies
+    (used by ProfilerMiddleware for ?profile=1). Blocking: call it in the threadpool.
+    """
+    scheme, _, token = headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return False
+    user_id = User.verify_token(token)
+    if not isinstance(user_id, UUID):
+        return False
+    db = SessionLocal()
+    try:
+        return find_admin(db, user_id) is not None
+    finally:
+        db.close()
+
+def get_read_db(
+    current_user: UserResponse = Depends(get_current_active_user)
+):
+    """
+    Dependency for read-only endpoints: a session routed to a read replica.
+
+    The user is needed for read-your-writes stickiness, so a user who just
+    wrote keeps reading from the primary for a few seconds.
+    """
+    yield from read_session(current_user.id)
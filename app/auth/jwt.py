@@ -10,6 +10,8 @@ from uuid import UUID
 import secrets
 
 from app.core.config import get_settings
+from app.core.metrics import BCRYPT_SECONDS
+from app.core.server_timing import timed
 from app.auth.redis import is_blacklisted
 from app.schemas.token import TokenType
 from app.database import get_db
@@ -28,11 +30,13 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    with BCRYPT_SECONDS.labels("verify").time():
+        return pwd_context.verify(plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    with BCRYPT_SECONDS.labels("hash").time():
+        return pwd_context.hash(password)
 
 
 def create_token(
@@ -93,12 +97,13 @@ async def decode_token(
     )
 
     try:
-        payload = jwt.decode(
-            token,
-            secret,
-            algorithms=[settings.ALGORITHM],
-            options={"verify_exp": verify_exp}
-        )
+        with timed("auth"):
+            payload = jwt.decode(
+                token,
+                secret,
+                algorithms=[settings.ALGORITHM],
+                options={"verify_exp": verify_exp}
+            )
     except ExpiredSignatureError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
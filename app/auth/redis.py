@@ -3,6 +3,8 @@
 import redis.asyncio as redis  # this defines redis.from_url
 from redis.asyncio import Redis
 from app.core.config import get_settings
+from app.core.metrics import REDIS_SECONDS
+from app.core.server_timing import timed
 
 settings = get_settings()
 
@@ -24,9 +26,11 @@ async def get_redis() -> Redis:
 
 async def add_to_blacklist(jti: str, exp: int):
     client = await get_redis()
-    await client.set(f"blacklist:{jti}", "1", ex=exp)
+    with REDIS_SECONDS.labels("add").time():
+        await client.set(f"blacklist:{jti}", "1", ex=exp)
 
 
 async def is_blacklisted(jti: str) -> bool:
     client = await get_redis()
-    return await client.exists(f"blacklist:{jti}") == 1
\ No newline at end of file
+    with REDIS_SECONDS.labels("check").time(), timed("blacklist"):
+        return await client.exists(f"blacklist:{jti}") == 1
\ No newline at end of file
@@ -0,0 +1,131 @@
+# app/build_static.py
+"""
+Static Asset Build Step
+
+Prepares static/ for production in two stages:
+
+1. Fingerprinting: every CSS/JS file is copied to static/dist/ under a
+   content-hashed name (js/dashboard.js -> dist/js/dashboard.1a2b3c4d5e.js)
+   and the mapping is written to static/dist/manifest.json. The templates
+   resolve URLs through the manifest with static_url() (app/core/assets.py),
+   and everything under dist/ is served as immutable.
+2. Precompression: every compressible file (CSS, JS, SVG, ...) at least
+   MINIMUM_SIZE bytes long gets these siblings, which PrecompressedStaticFiles
+   serves:
+   - <file>.gz  (gzip level 9, mtime fixed at 0 so builds are reproducible)
+   - <file>.br  (brotli quality 11, only if the brotli package is installed)
+
+Run it after copying the sources (see the Dockerfile):
+    python -m app.build_static [--directory static]
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import shutil
+from pathlib import Path
+from typing import Dict, List
+
+from app.core.assets import DIST_DIRECTORY, MANIFEST_NAME
+
+try:  # Optional dependency
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+COMPRESSIBLE_SUFFIXES = {".css", ".js", ".mjs", ".json", ".svg", ".html", ".txt", ".map", ".xml"}
+FINGERPRINT_SUFFIXES = {".css", ".js", ".mjs"}
+MINIMUM_SIZE = 256
+HASH_LENGTH = 10
+
+
+def fingerprint_directory(directory: Path) -> Dict[str, str]:
+    """
+    Copy CSS/JS files into <directory>/dist under content-hashed names.
+
+    The dist directory is rebuilt from scratch so stale hashes do not pile up.
+
+    Returns:
+        dict: Manifest mapping logical paths to hashed paths (relative to dist/)
+    """
+    dist = directory / DIST_DIRECTORY
+    if dist.exists():
+        shutil.rmtree(dist)
+
+    manifest: Dict[str, str] = {}
+    for path in sorted(directory.rglob("*")):
+        if not path.is_file() or path.suffix not in FINGERPRINT_SUFFIXES:
+            continue
+        logical = path.relative_to(directory).as_posix()
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()[:HASH_LENGTH]
+        hashed = path.relative_to(directory).with_name(f"{path.stem}.{digest}{path.suffix}").as_posix()
+        target = dist / hashed
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(path, target)
+        manifest[logical] = hashed
+
+    dist.mkdir(parents=True, exist_ok=True)
+    (dist / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n")
+    return manifest
+
+
+def precompress_file(path: Path) -> List[Path]:
+    """
+    Write .gz and .br variants of a single file.
+
+    Variants that would not be smaller than the original are skipped.
+
+    Returns:
+        list: The variant files that were written
+    """
+    data = path.read_bytes()
+    written = []
+    encoders = [(".gz", lambda raw: gzip.compress(raw, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        encoders.append((".br", lambda raw: brotli.compress(raw, quality=11)))
+
+    for suffix, encode in encoders:
+        variant = path.with_name(path.name + suffix)
+        compressed = encode(data)
+        if len(compressed) >= len(data):
+            variant.unlink(missing_ok=True)
+            continue
+        variant.write_bytes(compressed)
+        written.append(variant)
+    return written
+
+
+def precompress_directory(directory: Path) -> List[Path]:
+    """
+    Precompress every eligible file below a directory.
+
+    Returns:
+        list: All variant files that were written
+    """
+    written = []
+    for path in sorted(directory.rglob("*")):
+        if not path.is_file() or path.suffix not in COMPRESSIBLE_SUFFIXES:
+            continue
+        if path.stat().st_size < MINIMUM_SIZE:
+            continue
+        written.extend(precompress_file(path))
+    return written
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Fingerprint and precompress static assets.")
+    parser.add_argument("--directory", default="static", help="Static files directory")
+    args = parser.parse_args()
+    directory = Path(args.directory)
+
+    manifest = fingerprint_directory(directory)
+    for logical, hashed in manifest.items():
+        print(f"{logical} -> {DIST_DIRECTORY}/{hashed}")
+
+    written = precompress_directory(directory)
+    print(f"{len(manifest)} fingerprinted files, {len(written)} precompressed files")
+
+
+if __name__ == "__main__":
+    main()
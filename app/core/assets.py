@@ -0,0 +1,88 @@
+# app/core/assets.py
+"""
+Fingerprinted Static Assets Module
+
+`python -m app.build_static` copies CSS/JS files from static/ into
+static/dist/ under content-hashed names (js/dashboard.js ->
+dist/js/dashboard.1a2b3c4d5e.js) and records the mapping in
+static/dist/manifest.json. This module provides:
+
+- AssetManifest: resolves a logical asset path to its hashed URL. The
+  templates call it as `static_url('js/dashboard.js')`.
+- FingerprintedStaticFiles: serves static files, and marks everything under
+  dist/ as immutable, since a changed file always gets a new name.
+
+Without a build (local development) the manifest is missing and static_url
+falls back to the unhashed /static/<path> URL.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict
+
+from starlette.responses import Response
+from starlette.types import Scope
+
+from app.core.compression import PrecompressedStaticFiles
+
+DIST_DIRECTORY = "dist"
+MANIFEST_NAME = "manifest.json"
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class AssetManifest:
+    """
+    Maps logical asset paths to their fingerprinted URLs.
+
+    Args:
+        directory: The static files directory
+        url_prefix: URL the static directory is mounted at
+    """
+
+    def __init__(self, directory: str = "static", url_prefix: str = "/static") -> None:
+        self.directory = Path(directory)
+        self.url_prefix = url_prefix.rstrip("/")
+        self.entries: Dict[str, str] = {}
+        self.load()
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.directory / DIST_DIRECTORY / MANIFEST_NAME
+
+    def load(self) -> None:
+        """(Re)load the manifest; a missing manifest means no fingerprinting."""
+        try:
+            self.entries = json.loads(self.manifest_path.read_text())
+        except FileNotFoundError:
+            self.entries = {}
+
+    def url(self, path: str) -> str:
+        """
+        Resolve a logical asset path (e.g. "js/dashboard.js") to a URL.
+
+        Returns:
+            str: /static/dist/<hashed path> if fingerprinted, else /static/<path>
+        """
+        path = path.lstrip("/")
+        hashed = self.entries.get(path)
+        if hashed is None:
+            return f"{self.url_prefix}/{path}"
+        return f"{self.url_prefix}/{DIST_DIRECTORY}/{hashed}"
+
+
+class FingerprintedStaticFiles(PrecompressedStaticFiles):
+    """
+    Static files with long-lived caching for fingerprinted assets.
+
+    Files below dist/ have content-hashed names, so they are served with
+    `Cache-Control: public, max-age=31536000, immutable`. Other files keep
+    the default ETag/Last-Modified revalidation.
+    """
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        response = await super().get_response(path, scope)
+        fingerprinted = path.split(os.sep, 1)[0] == DIST_DIRECTORY and not path.endswith(MANIFEST_NAME)
+        if fingerprinted and response.status_code in (200, 304):
+            response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        return response
@@ -0,0 +1,219 @@
+# app/core/compression.py
+"""
+Response Compression Module
+
+This module provides HTTP response compression for the API and HTML routes:
+- CompressionMiddleware negotiates brotli or gzip from Accept-Encoding
+- Responses smaller than a minimum size are sent uncompressed
+- Only content types on an allowlist are compressed (JSON, HTML, CSS, JS, ...)
+- PrecompressedStaticFiles serves the .br/.gz variants that
+  `python -m app.build_static` writes next to the files under static/
+
+Brotli is optional: if the `brotli` package is not installed, the middleware
+falls back to gzip and the static files fall back to .gz variants.
+"""
+
+import os
+from typing import Dict, Optional, Tuple
+
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipResponder, IdentityResponder
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:  # Optional dependency
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+# Content types worth compressing; images, fonts and archives are already compressed
+DEFAULT_COMPRESSIBLE_TYPES: Tuple[str, ...] = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/",
+)
+
+
+def parse_accept_encoding(header: str) -> Dict[str, float]:
+    """
+    Parse an Accept-Encoding header into a mapping of coding -> q-value.
+
+    Example:
+        "gzip, br;q=0.8, *;q=0" -> {"gzip": 1.0, "br": 0.8, "*": 0.0}
+    """
+    encodings: Dict[str, float] = {}
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        encodings[coding] = quality
+    return encodings
+
+
+def choose_encoding(header: str) -> Optional[str]:
+    """
+    Pick the best supported content coding for an Accept-Encoding header.
+
+    Brotli is preferred over gzip when both are accepted with the same
+    quality, because it compresses text noticeably better.
+
+    Returns:
+        "br", "gzip" or None if neither is acceptable
+    """
+    accepted = parse_accept_encoding(header)
+    wildcard = accepted.get("*", 0.0)
+    candidates = []
+    if brotli is not None:
+        candidates.append(("br", accepted.get("br", wildcard)))
+    candidates.append(("gzip", accepted.get("gzip", wildcard)))
+    best = max(candidates, key=lambda item: item[1])  # max() keeps the first on ties
+    return best[0] if best[1] > 0 else None
+
+
+def is_compressible(content_type: str, allowlist: Tuple[str, ...] = DEFAULT_COMPRESSIBLE_TYPES) -> bool:
+    """Check whether a Content-Type header value is on the compression allowlist."""
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return any(media_type.startswith(allowed) for allowed in allowlist)
+
+
+class AllowlistMixin:
+    """
+    Restricts Starlette's responders to allowlisted content types.
+
+    Starlette only excludes text/event-stream; here anything that is not on
+    the allowlist (images, fonts, octet-stream, ...) is passed through as is.
+    """
+    allowlist: Tuple[str, ...] = DEFAULT_COMPRESSIBLE_TYPES
+
+    async def send_with_compression(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            await super().send_with_compression(message)
+            content_type = Headers(raw=message["headers"]).get("content-type", "")
+            if not is_compressible(content_type, self.allowlist):
+                self.content_type_is_excluded = True
+            return
+        await super().send_with_compression(message)
+
+
+class AllowlistGZipResponder(AllowlistMixin, GZipResponder):
+    """gzip responder limited to allowlisted content types."""
+
+
+class BrotliResponder(AllowlistMixin, IdentityResponder):
+    """Brotli responder limited to allowlisted content types."""
+    content_encoding = "br"
+
+    def __init__(self, app: ASGIApp, minimum_size: int, quality: int = 4) -> None:
+        super().__init__(app, minimum_size)
+        self.compressor = brotli.Compressor(quality=quality)
+
+    def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
+        compressed = self.compressor.process(body)
+        if more_body:
+            return compressed + self.compressor.flush()
+        return compressed + self.compressor.finish()
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware that compresses responses with brotli or gzip.
+
+    Args:
+        app: The ASGI application to wrap
+        minimum_size: Responses smaller than this (in bytes) are not compressed
+        allowlist: Content-type prefixes that may be compressed
+        gzip_level: gzip compression level (1-9)
+        brotli_quality: Brotli quality (0-11); 4 is a good speed/ratio trade-off
+            for dynamic responses
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 500,
+        allowlist: Tuple[str, ...] = DEFAULT_COMPRESSIBLE_TYPES,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.allowlist = tuple(allowlist)
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding == "br":
+            responder = BrotliResponder(self.app, self.minimum_size, quality=self.brotli_quality)
+        elif encoding == "gzip":
+            responder = AllowlistGZipResponder(self.app, self.minimum_size, compresslevel=self.gzip_level)
+        else:
+            await self.app(scope, receive, send)
+            return
+
+        responder.allowlist = self.allowlist
+        await responder(scope, receive, send)
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """
+    StaticFiles that serves precompressed .br/.gz siblings when accepted.
+
+    For a request to /static/css/style.css with `Accept-Encoding: br`, the
+    file static/css/style.css.br is sent with `Content-Encoding: br` and the
+    original file's media type. Files without a variant are served as usual.
+    """
+
+    VARIANTS = (("br", ".br"), ("gzip", ".gz"))
+
+    def file_response(
+        self,
+        full_path: "os.PathLike[str] | str",
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        if not isinstance(response, FileResponse):
+            return response  # e.g. 304 Not Modified
+
+        accepted = parse_accept_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        has_variants = False
+        for encoding, suffix in self.VARIANTS:
+            variant_path = f"{full_path}{suffix}"
+            try:
+                variant_stat = os.stat(variant_path)
+            except OSError:
+                continue
+            has_variants = True
+            if accepted.get(encoding, accepted.get("*", 0.0)) <= 0:
+                continue
+            variant = FileResponse(
+                variant_path,
+                status_code=status_code,
+                stat_result=variant_stat,
+                media_type=response.media_type,
+                headers={"Content-Encoding": encoding, "Vary": "Accept-Encoding"},
+            )
+            if self.is_not_modified(variant.headers, Headers(scope=scope)):
+                return NotModifiedResponse(variant.headers)
+            return variant
+
+        if has_variants:
+            response.headers.add_vary_header("Accept-Encoding")
+        return response
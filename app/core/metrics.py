@@ -0,0 +1,208 @@
+# app/core/metrics.py
+"""
+Prometheus Metrics Module
+
+Exposes request, password hashing, Redis and SQL metrics at GET /metrics:
+
+- http_request_duration_seconds{method, route, status}: latency histogram
+  labelled by route template ("/calculations/{calc_id}"), never the raw
+  path, so the number of series stays bounded
+- http_requests_in_progress: requests currently being handled
+- bcrypt_duration_seconds{operation}: password hash/verify time
+- redis_blacklist_duration_seconds{operation}: token blacklist calls
+- db_query_duration_seconds: every SQL statement (all engines)
+- db_queries_per_request / db_time_per_request_seconds{route}: statements
+  and SQL time spent by each request
+
+SQL statements are timed with before/after_cursor_execute listeners on
+all engines and added to the current request's RequestStats, found
+through a context variable (sync endpoints run in a threadpool with a
+copy of the request's context, so they share the same stats object).
+
+The app runs 4 uvicorn worker processes, each with its own counters. With
+PROMETHEUS_MULTIPROC_DIR set (see the Dockerfile), prometheus_client keeps
+the values in memory-mapped files in that directory and /metrics merges
+all workers' files, so any worker answers with the totals. The directory
+must be emptied before the workers start.
+"""
+
+import os
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Optional
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+METRICS_CONTENT_TYPE = CONTENT_TYPE_LATEST
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"],
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests currently being handled",
+    multiprocess_mode="livesum",
+)
+BCRYPT_SECONDS = Histogram(
+    "bcrypt_duration_seconds",
+    "Time spent hashing or verifying passwords",
+    ["operation"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.2, 0.3, 0.5, 1.0, 2.0),
+)
+REDIS_SECONDS = Histogram(
+    "redis_blacklist_duration_seconds",
+    "Latency of token blacklist calls to Redis",
+    ["operation"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25),
+)
+DB_QUERY_SECONDS = Histogram(
+    "db_query_duration_seconds",
+    "Latency of individual SQL statements",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+DB_QUERIES_PER_REQUEST = Histogram(
+    "db_queries_per_request",
+    "SQL statements executed per HTTP request",
+    ["route"],
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100),
+)
+DB_TIME_PER_REQUEST = Histogram(
+    "db_time_per_request_seconds",
+    "Total SQL time per HTTP request",
+    ["route"],
+)
+DB_QUERIES_TOTAL = Counter("db_queries", "SQL statements executed")
+
+
+@dataclass
+class RequestStats:
+    """SQL work done while handling one request."""
+    queries: int = 0
+    db_seconds: float = 0.0
+
+
+_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+def current_request_stats() -> Optional[RequestStats]:
+    """Return the stats of the request being handled, or None outside a request."""
+    return _request_stats.get()
+
+
+# A connection runs one statement at a time, so one start value is enough. A
+# statement that raises never reaches after_cursor_execute; its start is
+# simply overwritten by the next statement instead of piling up.
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info["metrics_query_start"] = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = conn.info.pop("metrics_query_start", None)
+    if start is None:
+        return
+    elapsed = time.perf_counter() - start
+    DB_QUERY_SECONDS.observe(elapsed)
+    DB_QUERIES_TOTAL.inc()
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.db_seconds += elapsed
+
+
+def route_template(scope: Scope) -> str:
+    """
+    Return the matched route's path template for a finished request.
+
+    FastAPI stores the matched APIRoute in the scope; mounts (static files)
+    leave their mount path in root_path. Anything else is "<unmatched>".
+    """
+    route = scope.get("route")
+    if route is not None and getattr(route, "path", None):
+        return route.path
+    return scope.get("root_path") or "<unmatched>"
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware that records request latency, in-flight requests
+    and per-request SQL statistics.
+
+    Latency is measured until the last body chunk is sent, so background
+    tasks that run after the response are not counted.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+        start = time.perf_counter()
+        status_code = 500
+        recorded = False
+
+        def record() -> None:
+            nonlocal recorded
+            if recorded:
+                return
+            recorded = True
+            route = route_template(scope)
+            REQUEST_LATENCY.labels(scope["method"], route, str(status_code)).observe(time.perf_counter() - start)
+            DB_QUERIES_PER_REQUEST.labels(route).observe(stats.queries)
+            DB_TIME_PER_REQUEST.labels(route).observe(stats.db_seconds)
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                record()
+
+        REQUESTS_IN_PROGRESS.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            REQUESTS_IN_PROGRESS.dec()
+            record()  # No-op unless the app failed before finishing the response
+            _request_stats.reset(token)
+
+
+def generate_metrics() -> bytes:
+    """
+    Render all metrics in the Prometheus text format.
+
+    In multiprocess mode the values of every worker process are merged.
+    """
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry)
+    return generate_latest(REGISTRY)
+
+
+def mark_process_dead() -> None:
+    """Drop this worker's live gauges from the shared files (call at shutdown)."""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(os.getpid())
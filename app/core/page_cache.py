@@ -0,0 +1,118 @@
+# app/core/page_cache.py
+"""
+HTML Page Cache Module
+
+The web routes render Jinja templates whose output never changes (index,
+login, register, dashboard) or only changes with a path parameter (the
+view/edit pages differ only by calc_id). The page data itself is fetched
+by JavaScript from the API, so the HTML can be rendered ahead of time.
+
+PageCache keeps rendered pages as bytes with a precomputed ETag:
+- Parameterless pages are rendered once (at startup via prerender(), or on
+  first request) and kept forever
+- Parameterized pages are cached per parameter set in a bounded LRU
+- respond() answers If-None-Match revalidation with 304 Not Modified
+
+Pages are rendered without a request, so the templates must not depend on
+it. app/main.py replaces the request-bound url_for global with a
+path-only version for this reason.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+from fastapi import Request
+from fastapi.responses import Response
+from fastapi.templating import Jinja2Templates
+
+HTML_CACHE_CONTROL = "no-cache"  # Always revalidate; the ETag makes that cheap
+
+
+@dataclass(frozen=True)
+class CachedPage:
+    """A rendered page and its strong ETag."""
+    body: bytes
+    etag: str
+
+
+class PageCache:
+    """
+    Cache of pre-rendered HTML pages.
+
+    Args:
+        templates: The Jinja2Templates instance used by the web routes
+        max_entries: Maximum number of parameterized pages kept in the LRU
+    """
+
+    def __init__(self, templates: Jinja2Templates, max_entries: int = 1024) -> None:
+        self.env = templates.env
+        self.max_entries = max_entries
+        self.static_pages: Dict[str, CachedPage] = {}
+        self.parameterized_pages: "OrderedDict[Tuple, CachedPage]" = OrderedDict()
+        # Sync routes run in a threadpool, so guard the LRU bookkeeping
+        self.lock = threading.Lock()
+
+    def render(self, template_name: str, **context) -> CachedPage:
+        """Render a template into bytes and compute its ETag."""
+        body = self.env.get_template(template_name).render(**context).encode("utf-8")
+        etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+        return CachedPage(body=body, etag=etag)
+
+    def prerender(self, *template_names: str) -> None:
+        """Render parameterless pages ahead of time (called at startup)."""
+        for template_name in template_names:
+            self.static_pages[template_name] = self.render(template_name)
+
+    def get(self, template_name: str, **params) -> CachedPage:
+        """
+        Return the cached page for a template and parameters, rendering on a miss.
+
+        Args:
+            template_name: Template file name, e.g. "view_calculation.html"
+            **params: Template parameters that the page varies by
+
+        Returns:
+            CachedPage: The rendered page
+        """
+        if not params:
+            page = self.static_pages.get(template_name)
+            if page is None:
+                page = self.static_pages[template_name] = self.render(template_name)
+            return page
+
+        key = (template_name, tuple(sorted(params.items())))
+        with self.lock:
+            page = self.parameterized_pages.get(key)
+            if page is not None:
+                self.parameterized_pages.move_to_end(key)
+                return page
+
+        page = self.render(template_name, **params)
+        with self.lock:
+            self.parameterized_pages[key] = page
+            self.parameterized_pages.move_to_end(key)
+            while len(self.parameterized_pages) > self.max_entries:
+                self.parameterized_pages.popitem(last=False)
+        return page
+
+    def respond(self, request: Request, template_name: str, **params) -> Response:
+        """
+        Build an HTML response for a cached page, honoring If-None-Match.
+
+        Returns:
+            Response: 200 with the page body, or 304 if the client's copy is current
+        """
+        page = self.get(template_name, **params)
+        headers = {"ETag": page.etag, "Cache-Control": HTML_CACHE_CONTROL}
+        if page.etag in request.headers.get("if-none-match", ""):
+            return Response(status_code=304, headers=headers)
+        return Response(content=page.body, media_type="text/html", headers=headers)
+
+    def clear(self) -> None:
+        """Drop every cached page (e.g. after templates or assets change)."""
+        with self.lock:
+            self.static_pages.clear()
+            self.parameterized_pages.clear()
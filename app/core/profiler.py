@@ -0,0 +1,222 @@
+# app/core/profiler.py
+"""
+Sampling Profiler Module
+
+A low-overhead statistical profiler for live workers. A background thread
+reads the stack of every thread (sys._current_frames()) every few
+milliseconds and counts identical stacks. Nothing is hooked into the
+profiled code, so it runs at full speed; the cost is the sampling thread
+itself. The result is in the collapsed-stack format understood by
+flamegraph.pl, speedscope and inferno:
+
+    <module>;main;list_calculations (app/main.py);dump_calculation_rows (app/queries/calculation.py) 42
+
+Two ways to use it, both restricted to ADMIN_USERNAMES:
+
+- POST /admin/profile?seconds=N samples all busy threads of the worker
+  that receives the request, for N seconds of real traffic
+- ?profile=1 on any request: ProfilerMiddleware samples only the threads
+  while they work on that request, and returns the collapsed stacks
+  instead of the response (the original status is in X-Profiled-Status)
+
+A thread works on the profiled request when the marker frame of the
+middleware is on its stack (the event loop thread), or when it is running
+code in a copy of the request's context (asyncio handles, and the
+threadpool that runs sync endpoints and dependencies). Threads waiting
+for work are never sampled.
+"""
+
+import os
+import sys
+import sysconfig
+import threading
+import time
+from collections import Counter
+from contextvars import Context, ContextVar
+from types import FrameType
+from typing import Callable, Optional
+from urllib.parse import parse_qs
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Leaf functions of threads that are waiting for work (lock, queue or socket waits)
+IDLE_FUNCTIONS = {
+    ("threading.py", "wait"),
+    ("threading.py", "_wait_for_tstate_lock"),
+    ("queue.py", "get"),
+    ("selectors.py", "select"),
+}
+
+_STDLIB = sysconfig.get_paths()["stdlib"] + os.sep
+
+_current_profiler: ContextVar[Optional["SamplingProfiler"]] = ContextVar("current_profiler", default=None)
+
+
+def frame_label(frame: FrameType) -> str:
+    """Label a frame as "qualified_name (path)", with paths relative to the app, site-packages or stdlib."""
+    code = frame.f_code
+    filename = code.co_filename
+    if "site-packages" + os.sep in filename:
+        filename = filename.split("site-packages" + os.sep, 1)[1]
+    elif filename.startswith(_STDLIB):
+        filename = filename[len(_STDLIB):]
+    elif filename.startswith(os.getcwd() + os.sep):
+        filename = os.path.relpath(filename)
+    return f"{getattr(code, 'co_qualname', code.co_name)} ({filename})"
+
+
+def collapse(frame: FrameType) -> str:
+    """Render a stack as semicolon-separated frame labels, outermost first."""
+    labels = []
+    while frame is not None:
+        labels.append(frame_label(frame))
+        frame = frame.f_back
+    return ";".join(reversed(labels))
+
+
+def is_idle(frame: FrameType) -> bool:
+    """Return True if a thread's innermost frame is waiting for work."""
+    return (os.path.basename(frame.f_code.co_filename), frame.f_code.co_name) in IDLE_FUNCTIONS
+
+
+class SamplingProfiler:
+    """
+    Counts the stacks of the process' threads at a fixed interval.
+
+    Args:
+        interval: Seconds between samples
+        include: Optional filter (thread id, innermost frame) -> bool
+    """
+
+    def __init__(self, interval: float = 0.005, include: Optional[Callable[[int, FrameType], bool]] = None) -> None:
+        self.interval = interval
+        self.include = include
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def sample(self) -> None:
+        """Take one sample of every other busy thread."""
+        own = threading.get_ident()
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own or is_idle(frame):
+                continue
+            if self.include is not None and not self.include(thread_id, frame):
+                continue
+            self.stacks[collapse(frame)] += 1
+        self.samples += 1
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def start(self) -> "SamplingProfiler":
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> "SamplingProfiler":
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        return self
+
+    def collapsed(self) -> str:
+        """Return the counted stacks in the collapsed-stack format, most frequent first."""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+def _frame_context(frame: FrameType) -> Optional[Context]:
+    """
+    Return the contextvars.Context a dispatch frame runs its callback in.
+
+    Threadpool workers call context.run(func) from a frame with a "context"
+    local; asyncio runs each step of a task from Handle._run, whose handle
+    keeps the task's context in _context.
+    """
+    local_vars = frame.f_locals
+    for value in (local_vars.get("context"), getattr(local_vars.get("self"), "_context", None)):
+        if isinstance(value, Context):
+            return value
+    return None
+
+
+def request_filter(profiler: SamplingProfiler, marker: FrameType) -> Callable[[int, FrameType], bool]:
+    """Build an include filter that keeps only the stacks working on one request."""
+    def include(thread_id: int, frame: FrameType) -> bool:
+        while frame is not None:
+            if frame is marker:
+                return True
+            if frame.f_code.co_name in ("run", "_run"):
+                context = _frame_context(frame)
+                if context is not None:
+                    return context.get(_current_profiler) is profiler
+            frame = frame.f_back
+        return False
+    return include
+
+
+# Only one worker-wide profile may run at a time per process
+profile_lock = threading.Lock()
+
+
+class ProfilerMiddleware:
+    """
+    Pure ASGI middleware that profiles a single request when asked with ?profile=1.
+
+    Args:
+        app: The ASGI app to wrap
+        is_admin: Called (in the threadpool) with the request headers; the
+                  request is only profiled when it returns True, otherwise
+                  it is served normally
+        interval: Seconds between samples
+    """
+
+    def __init__(self, app: ASGIApp, is_admin: Callable[[Headers], bool], interval: float = 0.001) -> None:
+        self.app = app
+        self.is_admin = is_admin
+        self.interval = interval
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        query_string = scope.get("query_string", b"") if scope["type"] == "http" else b""
+        if b"profile=" not in query_string or parse_qs(query_string.decode()).get("profile") != ["1"]:
+            await self.app(scope, receive, send)
+            return
+        if not await run_in_threadpool(self.is_admin, Headers(scope=scope)):
+            await self.app(scope, receive, send)
+            return
+
+        profiler = SamplingProfiler(self.interval)
+        profiler.include = request_filter(profiler, sys._getframe())
+        status_code = 500
+
+        async def discard(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+
+        token = _current_profiler.set(profiler)
+        start = time.perf_counter()
+        profiler.start()
+        try:
+            await self.app(scope, receive, discard)
+        finally:
+            profiler.stop()
+            _current_profiler.reset(token)
+
+        body = profiler.collapsed().encode()
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [
+                (b"content-type", b"text/plain; charset=utf-8"),
+                (b"content-length", str(len(body)).encode()),
+                (b"x-profiled-status", str(status_code).encode()),
+                (b"x-profile-samples", str(profiler.samples).encode()),
+                (b"x-profile-seconds", f"{time.perf_counter() - start:.3f}".encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
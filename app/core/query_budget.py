@@ -0,0 +1,220 @@
+# app/core/query_budget.py
+"""
+Query Budget Module
+
+Catches query-count regressions (N+1 queries) before they reach production.
+
+Endpoints declare how many SQL statements they may execute per request:
+
+    @app.get("/calculations/{calc_id}")
+    @query_budget(1)
+    def get_calculation(...): ...
+
+QueryBudgetMiddleware counts the statements of every request through a
+before_cursor_execute listener on all engines, and records lazy loads of
+relationships (Calculation.user, User.calculations) through a do_orm_execute
+listener on all sessions. A request violates its budget when it executes
+more statements than declared, or lazy-loads any relationship at all
+(endpoints without a declared budget are only checked for lazy loads).
+
+QUERY_BUDGET_MODE decides what a violation does:
+- "off": the middleware is not installed (production)
+- "log": log an error with the offending statements (staging)
+- "raise": also replace the response with a 500 (the test suite sets this,
+  see tests/conftest.py, so every integration test enforces the budgets)
+
+While enabled, responses carry an X-Query-Count header. Code that runs
+outside a request (jobs, direct calls in tests) can be checked with
+count_queries(). Statements are counted when they are sent, so work done
+after the response headers (background tasks) is not part of the budget.
+"""
+
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Callable, Iterator, List, Optional, Tuple
+
+import orjson
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import ORMExecuteState, Session
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+MODES = ("off", "log", "raise")
+
+BUDGET_ATTRIBUTE = "__query_budget__"
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised by count_queries() when the enclosed block exceeds its budget."""
+
+
+@dataclass
+class QueryLog:
+    """SQL statements and relationship lazy loads seen in one request or block."""
+    statements: List[str] = field(default_factory=list)
+    lazy_loads: List[str] = field(default_factory=list)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def violations(self, budget: Optional[int]) -> List[str]:
+        """
+        Describe how this log breaks a budget.
+
+        Args:
+            budget: Maximum number of statements (None = unlimited)
+
+        Returns:
+            list: One message per problem (empty when within budget)
+        """
+        problems = []
+        if budget is not None and self.count > budget:
+            problems.append(f"{self.count} SQL statements executed, budget is {budget}")
+        for relationship in self.lazy_loads:
+            problems.append(f"lazy load of {relationship}")
+        return problems
+
+    def report(self, name: str, problems: List[str]) -> str:
+        """Render violations and the executed statements for a log message."""
+        lines = [f"Query budget exceeded in {name}: {'; '.join(problems)}"]
+        lines.extend(f"  [{i}] {' '.join(statement.split())}" for i, statement in enumerate(self.statements, 1))
+        return "\n".join(lines)
+
+
+# Logs of the enclosing requests/blocks; a statement is counted in all of them
+_active_logs: ContextVar[Tuple[QueryLog, ...]] = ContextVar("query_logs", default=())
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    for log in _active_logs.get():
+        log.statements.append(statement)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _do_orm_execute(orm_execute_state: ORMExecuteState) -> None:
+    # Eager loaders (selectinload, ...) are relationship loads too, but are
+    # not lazy_loaded_from an instance
+    if orm_execute_state.is_relationship_load and orm_execute_state.lazy_loaded_from is not None:
+        logs = _active_logs.get()
+        if logs:
+            relationship = str(orm_execute_state.loader_strategy_path[-1])  # e.g. "Calculation.user"
+            for log in logs:
+                log.lazy_loads.append(relationship)
+
+
+def query_budget(max_queries: int) -> Callable:
+    """
+    Declare the maximum number of SQL statements an endpoint may execute.
+
+    Apply below the route decorator, so FastAPI registers the marked function.
+    """
+    def decorator(endpoint: Callable) -> Callable:
+        setattr(endpoint, BUDGET_ATTRIBUTE, max_queries)
+        return endpoint
+    return decorator
+
+
+def endpoint_budget(scope: Scope) -> Tuple[str, Optional[int]]:
+    """Return the name and declared budget of the endpoint that handled a request."""
+    route = scope.get("route")
+    endpoint = getattr(route, "endpoint", None)
+    if endpoint is None:
+        return scope.get("path", "<unmatched>"), None
+    return endpoint.__name__, getattr(endpoint, BUDGET_ATTRIBUTE, None)
+
+
+@contextmanager
+def count_queries(budget: Optional[int] = None, name: str = "block") -> Iterator[QueryLog]:
+    """
+    Count the SQL statements executed in the enclosed block.
+
+    Args:
+        budget: Raise QueryBudgetExceeded on exit if more statements were executed
+        name: Shown in the error message
+
+    Yields:
+        QueryLog: Filled in while the block runs
+
+    Lazy loads always raise. Only statements executed in this thread (or in
+    code that inherits its context) are counted.
+    """
+    log = QueryLog()
+    token = _active_logs.set((*_active_logs.get(), log))
+    try:
+        yield log
+    finally:
+        _active_logs.reset(token)
+    problems = log.violations(budget)
+    if problems:
+        raise QueryBudgetExceeded(log.report(name, problems))
+
+
+class QueryBudgetMiddleware:
+    """
+    Pure ASGI middleware that checks every request against its endpoint's budget.
+
+    The check runs when the response headers are sent, i.e. after the
+    endpoint returned, and can still replace the response.
+
+    Args:
+        app: The ASGI app to wrap
+        mode: "log" or "raise" (see the module docstring)
+    """
+
+    def __init__(self, app: ASGIApp, mode: str = "log") -> None:
+        if mode not in MODES:
+            raise ValueError(f"Unknown query budget mode: {mode}")
+        self.app = app
+        self.mode = mode
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        log = QueryLog()
+        token = _active_logs.set((*_active_logs.get(), log))
+        replaced = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal replaced
+            if replaced:
+                return  # Drop the body of the replaced response
+            if message["type"] == "http.response.start":
+                name, budget = endpoint_budget(scope)
+                problems = log.violations(budget)
+                if problems:
+                    logger.error(log.report(f"{scope['method']} {name}", problems))
+                    if self.mode == "raise":
+                        replaced = True
+                        await self._send_error(send, name, problems, log.count)
+                        return
+                headers = MutableHeaders(scope=message)
+                headers.append("X-Query-Count", str(log.count))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _active_logs.reset(token)
+
+    @staticmethod
+    async def _send_error(send: Send, name: str, problems: List[str], count: int) -> None:
+        body = orjson.dumps({"detail": f"Query budget exceeded in {name}: {'; '.join(problems)}"})
+        await send({
+            "type": "http.response.start",
+            "status": 500,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"x-query-count", str(count).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,54 @@
+# app/core/responses.py
+"""
+Fast JSON Responses Module
+
+FastAPI's default JSONResponse encodes every payload with the standard
+library json module. This module provides an orjson-based replacement that:
+- Natively serializes UUID, datetime, date, Enum and dataclass values
+- Produces the same compact, UTF-8 output as JSONResponse
+  (separators=(",", ":"), ensure_ascii=False)
+- Is used as the app-wide default_response_class in app/main.py
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+from app.core.server_timing import timed
+
+# OPT_NON_STR_KEYS lets dicts keyed by UUID/int serialize like jsonable_encoder
+JSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def dumps_json(content: Any) -> bytes:
+    """
+    Serialize content to compact JSON bytes with orjson.
+
+    Args:
+        content: Any JSON-compatible value, including UUID and datetime
+
+    Returns:
+        bytes: UTF-8 encoded JSON
+    """
+    with timed("serialize"):
+        return orjson.dumps(content, option=JSON_OPTIONS)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse that renders its content with orjson.
+
+    Renders the same JSON as JSONResponse for the payloads this API produces
+    (see tests/unit/test_responses.py for the golden tests). Only the text
+    of some floats differs, never the value they parse to:
+    - |x| >= 1e16: no "+" in the exponent (1e20, not 1e+20)
+    - 1e-5 <= |x| < 1e-4: positional notation (0.000025, not 2.5e-05)
+    - |x| < 1e-5: one-digit exponents are not zero-padded (1e-7, not 1e-07)
+    Everything else, including key order and separators, is byte-identical.
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        """Render content to JSON bytes."""
+        return dumps_json(content)
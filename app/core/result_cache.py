@@ -0,0 +1,311 @@
+# app/core/result_cache.py
+"""
+Content-Addressed Result Cache Module
+
+Results only depend on the calculation type, the engine version of its
+get_result() and the (resolved) numeric inputs, so identical calculations
+from different users can share one stored result. Entries are keyed by
+
+    sha256(canonical JSON of [type, engine_version, [float inputs...]])
+
+Inputs are normalized to floats (4 and 4.0 share an entry), their order is
+kept (it matters for subtraction and division), and the engine version is
+part of the key, so bumping ENGINE_VERSION never serves an old result.
+
+ResultCache consults one or more stores in order (RESULT_CACHE_BACKENDS):
+- "memory": a per-process LRU
+- "redis": shared by all workers; eviction is left to Redis
+  (maxmemory-policy allkeys-lru, see docker-compose.yml), plus a TTL
+- "postgres": the calculation_result_cache table, which survives restarts
+A hit in a later store is copied into the earlier ones.
+
+The cache is strictly an optimization: a store that raises is skipped for
+RESULT_CACHE_RETRY_SECONDS and the calculation is evaluated as if the
+cache were not there. Errors (e.g. division by zero) are never cached.
+
+Hit ratio and bytes saved are reported to admins at GET /health/result-cache.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Sequence
+
+import redis
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.database import engine
+from app.models.calculation import ENGINE_VERSIONS
+from app.models.calculation_result import CachedResult
+
+logger = logging.getLogger(__name__)
+
+RESULT_BYTES = 8  # A result is one float64
+
+
+def canonical_payload(calculation_type: str, inputs: Sequence[float]) -> bytes:
+    """
+    Encode a calculation in its canonical form.
+
+    Args:
+        calculation_type: Calculation type, e.g. "division"
+        inputs: Resolved numeric inputs
+
+    Returns:
+        bytes: Compact JSON of [type, engine_version, [float inputs...]]
+    """
+    calculation_type = calculation_type.lower()
+    data = [calculation_type, ENGINE_VERSIONS.get(calculation_type, 0), [float(x) for x in inputs]]
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+def cache_key(calculation_type: str, inputs: Sequence[float]) -> str:
+    """Return the content address (hex sha256) of a calculation."""
+    return hashlib.sha256(canonical_payload(calculation_type, inputs)).hexdigest()
+
+
+class MemoryResultStore:
+    """
+    Per-process LRU of results.
+
+    Args:
+        max_entries: Least recently used entries are evicted beyond this size
+    """
+
+    name = "memory"
+
+    def __init__(self, max_entries: int = 100_000) -> None:
+        self.max_entries = max_entries
+        self.entries: "OrderedDict[str, float]" = OrderedDict()
+        # Sync routes run in a threadpool, so guard the LRU bookkeeping
+        self.lock = threading.Lock()
+
+    def get_many(self, keys: List[str]) -> List[Optional[float]]:
+        with self.lock:
+            results = []
+            for key in keys:
+                result = self.entries.get(key)
+                if result is not None:
+                    self.entries.move_to_end(key)
+                results.append(result)
+            return results
+
+    def set_many(self, items: Dict[str, float]) -> None:
+        with self.lock:
+            for key, result in items.items():
+                self.entries[key] = result
+                self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+
+class RedisResultStore:
+    """
+    Results shared by all workers through Redis.
+
+    Args:
+        client: A synchronous Redis client (short socket timeouts recommended)
+        ttl_seconds: Expiry of each entry; memory pressure is handled by LRU eviction
+    """
+
+    name = "redis"
+    prefix = "calc-result:"
+
+    def __init__(self, client: "redis.Redis", ttl_seconds: int = 7 * 86400) -> None:
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+
+    def get_many(self, keys: List[str]) -> List[Optional[float]]:
+        values = self.client.mget([self.prefix + key for key in keys])
+        return [None if value is None else float(value) for value in values]
+
+    def set_many(self, items: Dict[str, float]) -> None:
+        pipeline = self.client.pipeline(transaction=False)
+        for key, result in items.items():
+            pipeline.set(self.prefix + key, repr(float(result)), ex=self.ttl_seconds)
+        pipeline.execute()
+
+
+class PostgresResultStore:
+    """
+    Results stored in the calculation_result_cache table.
+
+    Uses its own short transactions, so a failure never affects the
+    transaction of the request that consulted the cache.
+
+    Args:
+        engine: Engine of the primary database
+    """
+
+    name = "postgres"
+    table = CachedResult.__table__
+
+    def __init__(self, engine: Engine) -> None:
+        self.engine = engine
+
+    def get_many(self, keys: List[str]) -> List[Optional[float]]:
+        c = self.table.c
+        with self.engine.connect() as connection:
+            found = dict(connection.execute(select(c.key, c.result).where(c.key.in_(keys))).all())
+        return [found.get(key) for key in keys]
+
+    def set_many(self, items: Dict[str, float]) -> None:
+        rows = [{"key": key, "result": result} for key, result in items.items()]
+        with self.engine.begin() as connection:
+            connection.execute(pg_insert(self.table).on_conflict_do_nothing(index_elements=["key"]), rows)
+
+
+class ResultCache:
+    """
+    Tiered content-addressed result cache with hit/miss accounting.
+
+    Args:
+        stores: Stores consulted in order (fastest first)
+        retry_after_seconds: How long a store that raised is skipped
+    """
+
+    def __init__(self, stores: List, retry_after_seconds: float = 5.0) -> None:
+        self.stores = stores
+        self.retry_after_seconds = retry_after_seconds
+        self.disabled_until: Dict[str, float] = {}
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.bytes_saved = 0
+
+    def _available(self, store) -> bool:
+        return time.monotonic() >= self.disabled_until.get(store.name, 0.0)
+
+    def _failed(self, store, operation: str, error: Exception) -> None:
+        logger.warning(f"Result cache {store.name} {operation} failed: {error}")
+        with self.lock:
+            self.errors += 1
+        self.disabled_until[store.name] = time.monotonic() + self.retry_after_seconds
+
+    def _get(self, keys: List[str]) -> List[Optional[float]]:
+        """Look keys up tier by tier, copying hits back into the faster tiers."""
+        found: List[Optional[float]] = [None] * len(keys)
+        missing = list(range(len(keys)))
+        consulted = []
+        for store in self.stores:
+            if not missing:
+                break
+            if not self._available(store):
+                continue
+            try:
+                values = store.get_many([keys[i] for i in missing])
+            except Exception as e:
+                self._failed(store, "lookup", e)
+                continue
+            hits = {i: value for i, value in zip(missing, values) if value is not None}
+            if hits:
+                self._set({keys[i]: value for i, value in hits.items()}, consulted)
+                for i, value in hits.items():
+                    found[i] = value
+                missing = [i for i in missing if i not in hits]
+            consulted.append(store)
+        return found
+
+    def _set(self, items: Dict[str, float], stores: Optional[List] = None) -> None:
+        for store in self.stores if stores is None else stores:
+            if not self._available(store):
+                continue
+            try:
+                store.set_many(items)
+            except Exception as e:
+                self._failed(store, "store", e)
+
+    def _count(self, payloads: List[bytes], cached: List[Optional[float]]) -> None:
+        with self.lock:
+            for payload, result in zip(payloads, cached):
+                if result is None:
+                    self.misses += 1
+                else:
+                    self.hits += 1
+                    self.bytes_saved += len(payload) + RESULT_BYTES
+
+    def lookup_many(self, calculation_type: str, inputs_batch: List[Sequence[float]]) -> List[Optional[float]]:
+        """
+        Look up many calculations of one type at once (one round trip per tier).
+
+        Returns:
+            list: The cached result, or None, per input list
+        """
+        if not inputs_batch:
+            return []
+        payloads = [canonical_payload(calculation_type, inputs) for inputs in inputs_batch]
+        cached = self._get([hashlib.sha256(payload).hexdigest() for payload in payloads])
+        self._count(payloads, cached)
+        return cached
+
+    def store_many(self, calculation_type: str, items: List[tuple]) -> None:
+        """Store (inputs, result) pairs of one type in every tier."""
+        if items:
+            self._set({cache_key(calculation_type, inputs): float(result) for inputs, result in items})
+
+    def get_or_compute(self, calculation_type: str, inputs: Sequence[float], compute: Callable[[], float]) -> float:
+        """
+        Return the cached result for a calculation, or compute and cache it.
+
+        Args:
+            calculation_type: Calculation type
+            inputs: Resolved numeric inputs
+            compute: Evaluates the calculation on a miss (its errors propagate)
+        """
+        cached = self.lookup_many(calculation_type, [inputs])[0]
+        if cached is not None:
+            return cached
+        result = compute()
+        self.store_many(calculation_type, [(inputs, result)])
+        return result
+
+    def stats(self) -> Dict[str, object]:
+        """Return hit/miss counters, the hit ratio and the bytes saved by hits."""
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": True,
+                "stores": [store.name for store in self.stores],
+                "hits": self.hits,
+                "misses": self.misses,
+                "errors": self.errors,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "bytes_saved": self.bytes_saved,
+            }
+
+
+def build_result_cache() -> Optional[ResultCache]:
+    """Create the cache configured by RESULT_CACHE_BACKENDS (None when empty)."""
+    stores = []
+    for backend in settings.RESULT_CACHE_BACKENDS:
+        if backend == "memory":
+            stores.append(MemoryResultStore(settings.RESULT_CACHE_MAX_ENTRIES))
+        elif backend == "redis":
+            client = redis.Redis.from_url(
+                settings.RESULT_CACHE_REDIS_URL or settings.REDIS_URL or "redis://localhost:6379",
+                socket_timeout=settings.RESULT_CACHE_TIMEOUT_SECONDS,
+                socket_connect_timeout=settings.RESULT_CACHE_TIMEOUT_SECONDS,
+            )
+            stores.append(RedisResultStore(client, settings.RESULT_CACHE_TTL_SECONDS))
+        elif backend == "postgres":
+            stores.append(PostgresResultStore(engine))
+        else:
+            raise ValueError(f"Unknown result cache backend: {backend}")
+    if not stores:
+        return None
+    return ResultCache(stores, retry_after_seconds=settings.RESULT_CACHE_RETRY_SECONDS)
+
+
+result_cache: Optional[ResultCache] = build_result_cache()
+
+
+def get_result_cache() -> Optional[ResultCache]:
+    """Return the process-wide result cache, or None if caching is disabled."""
+    return result_cache
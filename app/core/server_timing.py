@@ -0,0 +1,106 @@
+# app/core/server_timing.py
+"""
+Server-Timing Module
+
+Adds a Server-Timing header to every response that splits the time spent
+on the server into phases:
+
+    Server-Timing: auth;dur=0.41, blacklist;dur=0.00, db;dur=3.20,
+                   eval;dur=0.02, serialize;dur=0.35, total;dur=5.10
+
+- auth: JWT decoding/verification (app/auth/dependencies.py, app/auth/jwt.py)
+- blacklist: Redis token blacklist checks (app/auth/redis.py)
+- db: SQL statements, timed by cursor execute events on every engine
+- eval: get_result() evaluation (app/operations/calculation_graph.py)
+- serialize: JSON encoding of the response body (app/core/responses.py)
+- total: until the response headers were sent
+
+Durations are milliseconds, as the header specification requires. Browser
+devtools show them in the Timing tab, and load balancers can log the header.
+
+The code paths record into a per-request dict found through a context
+variable. Sync endpoints run in a threadpool with a copy of the request's
+context, which still refers to the same dict. Outside a request, timed()
+does nothing but measure.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Phases always present in the header, in this order
+PHASES = ("auth", "blacklist", "db", "eval", "serialize")
+
+_timings: ContextVar[Optional[Dict[str, float]]] = ContextVar("server_timings", default=None)
+
+
+def record(phase: str, seconds: float) -> None:
+    """Add time to a phase of the current request (no-op outside a request)."""
+    timings = _timings.get()
+    if timings is not None:
+        timings[phase] = timings.get(phase, 0.0) + seconds
+
+
+@contextmanager
+def timed(phase: str) -> Iterator[None]:
+    """Time the enclosed block as part of a phase of the current request."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(phase, time.perf_counter() - start)
+
+
+# One start value per connection (see app/core/metrics.py): a failed
+# statement's start is overwritten by the next one, not accumulated
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info["server_timing_start"] = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = conn.info.pop("server_timing_start", None)
+    if start is not None:
+        record("db", time.perf_counter() - start)
+
+
+def format_header(timings: Dict[str, float], total_seconds: float) -> str:
+    """Render phase timings (seconds) as a Server-Timing header value (milliseconds)."""
+    phases = [*PHASES, *(phase for phase in timings if phase not in PHASES)]
+    parts = [f"{phase};dur={timings.get(phase, 0.0) * 1000:.2f}" for phase in phases]
+    parts.append(f"total;dur={total_seconds * 1000:.2f}")
+    return ", ".join(parts)
+
+
+class ServerTimingMiddleware:
+    """Pure ASGI middleware that collects phase timings and adds the Server-Timing header."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings: Dict[str, float] = {}
+        token = _timings.set(timings)
+        start = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", format_header(timings, time.perf_counter() - start))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _timings.reset(token)
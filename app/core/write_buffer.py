@@ -0,0 +1,174 @@
+# app/core/write_buffer.py
+"""
+Group-Commit Write Buffer Module
+
+Every create_calculation normally runs its own INSERT and COMMIT, so every
+request pays for its own WAL flush (fsync). Under heavy create traffic the
+database spends most of its time waiting on those flushes.
+
+GroupCommitBuffer is an optional per-worker write-behind queue:
+- Request threads submit() a row and block on the returned Future
+- A single background thread collects rows for up to max_delay_ms, or
+  until max_rows are waiting
+- The batch is written with one multi-row INSERT ... RETURNING in one
+  transaction (one WAL flush), and each Future is resolved with its row
+
+This trades a few milliseconds of latency for much higher insert
+throughput. A caller that gives up waiting can cancel() its Future: rows
+whose Future was cancelled before their batch is written are not inserted.
+Once a batch is being inserted its rows can no longer be withdrawn. If a batch fails with an integrity error (e.g. a user was
+deleted while their row waited), the rows are retried one by one so only
+the offending request fails.
+
+Enabled with WRITE_BUFFER_ENABLED; see app/main.py.
+"""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, List, Optional, Tuple
+
+from sqlalchemy import Table, insert
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()  # Queue sentinel that tells the flusher thread to exit
+
+
+class GroupCommitBuffer:
+    """
+    Batches single-row inserts into multi-row group commits.
+
+    Args:
+        session_factory: Callable returning a new Session (e.g. SessionLocal)
+        table: Table the rows are inserted into
+        max_rows: Flush as soon as this many rows are waiting
+        max_delay_ms: Flush at most this long after the first row arrived
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        table: Table,
+        max_rows: int = 100,
+        max_delay_ms: float = 5.0,
+    ) -> None:
+        self.session_factory = session_factory
+        self.table = table
+        self.max_rows = max_rows
+        self.max_delay = max_delay_ms / 1000
+        self.queue: "queue.Queue" = queue.Queue()
+        self.thread: Optional[threading.Thread] = None
+        self.lock = threading.Lock()
+        self.batches = 0
+        self.rows = 0
+
+    def start(self) -> None:
+        """Start the flusher thread (called lazily by submit())."""
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self._run, name="group-commit", daemon=True)
+                self.thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Flush everything still queued and stop the flusher thread."""
+        with self.lock:
+            thread, self.thread = self.thread, None
+        if thread is not None:
+            self.queue.put(_STOP)
+            thread.join(timeout)
+
+    def submit(self, row: dict) -> Future:
+        """
+        Queue a row for insertion.
+
+        Returns:
+            Future: Resolves to the inserted Row (all columns, via RETURNING),
+            or raises the database error for this row
+        """
+        future: Future = Future()
+        self.start()
+        self.queue.put((row, future))
+        return future
+
+    def _collect(self, first) -> Tuple[List[tuple], bool]:
+        """Gather a batch that starts with `first`; returns (batch, stop_requested)."""
+        batch = [first]
+        deadline = time.monotonic() + self.max_delay
+        while len(batch) < self.max_rows:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self.queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _run(self) -> None:
+        while True:
+            first = self.queue.get()
+            if first is _STOP:
+                return
+            batch, stop = self._collect(first)
+            self.flush(batch)
+            if stop:
+                return
+
+    def _insert(self, rows: List[dict]) -> List[Row]:
+        statement = insert(self.table).returning(*self.table.c, sort_by_parameter_order=True)
+        db = self.session_factory()
+        try:
+            result = db.execute(statement, rows).all()
+            db.commit()
+            return result
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def flush(self, batch: List[tuple]) -> None:
+        """Insert a batch in one transaction and resolve its futures."""
+        # Drops the rows of callers that gave up; the rest can no longer be cancelled
+        batch = [(row, future) for row, future in batch if future.set_running_or_notify_cancel()]
+        if not batch:
+            return
+        rows = [row for row, _ in batch]
+        futures = [future for _, future in batch]
+        try:
+            inserted = self._insert(rows)
+        except IntegrityError as e:
+            if len(batch) == 1:
+                futures[0].set_exception(e)
+            else:
+                self._flush_individually(batch)
+            return
+        except Exception as e:
+            logger.error(f"Group commit of {len(batch)} rows failed: {e}")
+            for future in futures:
+                future.set_exception(e)
+            return
+
+        self.batches += 1
+        self.rows += len(inserted)
+        for future, row in zip(futures, inserted):
+            future.set_result(row)
+
+    def _flush_individually(self, batch: List[tuple]) -> None:
+        """Retry rows one at a time so only the failing rows' requests fail."""
+        for row, future in batch:
+            try:
+                future.set_result(self._insert([row])[0])
+                self.batches += 1
+                self.rows += 1
+            except Exception as e:
+                future.set_exception(e)
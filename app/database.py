@@ -1,14 +1,641 @@
 # app/database.py
-from sqlalchemy import create_engine
+"""
+Database Engine and Session Module
+
+Creates the SQLAlchemy engine and session factory used by the application.
+
+Connection pooling is configured from Settings (POOL_SIZE, MAX_OVERFLOW,
+POOL_TIMEOUT, POOL_RECYCLE, POOL_PRE_PING, POOL_USE_LIFO). Each uvicorn
+worker process has its own pool, so the worst case number of connections is
+workers * (POOL_SIZE + MAX_OVERFLOW); keep that below Postgres'
+max_connections.
+
+Pool activity (checkout wait time, checked-out and overflow counts) is
+recorded by engine event listeners into a PoolMetrics object; see
+get_pool_metrics().
+
+Read replicas (optional): when DATABASE_REPLICA_URLS is set, sessions
+created for read-only endpoints (see get_read_db in app/auth/dependencies.py)
+send their SELECTs to a replica chosen by ReplicaRouter:
+- round_robin or least_connections order (REPLICA_ROUTING)
+- replicas lagging more than REPLICA_MAX_LAG_SECONDS are skipped, and the
+  primary is used when no replica is healthy
+- a user who wrote within READ_YOUR_WRITES_SECONDS reads from the primary,
+  so they always see their own changes. The last-write markers are kept in
+  Redis (READ_YOUR_WRITES_REDIS_URL, default REDIS_URL) so every worker
+  process sees them; ORM flushes are tracked automatically, Core writes
+  call mark_written()
+
+Slow-query log (opt-in, SLOW_QUERY_LOG_ENABLED): statements slower than
+SLOW_QUERY_THRESHOLD_MS are logged with their parameters redacted. The
+first slow statement of each shape (the SQL with literals and IN-list
+lengths normalized) is run through EXPLAIN (ANALYZE off, FORMAT JSON) by a
+background thread, on its own one-connection engine with a statement_timeout
+of SLOW_QUERY_EXPLAIN_TIMEOUT_MS, so the request that ran the slow
+statement never waits for it or for the application's pool. The recent
+slow statements and the captured plans are kept in a SlowQueryLog ring
+buffer, shown to admins at GET /admin/slow-queries.
+"""
+
+import hashlib
+import itertools
+import logging
+import queue
+import re
+import threading
+import time
+import weakref
+from collections import OrderedDict, deque
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+import redis
+from sqlalchemy import SelectBase, create_engine, event, text
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
 from app.core.config import settings
 
 SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
 
-# Create the default engine and sessionmaker
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+logger = logging.getLogger(__name__)
+
+
+# ------------------------------------------------------------------------------
+# Pool instrumentation
+# ------------------------------------------------------------------------------
+# How long the current thread's last checkout waited in the pool queue.
+# Written by TimedQueuePool._do_get, read by the "checkout" event listener.
+_checkout_wait = threading.local()
+
+# PoolMetrics per instrumented engine
+_pool_metrics: "weakref.WeakKeyDictionary[Engine, PoolMetrics]" = weakref.WeakKeyDictionary()
+
+
+class TimedQueuePool(QueuePool):
+    """
+    QueuePool that measures how long each checkout waits for a connection.
+
+    SQLAlchemy has no "before checkout" pool event, so the wait is timed
+    around _do_get() and handed to the checkout listener through a
+    thread-local. Event listeners survive pool.recreate() (engine.dispose()),
+    unlike attributes set on the pool instance.
+    """
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            _checkout_wait.seconds = time.perf_counter() - start
+
+
+class PoolMetrics:
+    """
+    Counters and gauges for one engine's connection pool.
+
+    Updated by the pool event listeners registered in instrument_pool().
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.checkouts = 0
+        self.checkout_wait_seconds_total = 0.0
+        self.checkout_wait_seconds_max = 0.0
+        self.checked_out = 0
+        self.checked_out_max = 0
+        self.overflow = 0
+        self.overflow_max = 0
+        self.connections_created = 0
+        self.invalidations = 0
+
+    def record_checkout(self, pool, wait_seconds: float) -> None:
+        with self.lock:
+            self.checkouts += 1
+            self.checkout_wait_seconds_total += wait_seconds
+            self.checkout_wait_seconds_max = max(self.checkout_wait_seconds_max, wait_seconds)
+            self._sample(pool)
+
+    def record_checkin(self, pool) -> None:
+        with self.lock:
+            self._sample(pool)
+
+    def _sample(self, pool) -> None:
+        """Refresh the checked-out/overflow gauges from the pool."""
+        if not isinstance(pool, QueuePool):
+            return
+        self.checked_out = pool.checkedout()
+        self.overflow = max(pool.overflow(), 0)
+        self.checked_out_max = max(self.checked_out_max, self.checked_out)
+        self.overflow_max = max(self.overflow_max, self.overflow)
+
+    def snapshot(self, pool=None) -> Dict[str, float]:
+        """Return a point-in-time copy of all metrics, re-sampling the pool if given."""
+        with self.lock:
+            if pool is not None:
+                self._sample(pool)
+            return {
+                "checkouts": self.checkouts,
+                "checkout_wait_seconds_total": round(self.checkout_wait_seconds_total, 6),
+                "checkout_wait_seconds_max": round(self.checkout_wait_seconds_max, 6),
+                "checked_out": self.checked_out,
+                "checked_out_max": self.checked_out_max,
+                "overflow": self.overflow,
+                "overflow_max": self.overflow_max,
+                "connections_created": self.connections_created,
+                "invalidations": self.invalidations,
+            }
+
+
+def instrument_pool(engine: Engine) -> PoolMetrics:
+    """
+    Register pool event listeners on an engine and return its PoolMetrics.
+    """
+    metrics = PoolMetrics()
+
+    @event.listens_for(engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        with metrics.lock:
+            metrics.connections_created += 1
+
+    @event.listens_for(engine, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        wait = getattr(_checkout_wait, "seconds", 0.0)
+        _checkout_wait.seconds = 0.0
+        metrics.record_checkout(engine.pool, wait)
+
+    @event.listens_for(engine, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        metrics.record_checkin(engine.pool)
+
+    @event.listens_for(engine, "invalidate")
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        with metrics.lock:
+            metrics.invalidations += 1
+
+    _pool_metrics[engine] = metrics
+    return metrics
+
+
+def pool_options() -> dict:
+    """Keyword arguments for create_engine() built from Settings."""
+    return {
+        "poolclass": TimedQueuePool,
+        "pool_size": settings.POOL_SIZE,
+        "max_overflow": settings.MAX_OVERFLOW,
+        "pool_timeout": settings.POOL_TIMEOUT,
+        "pool_recycle": settings.POOL_RECYCLE,
+        "pool_pre_ping": settings.POOL_PRE_PING,
+        "pool_use_lifo": settings.POOL_USE_LIFO,
+    }
+
+
+# ------------------------------------------------------------------------------
+# Read-replica routing
+# ------------------------------------------------------------------------------
+# Replay lag in seconds; 0 on a primary, and 0 on a replica that has replayed
+# everything it received (pg_last_xact_replay_timestamp alone would report
+# growing "lag" on an idle primary).
+REPLICA_LAG_SQL = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+""")
+
+
+class ReplicaRouter:
+    """
+    Chooses the engine a read-only session should use.
+
+    Args:
+        primary: The primary (read-write) engine
+        replicas: Replica engines; an empty list routes everything to the primary
+        strategy: "round_robin" or "least_connections"
+        max_lag_seconds: Replicas lagging more than this are skipped
+        lag_check_interval: Seconds to cache a replica's measured lag
+        read_your_writes_seconds: How long a user's reads stick to the primary
+            after they wrote
+        write_markers: Synchronous Redis client shared by all worker processes,
+            holding one expiring key per user who wrote recently (None keeps
+            the markers in this process only)
+    """
+
+    marker_prefix = "ryw:"
+
+    def __init__(
+        self,
+        primary: Engine,
+        replicas: List[Engine],
+        strategy: str = "round_robin",
+        max_lag_seconds: float = 5.0,
+        lag_check_interval: float = 2.0,
+        read_your_writes_seconds: float = 5.0,
+        write_markers: Optional["redis.Redis"] = None,
+    ) -> None:
+        if strategy not in ("round_robin", "least_connections"):
+            raise ValueError(f"Unsupported replica routing strategy: {strategy}")
+        self.primary = primary
+        self.replicas = list(replicas)
+        self.strategy = strategy
+        self.max_lag_seconds = max_lag_seconds
+        self.lag_check_interval = lag_check_interval
+        self.read_your_writes_seconds = read_your_writes_seconds
+        self.write_markers = write_markers
+        self.lock = threading.Lock()
+        self._counter = itertools.count()
+        self._lag_cache: Dict[int, tuple] = {}  # id(engine) -> (checked_at, lag)
+        self._recent_writes: Dict[UUID, float] = {}  # user_id -> monotonic time of last write
+
+    # --- Read-your-writes stickiness ---
+    def record_write(self, user_id: UUID) -> None:
+        """Remember that a user just wrote, so their next reads go to the primary."""
+        now = time.monotonic()
+        with self.lock:
+            self._recent_writes[user_id] = now
+            if len(self._recent_writes) > 10_000:  # keep the map bounded
+                cutoff = now - self.read_your_writes_seconds
+                self._recent_writes = {u: t for u, t in self._recent_writes.items() if t >= cutoff}
+        if self.write_markers is not None and self.read_your_writes_seconds > 0:
+            try:
+                self.write_markers.set(
+                    f"{self.marker_prefix}{user_id}", "1", px=max(1, int(self.read_your_writes_seconds * 1000))
+                )
+            except redis.RedisError as e:
+                logger.warning(f"Recording the write marker of user {user_id} failed: {e}")
+
+    def wrote_recently(self, user_id: Optional[UUID]) -> bool:
+        """
+        Check whether a user wrote within read_your_writes_seconds, in any process.
+
+        When the shared markers cannot be read, the user is assumed to have
+        written: reading from the primary is always correct.
+        """
+        if user_id is None:
+            return False
+        with self.lock:
+            written_at = self._recent_writes.get(user_id)
+        if written_at is not None and time.monotonic() - written_at < self.read_your_writes_seconds:
+            return True
+        if self.write_markers is None:
+            return False
+        try:
+            return self.write_markers.exists(f"{self.marker_prefix}{user_id}") == 1
+        except redis.RedisError as e:
+            logger.warning(f"Reading the write marker of user {user_id} failed: {e}")
+            return True
+
+    # --- Replica health ---
+    def measure_lag(self, replica: Engine) -> float:
+        """Query a replica's replay lag; unreachable replicas count as infinitely behind."""
+        try:
+            with replica.connect() as conn:
+                return float(conn.execute(REPLICA_LAG_SQL).scalar() or 0.0)
+        except Exception as e:
+            logger.warning(f"Replica lag check failed for {replica.url!r}: {e}")
+            return float("inf")
+
+    def replica_lag(self, replica: Engine) -> float:
+        """Return a replica's lag, re-measuring at most every lag_check_interval seconds."""
+        now = time.monotonic()
+        cached = self._lag_cache.get(id(replica))
+        if cached is not None and now - cached[0] < self.lag_check_interval:
+            return cached[1]
+        lag = self.measure_lag(replica)
+        self._lag_cache[id(replica)] = (now, lag)
+        return lag
+
+    def healthy_replicas(self) -> List[Engine]:
+        return [r for r in self.replicas if self.replica_lag(r) <= self.max_lag_seconds]
+
+    # --- Routing ---
+    def choose(self, user_id: Optional[UUID] = None) -> Engine:
+        """
+        Pick the engine for a read-only session.
+
+        Returns:
+            Engine: A healthy replica, or the primary if there is none, or if
+            the user wrote recently
+        """
+        if not self.replicas or self.wrote_recently(user_id):
+            return self.primary
+        candidates = self.healthy_replicas()
+        if not candidates:
+            return self.primary
+        if self.strategy == "least_connections":
+            return min(candidates, key=lambda r: r.pool.checkedout())
+        return candidates[next(self._counter) % len(candidates)]
+
+
+class RoutingSession(Session):
+    """
+    Session that sends read-only SELECTs to a replica.
+
+    A session is routed only when a replica engine is stored in
+    session.info["replica"] (see read_session()). Any SELECT counts,
+    including UNION ALL reads over the hot and archive tables
+    (app/queries/calculation.py). Flushes and every non-SELECT statement
+    always use the primary bind.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        replica = self.info.get("replica")
+        if replica is not None and not self._flushing and (clause is None or isinstance(clause, SelectBase)):
+            return replica
+        return super().get_bind(mapper=mapper, clause=clause, **kw)
+
+
+def mark_written(session: Session, user_id: UUID) -> None:
+    """
+    Record a Core (non-ORM) write to a user's rows.
+
+    ORM flushes are picked up by collect_written_users(); bulk UPDATEs and
+    INSERTs bypass the flush, so their callers mark the owners here. The
+    user's reads stick to the primary once the session commits.
+    """
+    session.info.setdefault("written_user_ids", set()).add(user_id)
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def collect_written_users(session, flush_context):
+    """Collect the owners of rows written in this flush (for read-your-writes)."""
+    written = session.info.setdefault("written_user_ids", set())
+    for obj in itertools.chain(session.new, session.dirty, session.deleted):
+        user_id = getattr(obj, "user_id", None)
+        if user_id is not None:
+            written.add(user_id)
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def record_committed_writes(session):
+    """After a commit, make the writing users' next reads stick to the primary."""
+    for user_id in session.info.pop("written_user_ids", ()):
+        replica_router.record_write(user_id)
+
+
+@event.listens_for(RoutingSession, "after_rollback")
+def forget_rolled_back_writes(session):
+    session.info.pop("written_user_ids", None)
+
+
+# ------------------------------------------------------------------------------
+# Slow-query log
+# ------------------------------------------------------------------------------
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w$.])\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%\(\w+\)s|%s|\$\d+")
+_PLACEHOLDER_LIST = re.compile(r"\?(?:\s*,\s*\?)+")
+
+# EXPLAIN only works on these statements (ANALYZE off: nothing is executed)
+_EXPLAINABLE = ("select", "insert", "update", "delete", "with", "values")
+
+_STOP_EXPLAINING = object()  # Queue sentinel that ends the EXPLAIN thread
+
+
+def statement_shape(statement: str) -> str:
+    """
+    Normalize a statement so executions that differ only in values share a shape.
+
+    Literals and bound parameters become "?", and expanded IN lists of any
+    length collapse into a single "?".
+    """
+    shape = _STRING_LITERAL.sub("'?'", statement)
+    shape = _NUMBER_LITERAL.sub("?", shape)
+    shape = _PLACEHOLDER.sub("?", shape)
+    shape = _PLACEHOLDER_LIST.sub("?", shape)
+    return " ".join(shape.split())
+
+
+def redact_parameters(parameters: Any, executemany: bool = False) -> Any:
+    """
+    Replace parameter values with their type names, so logs never contain data.
+
+    For executemany, only the first parameter set is described, with the
+    number of sets.
+    """
+    if executemany and parameters:
+        return {"sets": len(parameters), "first": redact_parameters(parameters[0])}
+    if isinstance(parameters, dict):
+        return {key: redact_parameters(value) for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [redact_parameters(value) for value in parameters]
+    return None if parameters is None else f"<{type(parameters).__name__}>"
+
+
+class SlowQueryLog:
+    """
+    Ring buffer of slow statements and of the EXPLAIN plan of each shape.
+
+    Plans are captured by a background thread; a shape's "plan" is None
+    until its EXPLAIN has finished.
+
+    Args:
+        threshold_seconds: Statements taking at least this long are recorded
+        max_entries: Recent slow statements and plans kept (oldest dropped first)
+        explain: Capture a plan for the first slow statement of each shape
+        explain_timeout_ms: statement_timeout of each EXPLAIN
+    """
+
+    def __init__(
+        self,
+        threshold_seconds: float,
+        max_entries: int = 100,
+        explain: bool = True,
+        explain_timeout_ms: int = 1000,
+    ) -> None:
+        self.threshold_seconds = threshold_seconds
+        self.explain = explain
+        self.explain_timeout_ms = explain_timeout_ms
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+        self.recent: deque = deque(maxlen=max_entries)
+        self.shapes: "OrderedDict[str, dict]" = OrderedDict()
+        self.explain_queue: "queue.Queue" = queue.Queue(maxsize=max_entries)
+        self.explain_thread: Optional[threading.Thread] = None
+        self.explain_engines: Dict[str, Engine] = {}  # URL -> one-connection engine (EXPLAIN thread only)
+
+    def record(self, engine: Engine, statement: str, parameters: Any, executemany: bool, seconds: float) -> None:
+        """Log a slow statement, and EXPLAIN it if its shape is new."""
+        shape = statement_shape(statement)
+        shape_id = hashlib.sha1(shape.encode()).hexdigest()[:12]
+        redacted = redact_parameters(parameters, executemany)
+        duration_ms = round(seconds * 1000, 3)
+        logger.warning(f"Slow query ({duration_ms:.1f} ms, shape {shape_id}): {shape} parameters={redacted}")
+
+        now = datetime.now(timezone.utc).isoformat()
+        with self.lock:
+            self.recent.append({
+                "shape_id": shape_id, "duration_ms": duration_ms, "parameters": redacted, "at": now,
+            })
+            entry = self.shapes.get(shape_id)
+            first = entry is None
+            if first:
+                entry = self.shapes[shape_id] = {
+                    "shape_id": shape_id, "statement": shape, "count": 0, "max_ms": 0.0,
+                    "first_seen": now, "plan": None,
+                }
+                while len(self.shapes) > self.max_entries:
+                    self.shapes.popitem(last=False)
+            entry["count"] += 1
+            entry["max_ms"] = max(entry["max_ms"], duration_ms)
+
+        if first and self.explain and statement.lstrip().lower().startswith(_EXPLAINABLE):
+            self.queue_explain(engine, statement, parameters[0] if executemany else parameters, entry)
+
+    # --- Background EXPLAIN ---
+    def queue_explain(self, engine: Engine, statement: str, parameters: Any, entry: dict) -> None:
+        """Hand a statement to the EXPLAIN thread, which fills in entry["plan"]."""
+        with self.lock:
+            if self.explain_thread is None or not self.explain_thread.is_alive():
+                self.explain_thread = threading.Thread(
+                    target=self._explain_forever, name="slow-query-explain", daemon=True
+                )
+                self.explain_thread.start()
+        try:
+            self.explain_queue.put_nowait((engine, statement, parameters, entry))
+        except queue.Full:
+            with self.lock:
+                entry["plan"] = {"error": "Not explained: too many EXPLAINs pending"}
+
+    def _explain_forever(self) -> None:
+        while True:
+            item = self.explain_queue.get()
+            if item is _STOP_EXPLAINING:
+                return
+            engine, statement, parameters, entry = item
+            plan = self.explain_plan(self.explain_engine(engine), statement, parameters)
+            with self.lock:
+                entry["plan"] = plan
+
+    def explain_engine(self, engine: Engine) -> Engine:
+        """
+        Return the engine EXPLAINs against `engine`'s database run on.
+
+        It has a single connection of its own, so EXPLAINs never wait for
+        (or hold) a connection of the application's pool, and every
+        statement is cut off after explain_timeout_ms.
+        """
+        key = engine.url.render_as_string(hide_password=False)
+        explain_engine = self.explain_engines.get(key)
+        if explain_engine is None:
+            explain_engine = self.explain_engines[key] = create_engine(
+                engine.url,
+                pool_size=1,
+                max_overflow=0,
+                pool_pre_ping=True,
+                connect_args={"options": f"-c statement_timeout={int(self.explain_timeout_ms)}"},
+            )
+        return explain_engine
+
+    @staticmethod
+    def explain_plan(engine: Engine, statement: str, parameters: Any) -> Any:
+        """
+        EXPLAIN a statement on its own connection.
+
+        The statement's own transaction may be holding locks, so it cannot be
+        used. Returns the JSON plan, or {"error": ...} if EXPLAIN failed.
+        """
+        try:
+            with engine.connect() as connection:
+                connection.execution_options(slow_query_log=False)  # Never log the EXPLAIN itself
+                plan = connection.exec_driver_sql(
+                    "EXPLAIN (ANALYZE off, FORMAT JSON) " + statement, parameters or ()
+                ).scalar()
+                connection.rollback()
+                return plan
+        except Exception as e:
+            logger.warning(f"EXPLAIN of slow query failed: {e}")
+            return {"error": str(e)}
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Stop the EXPLAIN thread (after the EXPLAINs already queued) and close its connections."""
+        with self.lock:
+            thread, self.explain_thread = self.explain_thread, None
+        if thread is not None:
+            self.explain_queue.put(_STOP_EXPLAINING)
+            thread.join(timeout)
+        for explain_engine in self.explain_engines.values():
+            explain_engine.dispose()
+        self.explain_engines.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the recent slow statements (newest first) and the plans by shape."""
+        with self.lock:
+            return {
+                "threshold_ms": self.threshold_seconds * 1000,
+                "recent": list(reversed(self.recent)),
+                "shapes": [dict(entry) for entry in reversed(self.shapes.values())],
+            }
+
+    def clear(self) -> None:
+        with self.lock:
+            self.recent.clear()
+            self.shapes.clear()
+
+
+def instrument_slow_queries(engine: Engine, log: "SlowQueryLog") -> None:
+    """Register cursor event listeners that feed an engine's slow statements into a SlowQueryLog."""
+
+    # One start value per connection: a failed statement's is overwritten by the next one
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info["slow_query_start"] = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        start = conn.info.pop("slow_query_start", None)
+        if start is None:
+            return
+        elapsed = time.perf_counter() - start
+        if elapsed >= log.threshold_seconds and conn.get_execution_options().get("slow_query_log", True):
+            log.record(conn.engine, statement, parameters, executemany, elapsed)
+
+
+slow_query_log = SlowQueryLog(
+    settings.SLOW_QUERY_THRESHOLD_MS / 1000,
+    max_entries=settings.SLOW_QUERY_BUFFER_SIZE,
+    explain=settings.SLOW_QUERY_EXPLAIN,
+    explain_timeout_ms=settings.SLOW_QUERY_EXPLAIN_TIMEOUT_MS,
+)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Attach the pool metrics and, when enabled, the slow-query log to an engine."""
+    instrument_pool(engine)
+    if settings.SLOW_QUERY_LOG_ENABLED:
+        instrument_slow_queries(engine, slow_query_log)
+
+
+# ------------------------------------------------------------------------------
+# Default engine and sessionmaker
+# ------------------------------------------------------------------------------
+engine = create_engine(SQLALCHEMY_DATABASE_URL, **pool_options())
+instrument_engine(engine)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, class_=RoutingSession)
+
+replica_engines = []
+for replica_url in settings.DATABASE_REPLICA_URLS:
+    replica_engine = create_engine(replica_url, **pool_options())
+    instrument_engine(replica_engine)
+    replica_engines.append(replica_engine)
+
+replica_router = ReplicaRouter(
+    engine,
+    replica_engines,
+    strategy=settings.REPLICA_ROUTING,
+    max_lag_seconds=settings.REPLICA_MAX_LAG_SECONDS,
+    lag_check_interval=settings.REPLICA_LAG_CHECK_INTERVAL,
+    read_your_writes_seconds=settings.READ_YOUR_WRITES_SECONDS,
+    # Markers only matter when reads can go to a replica
+    write_markers=redis.Redis.from_url(
+        settings.READ_YOUR_WRITES_REDIS_URL or settings.REDIS_URL or "redis://localhost:6379",
+        socket_timeout=0.1,
+        socket_connect_timeout=0.1,
+    ) if replica_engines else None,
+)
 
 Base = declarative_base()
 
@@ -19,11 +646,42 @@ def get_db():
     finally:
         db.close()
 
+def read_session(user_id: Optional[UUID] = None):
+    """
+    Yield a session whose SELECTs go to a replica chosen for this user.
+
+    Falls back to the primary when no replicas are configured or healthy,
+    or when the user wrote within READ_YOUR_WRITES_SECONDS.
+    """
+    db = SessionLocal()
+    chosen = replica_router.choose(user_id)
+    if chosen is not engine:
+        db.info["replica"] = chosen
+    try:
+        yield db
+    finally:
+        db.close()
+
 # --- New Functions Added ---
 def get_engine(database_url: str = SQLALCHEMY_DATABASE_URL):
-    """Factory function to create a new SQLAlchemy engine."""
-    return create_engine(database_url)
+    """Factory function to create a new SQLAlchemy engine with the configured pool."""
+    new_engine = create_engine(database_url, **pool_options())
+    instrument_engine(new_engine)
+    return new_engine
 
 def get_sessionmaker(engine):
     """Factory function to create a new sessionmaker bound to the given engine."""
     return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def get_pool_metrics(target: Optional[Engine] = None) -> Dict[str, float]:
+    """
+    Return the pool metrics snapshot for an engine (the default engine if omitted).
+
+    Includes the static pool configuration next to the live counters.
+    """
+    target = target or engine
+    metrics = _pool_metrics.get(target)
+    snapshot = metrics.snapshot(target.pool) if metrics else {}
+    snapshot["pool_size"] = target.pool.size() if isinstance(target.pool, QueuePool) else 0
+    snapshot["max_overflow"] = settings.MAX_OVERFLOW
+    return snapshot
@@ -0,0 +1,174 @@
+# app/jobs/archive.py
+"""
+Calculation Archival Job
+
+Moves calculations that have not been updated for ARCHIVE_AFTER_DAYS from
+the hot calculations table into calculations_archive, so the hot table's
+working set and indexes stay small enough to live in shared_buffers.
+
+Each batch is one statement and one transaction:
+
+    WITH moved AS (
+        DELETE FROM calculations
+        WHERE (id, user_id) IN (
+            SELECT id, user_id FROM calculations
+            WHERE updated_at < :cutoff LIMIT :batch_size FOR UPDATE SKIP LOCKED
+        )
+        RETURNING ...
+    )
+    INSERT INTO calculations_archive (...) SELECT ... FROM moved
+
+so a row is never in both tables or in neither. SKIP LOCKED lets the job
+run alongside requests (and other job instances) without waiting on rows
+that are being edited. Calculations that reference, or are referenced by,
+other calculations stay hot so they can still be recomputed.
+
+The job runs in the background from the app lifespan when ARCHIVE_ENABLED
+is set, or once from the command line:
+    python -m app.jobs.archive [--days 90] [--batch-size 1000]
+"""
+
+import argparse
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import delete, exists, func, insert, or_, select, tuple_
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.database import SessionLocal
+from app.models.calculation import Calculation
+from app.models.calculation_archive import CalculationArchive
+from app.models.calculation_dependency import CalculationDependency
+
+logger = logging.getLogger(__name__)
+
+calculations_table = Calculation.__table__
+archive_table = CalculationArchive.__table__
+dependencies_table = CalculationDependency.__table__
+
+MOVED_COLUMNS = ("id", "user_id", "type", "inputs", "result", "engine_version", "created_at", "updated_at")
+
+
+def archive_batch(db: Session, cutoff: datetime, batch_size: int) -> int:
+    """
+    Move up to batch_size calculations last updated before cutoff into the archive.
+
+    Args:
+        db: SQLAlchemy database session (the caller commits)
+        cutoff: Rows with updated_at older than this are archived
+        batch_size: Maximum number of rows to move
+
+    Returns:
+        int: Number of rows moved
+    """
+    c = calculations_table.c
+    d = dependencies_table.c
+    in_graph = exists().where(or_(d.upstream_id == c.id, d.downstream_id == c.id))
+    candidates = (
+        select(c.id, c.user_id)
+        .where(c.updated_at < cutoff, ~in_graph)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    moved = (
+        delete(calculations_table)
+        .where(tuple_(c.id, c.user_id).in_(candidates))
+        .returning(*(c[name] for name in MOVED_COLUMNS))
+        .cte("moved")
+    )
+    statement = (
+        insert(archive_table)
+        .from_select(
+            [*MOVED_COLUMNS, "archived_at"],
+            select(*(moved.c[name] for name in MOVED_COLUMNS), func.now()),
+        )
+        .add_cte(moved)
+    )
+    return db.execute(statement).rowcount
+
+
+def archive_old_calculations(
+    db: Session,
+    older_than: timedelta,
+    batch_size: int = 1000,
+    max_batches: Optional[int] = None,
+) -> int:
+    """
+    Archive old calculations in bounded batches, committing after each batch.
+
+    Args:
+        db: SQLAlchemy database session
+        older_than: Age (since last update) after which rows are archived
+        batch_size: Rows moved per batch/transaction
+        max_batches: Stop after this many batches (None = until done)
+
+    Returns:
+        int: Total number of rows moved
+    """
+    cutoff = datetime.utcnow() - older_than
+    total, batches = 0, 0
+    while max_batches is None or batches < max_batches:
+        moved = archive_batch(db, cutoff, batch_size)
+        db.commit()
+        total += moved
+        batches += 1
+        if moved < batch_size:
+            break
+    return total
+
+
+def run_archive_once() -> int:
+    """Run one archival pass with the configured settings."""
+    db = SessionLocal()
+    try:
+        moved = archive_old_calculations(
+            db,
+            timedelta(days=settings.ARCHIVE_AFTER_DAYS),
+            batch_size=settings.ARCHIVE_BATCH_SIZE,
+        )
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+    if moved:
+        logger.info(f"Archived {moved} calculations")
+    return moved
+
+
+async def archive_periodically(interval_seconds: float) -> None:
+    """
+    Background task: run an archival pass every interval_seconds.
+
+    The work is blocking database I/O, so it runs in a worker thread. Errors
+    are logged and the loop keeps going; cancel the task to stop it.
+    """
+    while True:
+        try:
+            await asyncio.to_thread(run_archive_once)
+        except Exception as e:
+            logger.error(f"Calculation archival failed: {e}")
+        await asyncio.sleep(interval_seconds)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Move old calculations into calculations_archive.")
+    parser.add_argument("--days", type=float, default=settings.ARCHIVE_AFTER_DAYS,
+                        help="Archive rows not updated for this many days")
+    parser.add_argument("--batch-size", type=int, default=settings.ARCHIVE_BATCH_SIZE,
+                        help="Rows moved per transaction")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        moved = archive_old_calculations(db, timedelta(days=args.days), batch_size=args.batch_size)
+    finally:
+        db.close()
+    print(f"Archived {moved} calculations")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# app/jobs/backfill_results.py
+"""
+Stale Result Backfill Job
+
+Recomputes every calculation whose engine_version is older than its type's
+current ENGINE_VERSION (see app/operations/stale_results.py), e.g. after a
+numerical fix to a get_result() implementation.
+
+Stale rows are streamed with a server-side cursor (yield_per), so memory
+stays flat regardless of table size. Each batch is evaluated per type with
+evaluate_batch() and written back with one executemany UPDATE in its own
+transaction on a second session, while the cursor keeps reading.
+
+Rows that cannot be evaluated keep their old engine_version and are
+reported as failed; rerunning the job only touches rows that are still
+stale.
+
+    python -m app.jobs.backfill_results [--type division] [--batch-size 1000]
+"""
+
+import argparse
+import logging
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.database import SessionLocal
+from app.models.calculation import ENGINE_VERSIONS
+from app.models.user import User  # noqa: F401  (registers the User mapper that Calculation.user refers to)
+from app.operations.calculation_graph import calculations_table
+from app.operations.stale_results import refresh_rows, stale_condition
+
+logger = logging.getLogger(__name__)
+
+
+def backfill_results(
+    batch_size: int = 1000,
+    types: Optional[Iterable[str]] = None,
+    max_batches: Optional[int] = None,
+) -> Dict[str, int]:
+    """
+    Recompute all stale calculations in batches.
+
+    Args:
+        batch_size: Rows fetched, evaluated and updated per batch/transaction
+        types: Only backfill these calculation types (default: all)
+        max_batches: Stop after this many batches (None = until done)
+
+    Returns:
+        dict: Totals of "refreshed", "changed" and "failed" rows, and "batches"
+    """
+    totals = {"refreshed": 0, "changed": 0, "failed": 0, "batches": 0}
+    c = calculations_table.c
+    statement = (
+        select(c.id, c.user_id, c.type, c.inputs, c.result)
+        .where(stale_condition(types))
+        .execution_options(yield_per=batch_size)
+    )
+    reader, writer = SessionLocal(), SessionLocal()
+    try:
+        for rows in reader.execute(statement).partitions():
+            try:
+                stats = refresh_rows(writer, rows)
+                writer.commit()
+            except Exception:
+                writer.rollback()
+                raise
+            for key, value in stats.items():
+                totals[key] += value
+            totals["batches"] += 1
+            logger.info(f"Backfill batch {totals['batches']}: {stats}")
+            if max_batches is not None and totals["batches"] >= max_batches:
+                break
+    finally:
+        reader.close()
+        writer.close()
+    return totals
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Recompute calculations computed by an older engine version.")
+    parser.add_argument("--type", dest="types", action="append", choices=sorted(ENGINE_VERSIONS),
+                        help="Calculation type to backfill (repeatable; default: all)")
+    parser.add_argument("--batch-size", type=int, default=settings.ENGINE_BACKFILL_BATCH_SIZE,
+                        help="Rows per batch/transaction")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    print(backfill_results(batch_size=args.batch_size, types=args.types))
+
+
+if __name__ == "__main__":
+    main()
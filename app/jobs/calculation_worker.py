@@ -0,0 +1,240 @@
+# app/jobs/calculation_worker.py
+"""
+Calculation Job Worker
+
+Evaluates asynchronous calculation jobs (POST /calculations?async=true) in
+separate processes, so request workers never block on CPU-heavy
+evaluation.
+
+Each worker loops:
+1. Claim the oldest queued job in its own short transaction:
+       UPDATE calculation_jobs SET status = 'running', ...
+       WHERE id = (SELECT id FROM calculation_jobs WHERE status = 'queued'
+                   ORDER BY created_at LIMIT 1 FOR UPDATE SKIP LOCKED)
+       RETURNING ...
+   SKIP LOCKED lets any number of workers poll the same table without
+   blocking each other or claiming the same job twice.
+2. Evaluate it, then insert the Calculation and mark the job done in one
+   transaction (or mark it failed with the error message). Both updates
+   only apply while the job is still running under this claim (same
+   attempts), so a job re-queued as stale and claimed by another worker
+   is completed once; the slower worker rolls back its insert.
+3. Sleep JOB_POLL_INTERVAL_SECONDS when the queue is empty.
+
+Jobs left running by a worker that died are re-queued after
+JOB_STALE_AFTER_SECONDS, or failed after JOB_MAX_ATTEMPTS attempts.
+
+A database error (e.g. a restart or failover) does not end a worker: it
+rolls back and retries with exponential backoff, up to
+JOB_ERROR_BACKOFF_MAX_SECONDS. main() also restarts worker processes that
+exit unexpectedly.
+
+Run a pool of worker processes:
+    python -m app.jobs.calculation_worker [--processes 4]
+"""
+
+import argparse
+import logging
+import multiprocessing
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import case, select, update
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import InterfaceError, OperationalError, SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.database import SessionLocal, mark_written
+from app.models.calculation_job import (
+    JOB_DONE,
+    JOB_FAILED,
+    JOB_QUEUED,
+    JOB_RUNNING,
+    CalculationJob,
+)
+from app.models.user import User  # noqa: F401  (registers the User mapper that Calculation.user refers to)
+from app.operations.calculation_graph import create_calculation
+
+logger = logging.getLogger(__name__)
+
+jobs_table = CalculationJob.__table__
+
+
+def claim_job(db: Session) -> Optional[Row]:
+    """
+    Atomically claim the oldest queued job.
+
+    Returns:
+        Row: The claimed job (id, user_id, type, inputs, attempts), or None if the queue is empty
+    """
+    c = jobs_table.c
+    next_job = (
+        select(c.id)
+        .where(c.status == JOB_QUEUED)
+        .order_by(c.created_at)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+    claimed = db.execute(
+        update(jobs_table)
+        .where(c.id == next_job)
+        .values(status=JOB_RUNNING, started_at=datetime.utcnow(), attempts=c.attempts + 1)
+        .returning(c.id, c.user_id, c.type, c.inputs, c.attempts)
+    ).first()
+    db.commit()
+    return claimed
+
+
+def process_job(db: Session, job: Row) -> bool:
+    """
+    Evaluate a claimed job and store its outcome.
+
+    The Calculation insert and the job's "done" update commit together, so
+    a job is never done without its calculation. If the job is no longer
+    held by this claim (it was re-queued as stale, and maybe claimed again),
+    the insert is rolled back and the job is left to its current owner.
+
+    Returns:
+        bool: True if the job succeeded
+    """
+    c = jobs_table.c
+    still_claimed = (c.id == job.id, c.status == JOB_RUNNING, c.attempts == job.attempts)
+    try:
+        calculation = create_calculation(db, job.type, job.user_id, job.inputs)
+        done = db.execute(
+            update(jobs_table)
+            .where(*still_claimed)
+            .values(status=JOB_DONE, calculation_id=calculation.id, finished_at=datetime.utcnow())
+        )
+        if done.rowcount == 0:
+            db.rollback()
+            logger.warning(f"Calculation job {job.id} was re-queued while attempt {job.attempts} ran; discarding it")
+            return False
+        mark_written(db, job.user_id)  # The user polls the job, then reads the calculation
+        db.commit()
+        return True
+    except (OperationalError, InterfaceError):
+        db.rollback()
+        raise  # Lost the database, not the job's fault: run_worker retries, the job is re-queued when stale
+    except Exception as e:
+        db.rollback()
+        logger.warning(f"Calculation job {job.id} failed: {e}")
+        db.execute(
+            update(jobs_table)
+            .where(*still_claimed)
+            .values(status=JOB_FAILED, error=str(e), finished_at=datetime.utcnow())
+        )
+        db.commit()
+        return False
+
+
+def requeue_stale_jobs(db: Session, stale_after: timedelta, max_attempts: int) -> int:
+    """
+    Re-queue jobs whose worker died, or fail them after too many attempts.
+
+    Returns:
+        int: Number of jobs re-queued or failed
+    """
+    c = jobs_table.c
+    exhausted = c.attempts >= max_attempts
+    count = db.execute(
+        update(jobs_table)
+        .where(c.status == JOB_RUNNING, c.started_at < datetime.utcnow() - stale_after)
+        .values(
+            status=case((exhausted, JOB_FAILED), else_=JOB_QUEUED),
+            error=case((exhausted, "Worker stopped before the job finished"), else_=None),
+            finished_at=case((exhausted, datetime.utcnow()), else_=None),
+        )
+    ).rowcount
+    db.commit()
+    return count
+
+
+def run_worker(stop: Optional[threading.Event] = None, max_jobs: Optional[int] = None) -> int:
+    """
+    Process jobs until stopped.
+
+    Args:
+        stop: Event that ends the loop when set (None = run forever)
+        max_jobs: Return after processing this many jobs (None = no limit)
+
+    Returns:
+        int: Number of jobs processed
+    """
+    processed = 0
+    last_requeue = 0.0
+    backoff = 0.0
+    db = SessionLocal()
+    try:
+        while not (stop and stop.is_set()) and (max_jobs is None or processed < max_jobs):
+            try:
+                if time.monotonic() - last_requeue > settings.JOB_STALE_AFTER_SECONDS / 2:
+                    requeue_stale_jobs(
+                        db, timedelta(seconds=settings.JOB_STALE_AFTER_SECONDS), settings.JOB_MAX_ATTEMPTS
+                    )
+                    last_requeue = time.monotonic()
+
+                job = claim_job(db)
+                if job is None:
+                    if max_jobs is not None:
+                        break  # Drain mode (tests, one-off runs): stop when the queue is empty
+                    time.sleep(settings.JOB_POLL_INTERVAL_SECONDS)
+                    continue
+                process_job(db, job)
+                processed += 1
+                backoff = 0.0
+            except SQLAlchemyError as e:
+                db.rollback()
+                backoff = min(
+                    max(backoff * 2, settings.JOB_POLL_INTERVAL_SECONDS), settings.JOB_ERROR_BACKOFF_MAX_SECONDS
+                )
+                logger.error(f"Calculation worker database error, retrying in {backoff:.1f}s: {e}")
+                time.sleep(backoff)
+    finally:
+        db.close()
+    return processed
+
+
+def _worker_process() -> None:
+    logging.basicConfig(level=logging.INFO)
+    try:
+        run_worker()
+    except KeyboardInterrupt:
+        pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run calculation job worker processes.")
+    parser.add_argument("--processes", type=int, default=settings.JOB_WORKER_PROCESSES,
+                        help="Number of worker processes")
+    args = parser.parse_args()
+
+    # spawn: every worker builds its own engine and connection pool
+    context = multiprocessing.get_context("spawn")
+
+    def start_worker(i: int) -> multiprocessing.Process:
+        worker = context.Process(target=_worker_process, name=f"calculation-worker-{i}")
+        worker.start()
+        return worker
+
+    logging.basicConfig(level=logging.INFO)
+    workers = [start_worker(i) for i in range(args.processes)]
+    logger.info(f"Started {len(workers)} calculation workers")
+    try:
+        while True:
+            time.sleep(1)
+            for i, worker in enumerate(workers):
+                if not worker.is_alive():
+                    logger.error(f"{worker.name} exited with code {worker.exitcode}; restarting it")
+                    workers[i] = start_worker(i)
+    except KeyboardInterrupt:
+        for worker in workers:
+            worker.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+# app/jobs/user_deletion.py
+"""
+User Deletion Job
+
+Deleting a user through the ORM with cascade="all, delete-orphan" loads
+every Calculation the user owns and deletes them one row at a time; for a
+heavy account that is millions of objects in memory. Account removal
+works in two steps instead:
+
+1. DELETE /users/me marks the user inactive right away (they can no
+   longer log in) and schedules purge_user() as a background task
+2. purge_user() deletes the user's calculations and archived calculations
+   in bounded batches, one transaction per batch, and finally the user row
+
+No ORM objects are loaded; the statements are plain Core DELETEs. The
+relationship is declared with passive_deletes=True, so deleting a user
+through the ORM also leaves the children to ON DELETE CASCADE.
+
+If the process stops in the middle of a purge, rerun it from the command
+line (only inactive users are purged):
+    python -m app.jobs.user_deletion <user_id> [<user_id> ...]
+"""
+
+import argparse
+import logging
+from typing import Dict
+from uuid import UUID
+
+from sqlalchemy import Table, delete, select, tuple_
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.database import SessionLocal
+from app.models.calculation import Calculation
+from app.models.calculation_archive import CalculationArchive
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+users_table = User.__table__
+CHILD_TABLES = (Calculation.__table__, CalculationArchive.__table__)
+
+
+def delete_rows_batch(db: Session, table: Table, user_id: UUID, batch_size: int) -> int:
+    """
+    Delete up to batch_size rows owned by a user from a table.
+
+    Args:
+        db: SQLAlchemy database session (the caller commits)
+        table: calculations or calculations_archive
+        user_id: Owner of the rows
+        batch_size: Maximum number of rows to delete
+
+    Returns:
+        int: Number of rows deleted
+    """
+    c = table.c
+    batch = select(c.id, c.user_id).where(c.user_id == user_id).limit(batch_size)
+    return db.execute(delete(table).where(tuple_(c.id, c.user_id).in_(batch))).rowcount
+
+
+def purge_user(user_id: UUID, batch_size: int = None) -> Dict[str, int]:
+    """
+    Delete a deactivated user's rows in batches, then the user.
+
+    Runs in its own session because it is called after the request that
+    scheduled it has finished. Active users are never purged.
+
+    Args:
+        user_id: UUID of the user to remove
+        batch_size: Rows deleted per transaction (default USER_DELETION_BATCH_SIZE)
+
+    Returns:
+        dict: Rows deleted per table, plus "users" (1 if the user row was deleted)
+    """
+    batch_size = batch_size or settings.USER_DELETION_BATCH_SIZE
+    deleted = {table.name: 0 for table in CHILD_TABLES}
+    db = SessionLocal()
+    try:
+        is_active = db.execute(select(users_table.c.is_active).where(users_table.c.id == user_id)).scalar()
+        if is_active is None or is_active:
+            logger.warning(f"Not purging user {user_id}: missing or still active")
+            return {**deleted, "users": 0}
+
+        for table in CHILD_TABLES:
+            while True:
+                count = delete_rows_batch(db, table, user_id, batch_size)
+                db.commit()
+                deleted[table.name] += count
+                if count < batch_size:
+                    break
+
+        deleted["users"] = db.execute(
+            delete(users_table).where(users_table.c.id == user_id, users_table.c.is_active.is_(False))
+        ).rowcount
+        db.commit()
+    except Exception:
+        db.rollback()
+        logger.exception(f"Purging user {user_id} failed")
+        raise
+    finally:
+        db.close()
+
+    logger.info(f"Purged user {user_id}: {deleted}")
+    return deleted
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Purge deactivated users and their calculations.")
+    parser.add_argument("user_ids", nargs="+", type=UUID, help="Users to purge")
+    parser.add_argument("--batch-size", type=int, default=settings.USER_DELETION_BATCH_SIZE,
+                        help="Rows deleted per transaction")
+    args = parser.parse_args()
+    for user_id in args.user_ids:
+        print(user_id, purge_user(user_id, batch_size=args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -15,30 +15,73 @@ The application follows a RESTful API design with proper separation of concerns:
 - Dependencies handle authentication and database sessions
 """
 
+import asyncio
+import concurrent.futures
+import contextlib
+import logging
+import os
+import time
 from contextlib import asynccontextmanager  # Used for startup/shutdown events
 from datetime import datetime, timezone, timedelta
 from uuid import UUID  # For type validation of UUIDs in path parameters
 from typing import List
 
 # FastAPI imports
-from fastapi import Body, FastAPI, Depends, HTTPException, status, Request, Form
+from fastapi import BackgroundTasks, Body, FastAPI, Depends, HTTPException, Query, status, Request, Form
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse
-from fastapi.staticfiles import StaticFiles  # For serving static files (CSS, JS)
+from fastapi.responses import HTMLResponse, PlainTextResponse, RedirectResponse, JSONResponse, Response
+from anyio import from_thread  # Await Redis calls from sync endpoints
+from jose import jwt  # Claims of the already verified bearer token
+from redis import RedisError
 from fastapi.templating import Jinja2Templates  # For HTML templates
 
+from sqlalchemy import update  # Core UPDATE for account deactivation
+from sqlalchemy.exc import IntegrityError  # e.g. the user was purged while the insert waited
 from sqlalchemy.orm import Session  # SQLAlchemy database session
 
 import uvicorn  # ASGI server for running FastAPI apps
 
 # Application imports
-from app.auth.dependencies import get_current_active_user  # Authentication dependency
+from app.auth.dependencies import (  # Authentication / read-replica dependencies
+    get_current_active_user,
+    get_current_admin_user,
+    get_current_writer,
+    get_read_db,
+    is_admin_request,
+    oauth2_scheme,
+)
+from app.auth.redis import add_to_blacklist  # Token revocation
 from app.models.calculation import Calculation  # Database model for calculations
+from app.models.calculation_job import CalculationJob  # Asynchronous calculation jobs
 from app.models.user import User  # Database model for users
 from app.schemas.calculation import CalculationBase, CalculationResponse, CalculationUpdate  # API request/response schemas
+from app.schemas.job import JobResponse  # Asynchronous job schema
 from app.schemas.token import TokenResponse  # API token schema
 from app.schemas.user import UserCreate, UserResponse, UserLogin  # User schemas
-from app.database import Base, get_db, engine  # Database connection
+from app.database import Base, get_db, engine, get_pool_metrics, mark_written, replica_router, slow_query_log, SessionLocal  # Database connection
+from app.queries.calculation import (  # ORM-free read path
+    dump_calculation_row,
+    dump_calculation_rows,
+    fetch_user_calculation_row,
+    fetch_user_calculation_rows,
+)
+from app.operations import calculation_graph  # Inputs that reference other calculations
+from app.operations import stale_results  # Results computed by an older engine version
+from app.core.responses import FastJSONResponse  # orjson-based default response class
+from app.core.compression import CompressionMiddleware  # gzip/brotli response compression
+from app.core.assets import AssetManifest, FingerprintedStaticFiles  # Hashed static asset URLs
+from app.core.page_cache import PageCache  # Pre-rendered HTML pages
+from app.core.write_buffer import GroupCommitBuffer  # Group commit for calculation inserts
+from app.core.result_cache import get_result_cache  # Results shared across users by content address
+from app.core.metrics import METRICS_CONTENT_TYPE, MetricsMiddleware, generate_metrics, mark_process_dead  # Prometheus
+from app.core.server_timing import ServerTimingMiddleware  # Server-Timing phase breakdown header
+from app.core.query_budget import QueryBudgetMiddleware, query_budget  # Per-endpoint SQL statement budgets
+from app.core.profiler import ProfilerMiddleware, SamplingProfiler, profile_lock  # Sampling profiler (admins)
+from app.core.config import settings
+from app.jobs.archive import archive_periodically  # Background archival of old calculations
+from app.jobs.user_deletion import purge_user  # Batched removal of deleted accounts
+
+logger = logging.getLogger(__name__)
 
 
 # ------------------------------------------------------------------------------
@@ -59,32 +102,101 @@ async def lifespan(app: FastAPI):
     print("Creating tables...")
     Base.metadata.create_all(bind=engine)
     print("Tables created successfully!")
+    # Render the parameterless pages once so no request pays for Jinja
+    page_cache.prerender(*STATIC_PAGES)
+    # Move old calculations into calculations_archive in the background
+    archiver = None
+    if settings.ARCHIVE_ENABLED:
+        archiver = asyncio.create_task(archive_periodically(settings.ARCHIVE_INTERVAL_SECONDS))
     yield  # This is where application runs
-    # Cleanup code would go here (after yield), but we don't need any
+    if archiver is not None:
+        archiver.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await archiver
+    if write_buffer is not None:
+        write_buffer.stop()  # Flush rows that are still queued
+    mark_process_dead()  # Drop this worker's in-progress gauge from the shared metrics
 
 # Initialize the FastAPI application with metadata and lifespan
 app = FastAPI(
     title="Calculations API",
     description="API for managing calculations",
     version="1.0.0",
-    lifespan=lifespan  # Pass our lifespan context manager
+    lifespan=lifespan,  # Pass our lifespan context manager
+    default_response_class=FastJSONResponse  # Render JSON with orjson instead of stdlib json
 )
 
+# One group-commit buffer per worker process; its thread starts on first use
+write_buffer = None
+if settings.WRITE_BUFFER_ENABLED:
+    write_buffer = GroupCommitBuffer(
+        SessionLocal,
+        Calculation.__table__,
+        max_rows=settings.WRITE_BUFFER_MAX_ROWS,
+        max_delay_ms=settings.WRITE_BUFFER_MAX_DELAY_MS,
+    )
+
+# Enforce per-endpoint query budgets and catch lazy loads (staging/tests).
+# Added first so it is innermost and only sees the endpoint's own work.
+if settings.QUERY_BUDGET_MODE != "off":
+    app.add_middleware(QueryBudgetMiddleware, mode=settings.QUERY_BUDGET_MODE)
+
+# Compress API and HTML responses (brotli or gzip, negotiated per request)
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(CompressionMiddleware, minimum_size=settings.COMPRESSION_MINIMUM_SIZE)
+
+# Server-Timing header: auth / blacklist / db / eval / serialize breakdown
+if settings.SERVER_TIMING_ENABLED:
+    app.add_middleware(ServerTimingMiddleware)
+
+# ?profile=1 (admins): sample this request through the whole stack below and
+# return its collapsed stacks instead of the response
+if settings.PROFILER_ENABLED:
+    app.add_middleware(
+        ProfilerMiddleware,
+        is_admin=is_admin_request,
+        interval=settings.PROFILER_REQUEST_INTERVAL_MS / 1000,
+    )
+
+# Request latency per route template, in-flight requests and SQL per request.
+# Added last so it is the outermost middleware and times everything else.
+app.add_middleware(MetricsMiddleware)
+
 # ------------------------------------------------------------------------------
 # Static Files and Templates Configuration
 # ------------------------------------------------------------------------------
-# Mount the static files directory for serving CSS, JS, and images
-app.mount("/static", StaticFiles(directory="static"), name="static")
+# Mount the static files directory for serving CSS, JS, and images.
+# `python -m app.build_static` fingerprints CSS/JS into static/dist/ (served
+# as immutable) and writes precompressed .br/.gz variants, which are served
+# when the client accepts them.
+app.mount("/static", FingerprintedStaticFiles(directory="static"), name="static")
 
 # Set up Jinja2 templates directory for HTML rendering
 templates = Jinja2Templates(directory="templates")
 
+# static_url('js/dashboard.js') resolves to the fingerprinted URL when built
+asset_manifest = AssetManifest(directory="static", url_prefix="/static")
+templates.env.globals["static_url"] = asset_manifest.url
+
+# Pages are pre-rendered without a request, so url_for resolves to a plain
+# path ("/login") instead of the request-bound absolute URL.
+def url_path_for(name: str, **path_params) -> str:
+    return str(app.url_path_for(name, **path_params))
+
+templates.env.globals["url_for"] = url_path_for
+
+# Rendered pages as bytes + ETag; view/edit pages are cached per calc_id
+STATIC_PAGES = ("index.html", "login.html", "register.html", "dashboard.html")
+page_cache = PageCache(templates, max_entries=settings.PAGE_CACHE_MAX_ENTRIES)
+
 
 # ------------------------------------------------------------------------------
 # Web (HTML) Routes
 # ------------------------------------------------------------------------------
 # Our web routes use HTML responses with Jinja2 templates
-# These provide a user-friendly web interface alongside the API
+# These provide a user-friendly web interface alongside the API.
+# The pages only depend on their path parameters (data is loaded by
+# JavaScript), so they are served from the pre-rendered page_cache.
 
 @app.get("/", response_class=HTMLResponse, tags=["web"])
 def read_index(request: Request):
@@ -93,7 +205,7 @@ def read_index(request: Request):
     
     Displays the welcome page with links to register and login.
     """
-    return templates.TemplateResponse("index.html", {"request": request})
+    return page_cache.respond(request, "index.html")
 
 @app.get("/login", response_class=HTMLResponse, tags=["web"])
 def login_page(request: Request):
@@ -102,7 +214,7 @@ def login_page(request: Request):
     
     Displays a form for users to enter credentials and log in.
     """
-    return templates.TemplateResponse("login.html", {"request": request})
+    return page_cache.respond(request, "login.html")
 
 @app.get("/register", response_class=HTMLResponse, tags=["web"])
 def register_page(request: Request):
@@ -111,7 +223,7 @@ def register_page(request: Request):
     
     Displays a form for new users to create an account.
     """
-    return templates.TemplateResponse("register.html", {"request": request})
+    return page_cache.respond(request, "register.html")
 
 @app.get("/dashboard", response_class=HTMLResponse, tags=["web"])
 def dashboard_page(request: Request):
@@ -125,7 +237,7 @@ def dashboard_page(request: Request):
     
     JavaScript in this page calls the API endpoints to fetch and display data.
     """
-    return templates.TemplateResponse("dashboard.html", {"request": request})
+    return page_cache.respond(request, "dashboard.html")
 
 @app.get("/dashboard/view/{calc_id}", response_class=HTMLResponse, tags=["web"])
 def view_calculation_page(request: Request, calc_id: str):
@@ -136,13 +248,13 @@ def view_calculation_page(request: Request, calc_id: str):
     - This is the Read page
     
     Args:
-        request: The FastAPI request object (required by Jinja2)
+        request: The FastAPI request object (used for If-None-Match)
         calc_id: UUID of the calculation to view
         
     Returns:
-        HTMLResponse: Rendered template with calculation ID passed to frontend
+        HTMLResponse: Cached page with calculation ID passed to frontend
     """
-    return templates.TemplateResponse("view_calculation.html", {"request": request, "calc_id": calc_id})
+    return page_cache.respond(request, "view_calculation.html", calc_id=calc_id)
 
 @app.get("/dashboard/edit/{calc_id}", response_class=HTMLResponse, tags=["web"])
 def edit_calculation_page(request: Request, calc_id: str):
@@ -153,13 +265,13 @@ def edit_calculation_page(request: Request, calc_id: str):
     - This is the Edit page
     
     Args:
-        request: The FastAPI request object (required by Jinja2)
+        request: The FastAPI request object (used for If-None-Match)
         calc_id: UUID of the calculation to edit
         
     Returns:
-        HTMLResponse: Rendered template with calculation ID passed to frontend
+        HTMLResponse: Cached page with calculation ID passed to frontend
     """
-    return templates.TemplateResponse("edit_calculation.html", {"request": request, "calc_id": calc_id})
+    return page_cache.respond(request, "edit_calculation.html", calc_id=calc_id)
 
 
 # ------------------------------------------------------------------------------
@@ -170,6 +282,61 @@ def read_health():
     """Health check."""
     return {"status": "ok"}
 
+@app.get("/health/pool", tags=["health"])
+def read_pool_health(admin = Depends(get_current_admin_user)):
+    """Connection pool metrics for this worker (checkout wait, checked-out and overflow counts). Admins only."""
+    return get_pool_metrics()
+
+@app.get("/metrics", tags=["health"], include_in_schema=False)
+def read_metrics():
+    """Prometheus metrics, merged across all worker processes."""
+    return Response(content=generate_metrics(), media_type=METRICS_CONTENT_TYPE)
+
+@app.get("/health/result-cache", tags=["health"])
+def read_result_cache_health(admin = Depends(get_current_admin_user)):
+    """Shared result cache counters for this worker (hits, misses, hit ratio, bytes saved). Admins only."""
+    cache = get_result_cache()
+    return cache.stats() if cache is not None else {"enabled": False}
+
+
+# ------------------------------------------------------------------------------
+# Admin Endpoints (users listed in ADMIN_USERNAMES)
+# ------------------------------------------------------------------------------
+@app.get("/admin/slow-queries", tags=["admin"])
+def read_slow_queries(admin = Depends(get_current_admin_user)):
+    """
+    Slow statements seen by this worker (parameters redacted), newest first,
+    and the EXPLAIN plan captured for each statement shape.
+    """
+    return {"enabled": settings.SLOW_QUERY_LOG_ENABLED, **slow_query_log.snapshot()}
+
+@app.post("/admin/profile", response_class=PlainTextResponse, tags=["admin"])
+async def profile_worker(
+    seconds: float = Query(10, gt=0, description="How long to sample this worker"),
+    admin = Depends(get_current_admin_user)
+):
+    """
+    Sample every busy thread of the worker that received this request for
+    `seconds` of real traffic, and return a flamegraph-compatible
+    collapsed-stack file. Only one profile runs per worker at a time.
+    """
+    if not settings.PROFILER_ENABLED:
+        raise HTTPException(status_code=404, detail="Profiler disabled.")
+    if not profile_lock.acquire(blocking=False):
+        raise HTTPException(status_code=409, detail="A profile is already running in this worker.")
+    try:
+        profiler = SamplingProfiler(settings.PROFILER_INTERVAL_MS / 1000).start()
+        try:
+            await asyncio.sleep(min(seconds, settings.PROFILER_MAX_SECONDS))  # Keeps serving traffic meanwhile
+        finally:
+            profiler.stop()
+    finally:
+        profile_lock.release()
+    return PlainTextResponse(
+        profiler.collapsed(),
+        headers={"Content-Disposition": f'attachment; filename="profile-{os.getpid()}.collapsed"'},
+    )
+
 
 # ------------------------------------------------------------------------------
 # User Registration Endpoint
@@ -256,6 +423,46 @@ def login_form(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = D
     }
 
 
+# ------------------------------------------------------------------------------
+# User Account Endpoints
+# ------------------------------------------------------------------------------
+@app.delete("/users/me", status_code=status.HTTP_202_ACCEPTED, tags=["users"])
+def delete_current_user(
+    background_tasks: BackgroundTasks,
+    token: str = Depends(oauth2_scheme),
+    current_user = Depends(get_current_writer),
+    db: Session = Depends(get_db)
+):
+    """
+    Delete the current user's account.
+
+    The user is marked inactive immediately (so they can no longer log in
+    or write) and the presented token is revoked. Their calculations are
+    removed in batches by a background task, without loading them through
+    the ORM (see app/jobs/user_deletion.py).
+    """
+    result = db.execute(
+        update(User.__table__)
+        .where(User.__table__.c.id == current_user.id, User.__table__.c.is_active.is_(True))
+        .values(is_active=False)
+    )
+    mark_written(db, current_user.id)
+    db.commit()
+    if result.rowcount == 0:
+        raise HTTPException(status_code=404, detail="User not found.")
+
+    claims = jwt.get_unverified_claims(token)  # Verified by get_current_user
+    if "jti" in claims:
+        try:
+            from_thread.run(add_to_blacklist, claims["jti"], max(1, int(claims["exp"] - time.time())))
+        except (RedisError, OSError) as e:
+            # Writes are still refused: get_current_writer sees the inactive user
+            logger.warning(f"Revoking the token of deleted user {current_user.id} failed: {e}")
+
+    background_tasks.add_task(purge_user, current_user.id)
+    return {"detail": "Account deletion scheduled."}
+
+
 # ------------------------------------------------------------------------------
 # Calculations Endpoints (BREAD)
 # ------------------------------------------------------------------------------
@@ -265,23 +472,87 @@ def login_form(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = D
     response_model=CalculationResponse,
     status_code=status.HTTP_201_CREATED,
     tags=["calculations"],
+    responses={202: {"model": JobResponse, "description": "Queued as an asynchronous job (async=true)"}},
 )
 def create_calculation(
     calculation_data: CalculationBase,
-    current_user = Depends(get_current_active_user),
+    run_async: bool = Query(False, alias="async", description="Queue the calculation as a background job"),
+    current_user = Depends(get_current_writer),
     db: Session = Depends(get_db)
 ):
     """
     Create a new calculation for the authenticated user.
     Automatically computes the 'result'.
+
+    With async=true the request is stored as a job and evaluated by a
+    worker process (app/jobs/calculation_worker.py); the response is 202
+    with the job, to be polled at GET /jobs/{id}.
+
+    With WRITE_BUFFER_ENABLED the row is handed to the group-commit buffer,
+    which inserts it together with other concurrent creates in one commit.
+    If no flush picks the row up within WRITE_BUFFER_TIMEOUT_SECONDS the
+    response is 503: the row is withdrawn from the queue when it is still
+    waiting, but a row whose batch is already being inserted may still be
+    saved (the detail says which).
+
+    Returns 409 when the insert violates a constraint.
+
+    Inputs may reference other calculations ({"ref": "<id>"}); those are
+    resolved to their results and recorded as dependencies, so the new
+    calculation is recomputed when they change.
     """
+    inputs = calculation_graph.serialize_inputs(calculation_data.inputs)
+    if run_async:
+        job = CalculationJob(
+            user_id=current_user.id,
+            type=calculation_data.type.value,
+            inputs=inputs,
+        )
+        db.add(job)
+        db.commit()
+        db.refresh(job)
+        return FastJSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content=JobResponse.model_validate(job).model_dump(mode="json"),
+            headers={"Location": f"/jobs/{job.id}"},
+        )
+
     try:
+        if calculation_graph.input_refs(inputs):
+            # Dependencies are written in the same transaction, so skip the buffer
+            new_calculation = calculation_graph.create_calculation(
+                db, calculation_data.type.value, current_user.id, inputs
+            )
+            db.commit()
+            db.refresh(new_calculation)
+            return new_calculation
+
         new_calculation = Calculation.create(
             calculation_type=calculation_data.type,
             user_id=current_user.id,
-            inputs=calculation_data.inputs,
+            inputs=inputs,
         )
-        new_calculation.result = new_calculation.get_result()
+        # Consults the shared result cache before evaluating
+        new_calculation.result = calculation_graph.evaluate(new_calculation.type, inputs, {})
+
+        if write_buffer is not None:
+            pending = write_buffer.submit({
+                "user_id": current_user.id,
+                "type": new_calculation.type,
+                "inputs": new_calculation.inputs,
+                "result": new_calculation.result,
+            })
+            try:
+                row = pending.result(timeout=settings.WRITE_BUFFER_TIMEOUT_SECONDS)
+            except concurrent.futures.TimeoutError:
+                saved = "was not saved" if pending.cancel() else "may still be saved"
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail=f"Timed out waiting for the database; the calculation {saved}.",
+                    headers={"Retry-After": "1"},
+                )
+            replica_router.record_write(current_user.id)  # Read-your-writes for the buffered insert
+            return dict(row._mapping)
 
         db.add(new_calculation)
         db.commit()
@@ -294,44 +565,103 @@ def create_calculation(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Calculation conflicts with the current data and was not saved."
+        )
+
+
+# Poll an Asynchronous Calculation Job
+@app.get("/jobs/{job_id}", response_model=JobResponse, tags=["calculations"])
+@query_budget(1)
+def get_job(
+    job_id: UUID,
+    current_user = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Return the status of an asynchronous calculation job owned by the current user.
+
+    Read from the primary: job status changes quickly and must not lag.
+    Once the job is done, calculation_id points at the created calculation.
+    """
+    job = db.query(CalculationJob).filter(
+        CalculationJob.id == job_id,
+        CalculationJob.user_id == current_user.id
+    ).first()
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found.")
+    return job
 
 
 # Browse / List Calculations
 @app.get("/calculations", response_model=List[CalculationResponse], tags=["calculations"])
+@query_budget(2)  # The rows, plus what stale rows reference (stale_results.fresh_results)
 def list_calculations(
+    background_tasks: BackgroundTasks,
+    include_archived: bool = Query(False, description="Also return archived calculations"),
     current_user = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     List all calculations belonging to the current authenticated user.
+
+    Uses the ORM-free read path: rows are selected with SQLAlchemy Core and
+    encoded straight to JSON bytes. Returning a raw Response skips both ORM
+    hydration and FastAPI's response_model revalidation; response_model is
+    kept for the OpenAPI schema. Served from a read replica when configured.
+
+    Only hot rows are returned unless include_archived=true.
+
+    Results computed by an older engine version are recomputed for the
+    response, and written back to the primary in a background task.
     """
-    calculations = db.query(Calculation).filter(Calculation.user_id == current_user.id).all()
-    return calculations
+    rows = fetch_user_calculation_rows(db, current_user.id, include_archived)
+    if settings.ENGINE_RECOMPUTE_ON_READ:
+        fresh = stale_results.fresh_results(db, current_user.id, rows)
+        if fresh:
+            rows = [(*row[:6], fresh[row.id]) if row.id in fresh else row for row in rows]
+            background_tasks.add_task(stale_results.refresh_calculations, current_user.id, list(fresh))
+    return Response(content=dump_calculation_rows(rows), media_type="application/json")
 
 
 # Read / Retrieve a Specific Calculation by ID
 @app.get("/calculations/{calc_id}", response_model=CalculationResponse, tags=["calculations"])
+@query_budget(2)  # The rows, plus what stale rows reference (stale_results.fresh_results)
 def get_calculation(
     calc_id: str,
+    background_tasks: BackgroundTasks,
     current_user = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     Retrieve a single calculation by its UUID, if it belongs to the current user.
+    Served from a read replica when configured. Archived calculations are
+    found too (read-only), so links to them keep working; hot and archived
+    rows are searched with one query and encoded like list_calculations.
+
+    A result computed by an older engine version is recomputed for the
+    response and, for hot rows, written back in a background task.
     """
     try:
         calc_uuid = UUID(calc_id)
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid calculation id format.")
 
-    calculation = db.query(Calculation).filter(
-        Calculation.id == calc_uuid,
-        Calculation.user_id == current_user.id
-    ).first()
-    if not calculation:
+    row = fetch_user_calculation_row(db, current_user.id, calc_uuid)
+    if row is None:
         raise HTTPException(status_code=404, detail="Calculation not found.")
 
-    return calculation
+    if settings.ENGINE_RECOMPUTE_ON_READ:
+        fresh = stale_results.fresh_results(db, current_user.id, [row])
+        if fresh:
+            if not row.archived:
+                background_tasks.add_task(stale_results.refresh_calculations, current_user.id, [calc_uuid])
+            row = (*row[:6], fresh[calc_uuid])
+
+    return Response(content=dump_calculation_row(row), media_type="application/json")
 
 
 # Edit / Update a Calculation
@@ -339,11 +669,15 @@ def get_calculation(
 def update_calculation(
     calc_id: str,
     calculation_update: CalculationUpdate,
-    current_user = Depends(get_current_active_user),
+    current_user = Depends(get_current_writer),
     db: Session = Depends(get_db)
 ):
     """
     Update the inputs (and thus the result) of a specific calculation.
+
+    Calculations that reference this one (directly or transitively) are
+    recomputed in the same transaction. Returns 400 if the new inputs would
+    create a circular reference or make a dependent calculation fail.
     """
     try:
         calc_uuid = UUID(calc_id)
@@ -358,8 +692,11 @@ def update_calculation(
         raise HTTPException(status_code=404, detail="Calculation not found.")
 
     if calculation_update.inputs is not None:
-        calculation.inputs = calculation_update.inputs
-        calculation.result = calculation.get_result()
+        try:
+            calculation_graph.update_inputs(db, calculation, calculation_update.inputs)
+        except ValueError as e:
+            db.rollback()
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
     calculation.updated_at = datetime.utcnow()
     db.commit()
@@ -371,11 +708,13 @@ def update_calculation(
 @app.delete("/calculations/{calc_id}", status_code=status.HTTP_204_NO_CONTENT, tags=["calculations"])
 def delete_calculation(
     calc_id: str,
-    current_user = Depends(get_current_active_user),
+    current_user = Depends(get_current_writer),
     db: Session = Depends(get_db)
 ):
     """
     Delete a calculation by its UUID, if it belongs to the current user.
+
+    Returns 409 while other calculations still reference it.
     """
     try:
         calc_uuid = UUID(calc_id)
@@ -388,7 +727,13 @@ def delete_calculation(
     ).first()
     if not calculation:
         raise HTTPException(status_code=404, detail="Calculation not found.")
+    if calculation_graph.has_dependents(db, calc_uuid):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Calculation is referenced by other calculations.",
+        )
 
+    calculation_graph.set_dependencies(db, current_user.id, calc_uuid, [])
     db.delete(calculation)
     db.commit()
     return None
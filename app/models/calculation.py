@@ -12,18 +12,50 @@ It demonstrates several advanced patterns:
 
 These models are designed for a calculator application that supports
 basic mathematical operations: addition, subtraction, multiplication, and division.
+
+Every calculation type carries an ENGINE_VERSION, and every row records the
+engine_version its result was computed with. Bump a type's ENGINE_VERSION
+whenever its get_result() changes; rows with an older engine_version are
+then stale and get recomputed (see app/operations/stale_results.py).
 """
 
 from datetime import datetime
 import uuid
-from typing import List
-from sqlalchemy import Column, String, DateTime, ForeignKey, JSON, Float
+from types import SimpleNamespace
+from typing import List, Union
+from sqlalchemy import Column, String, DateTime, ForeignKey, JSON, Float, Integer
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship, declared_attr
 from sqlalchemy.ext.declarative import declared_attr
 from app.database import Base
 import math
 
+
+def _current_engine_version(context) -> int:
+    """Column default: the ENGINE_VERSION of the row's calculation type."""
+    return ENGINE_VERSIONS.get(context.get_current_parameters().get("type"), 1)
+
+
+def ensure_finite(result: float) -> float:
+    """
+    Reject a result that overflowed to infinity, is NaN, or is an int
+    beyond the float range (LCM works on exact ints).
+
+    JSON has no representation for them (orjson would silently write null),
+    and the API promises a float result.
+
+    Raises:
+        ValueError: If the result is not a finite float
+    """
+    try:
+        finite = math.isfinite(result)
+    except OverflowError:  # int too large to convert to float
+        finite = False
+    if not finite:
+        raise ValueError("The result is too large to represent.")
+    return result
+
+
 class AbstractCalculation:
     """
     Abstract base class for calculations.
@@ -35,6 +67,9 @@ class AbstractCalculation:
     Design Pattern: Template Method - Defines the skeleton of the calculation
     algorithm in a method, deferring some steps to subclasses.
     """
+
+    # Version of this type's get_result(); bump it when the arithmetic changes
+    ENGINE_VERSION = 1
     
     @declared_attr
     def __tablename__(cls):
@@ -117,6 +152,20 @@ class AbstractCalculation:
             nullable=True
         )
 
+    @declared_attr
+    def engine_version(cls):
+        """
+        ENGINE_VERSION of the type's get_result() that computed the result.
+
+        Defaults to the current version at insert time, also for Core
+        inserts (e.g. the group-commit buffer).
+        """
+        return Column(
+            Integer,
+            default=_current_engine_version,
+            nullable=False
+        )
+
     @declared_attr
     def created_at(cls):
         """
@@ -174,14 +223,7 @@ class AbstractCalculation:
         Raises:
             ValueError: If the calculation_type is not supported
         """
-        calculation_classes = {
-            'addition': Addition,
-            'subtraction': Subtraction,
-            'multiplication': Multiplication,
-            'division': Division,
-            'lcm': LCM,
-        }
-        calculation_class = calculation_classes.get(calculation_type.lower())
+        calculation_class = CALCULATION_CLASSES.get(calculation_type.lower())
         if not calculation_class:
             raise ValueError(f"Unsupported calculation type: {calculation_type}")
         return calculation_class(user_id=user_id, inputs=inputs)
@@ -201,6 +243,29 @@ class AbstractCalculation:
         """
         raise NotImplementedError
 
+    @classmethod
+    def evaluate_batch(cls, inputs_batch: List[list]) -> List[Union[float, ValueError]]:
+        """
+        Evaluate many input lists with this type's get_result().
+
+        Used to recompute stored results in bulk. The inputs are evaluated on
+        lightweight stand-ins instead of mapped instances, so no ORM state is
+        created per row.
+
+        Args:
+            inputs_batch: One list of numeric inputs per calculation
+
+        Returns:
+            list: One result per input list, or the ValueError it raised
+        """
+        results = []
+        for inputs in inputs_batch:
+            try:
+                results.append(ensure_finite(cls.get_result(SimpleNamespace(inputs=inputs))))
+            except ValueError as e:
+                results.append(e)
+        return results
+
     def __repr__(self):
         """
         String representation of the calculation for debugging.
@@ -396,3 +461,14 @@ class LCM(Calculation):
         return abs(a * b) // math.gcd(a, b)
 
 
+# Calculation types by polymorphic identity, used by the create() factory
+CALCULATION_CLASSES = {
+    'addition': Addition,
+    'subtraction': Subtraction,
+    'multiplication': Multiplication,
+    'division': Division,
+    'lcm': LCM,
+}
+
+# Current engine version per calculation type
+ENGINE_VERSIONS = {name: cls.ENGINE_VERSION for name, cls in CALCULATION_CLASSES.items()}
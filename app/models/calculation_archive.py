@@ -0,0 +1,46 @@
+# app/models/calculation_archive.py
+"""
+Calculation Archive Model Module
+
+Cold storage for old calculations. The archival job (app/jobs/archive.py)
+moves rows whose last update is older than ARCHIVE_AFTER_DAYS out of the
+hot calculations table into calculations_archive, keeping the hot table
+and its indexes small.
+
+The archive has the same columns as calculations plus archived_at. It is a
+plain table: archived rows are read-only and never loaded as polymorphic
+Calculation subclasses.
+"""
+
+from datetime import datetime
+from sqlalchemy import Column, String, DateTime, ForeignKey, JSON, Float, Integer
+from sqlalchemy.dialects.postgresql import UUID
+from app.database import Base
+
+
+class CalculationArchive(Base):
+    """
+    An archived calculation.
+
+    Rows keep the id, owner, timestamps and result they had in the hot
+    table. Deleting the user deletes their archived rows (ON DELETE CASCADE).
+    """
+    __tablename__ = "calculations_archive"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, nullable=False)
+    user_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,  # Archived rows are only ever read per user
+    )
+    type = Column(String(50), nullable=False)
+    inputs = Column(JSON, nullable=False)
+    result = Column(Float, nullable=True)
+    engine_version = Column(Integer, default=1, nullable=False)
+    created_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, nullable=False)
+    archived_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<CalculationArchive(type={self.type}, inputs={self.inputs})>"
@@ -0,0 +1,38 @@
+# app/models/calculation_dependency.py
+"""
+Calculation Dependency Model Module
+
+An edge of the calculation dependency graph. A calculation whose inputs
+contain {"ref": "<id>"} uses the result of calculation <id>; that gives
+one edge upstream_id -> downstream_id. When an upstream calculation is
+updated, its downstream calculations are recomputed in topological order
+(see app/operations/calculation_graph.py).
+
+Edges never cross users: a calculation can only reference calculations
+owned by the same user.
+"""
+
+from sqlalchemy import Column, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID
+from app.database import Base
+
+
+class CalculationDependency(Base):
+    """Calculation downstream_id uses the result of calculation upstream_id."""
+    __tablename__ = "calculation_dependencies"
+    __table_args__ = (
+        # The primary key serves "what depends on X"; this serves "what does X use"
+        Index("ix_calculation_dependencies_downstream_id", "downstream_id"),
+    )
+
+    # No foreign keys to calculations: their primary key is (id, user_id) once partitioned
+    upstream_id = Column(UUID(as_uuid=True), primary_key=True, nullable=False)
+    downstream_id = Column(UUID(as_uuid=True), primary_key=True, nullable=False)
+    user_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    def __repr__(self):
+        return f"<CalculationDependency({self.upstream_id} -> {self.downstream_id})>"
@@ -0,0 +1,57 @@
+# app/models/calculation_job.py
+"""
+Calculation Job Model Module
+
+A queued request to create a calculation asynchronously. POST
+/calculations?async=true stores a job instead of evaluating inline, and
+worker processes (app/jobs/calculation_worker.py) claim queued jobs with
+SELECT ... FOR UPDATE SKIP LOCKED, evaluate them and store the resulting
+Calculation. Clients poll GET /jobs/{id}.
+
+Job lifecycle:
+    queued -> running -> done    (calculation_id is set)
+                      -> failed  (error is set)
+A running job whose worker died is put back in the queue after
+JOB_STALE_AFTER_SECONDS, up to JOB_MAX_ATTEMPTS attempts.
+"""
+
+import uuid
+from datetime import datetime
+from sqlalchemy import Column, String, DateTime, ForeignKey, JSON, Integer, Text, Index
+from sqlalchemy.dialects.postgresql import UUID
+from app.database import Base
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+
+
+class CalculationJob(Base):
+    """An asynchronous calculation request and its status."""
+    __tablename__ = "calculation_jobs"
+    __table_args__ = (
+        # Workers look for the oldest queued job
+        Index("ix_calculation_jobs_status_created_at", "status", "created_at"),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
+    user_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    type = Column(String(50), nullable=False)
+    inputs = Column(JSON, nullable=False)
+    status = Column(String(20), nullable=False, default=JOB_QUEUED)
+    attempts = Column(Integer, nullable=False, default=0)
+    # No foreign key: calculations' primary key is (id, user_id) once partitioned
+    calculation_id = Column(UUID(as_uuid=True), nullable=True)
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+
+    def __repr__(self):
+        return f"<CalculationJob(type={self.type}, status={self.status})>"
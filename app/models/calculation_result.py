@@ -0,0 +1,27 @@
+# app/models/calculation_result.py
+"""
+Cached Result Model Module
+
+The optional Postgres tier of the content-addressed result cache
+(app/core/result_cache.py). Each row maps the sha256 of a canonical
+(type, engine version, inputs) payload to its result, shared by all users.
+
+Rows are never updated, and a stale engine version simply stops being
+looked up, so the table can be truncated at any time.
+"""
+
+from datetime import datetime
+from sqlalchemy import Column, String, DateTime, Float
+from app.database import Base
+
+
+class CachedResult(Base):
+    """A result keyed by the content address of its calculation."""
+    __tablename__ = "calculation_result_cache"
+
+    key = Column(String(64), primary_key=True)  # Hex sha256
+    result = Column(Float, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<CachedResult(key={self.key}, result={self.result})>"
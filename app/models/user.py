@@ -99,9 +99,12 @@ class User(Base):
                         nullable=True)  # Track login activity
     
     # Relationships - one-to-many with Calculation model
+    # passive_deletes: the database (ON DELETE CASCADE) removes the rows, so
+    # deleting a user never loads their calculations into memory
     calculations = relationship("Calculation", 
                                back_populates="user", 
-                               cascade="all, delete-orphan")  # Delete user's calculations when user is deleted
+                               cascade="all, delete-orphan",  # Delete user's calculations when user is deleted
+                               passive_deletes=True)
     
     def __init__(self, *args, **kwargs):
         """Initialize a new user, handling password hashing if provided."""
@@ -217,8 +220,8 @@ class User(Base):
             or_(cls.username == username_or_email, cls.email == username_or_email)
         ).first()
 
-        if not user or not user.verify_password(password):
-            return None
+        if not user or not user.is_active or not user.verify_password(password):
+            return None  # Inactive users (e.g. pending deletion) cannot log in
 
         # Update the last_login timestamp
         user.last_login = utcnow()
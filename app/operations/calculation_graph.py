@@ -0,0 +1,306 @@
+# app/operations/calculation_graph.py
+"""
+Calculation Dependency Graph Module
+
+A calculation input can reference another calculation's result instead of
+a number, e.g. {"type": "multiplication", "inputs": [{"ref": "<id>"}, 3]}.
+The references are stored as-is in the inputs JSON column, and each one is
+also recorded as an edge in calculation_dependencies (upstream -> downstream).
+
+When a calculation's inputs change, only the calculations that depend on
+it (directly or transitively) are recomputed:
+1. Collect the descendants with one recursive CTE over the edge table
+2. Load their inputs and the results of any outside calculations they use
+3. Evaluate them in topological order (graphlib), skipping a calculation
+   when none of its upstream results actually changed
+4. Write all new results with one executemany UPDATE
+
+Everything happens in the caller's transaction, so an update and the
+recomputation it triggers commit (or fail) together. An update that would
+create a cycle is rejected with a ValueError, as is one that makes a
+dependent calculation fail (e.g. a division by zero further down). Updates
+of one user's inputs are serialized by a lock on the user's row, so two
+concurrent edits cannot each pass the cycle check and close a loop together.
+"""
+
+from datetime import datetime
+from graphlib import TopologicalSorter
+from typing import Dict, Iterable, List, Set
+from uuid import UUID
+
+from sqlalchemy import bindparam, delete, insert, literal_column, select, update
+from sqlalchemy.orm import Session
+
+from app.core.result_cache import get_result_cache
+from app.core.server_timing import timed
+from app.database import mark_written
+from app.models.calculation import ENGINE_VERSIONS, Calculation, ensure_finite
+from app.models.calculation_dependency import CalculationDependency
+from app.models.user import User
+
+calculations_table = Calculation.__table__
+dependencies_table = CalculationDependency.__table__
+
+
+def serialize_inputs(inputs: Iterable) -> list:
+    """
+    Convert validated inputs (numbers and CalculationRef) into their JSON form.
+
+    Returns:
+        list: Numbers unchanged, references as {"ref": "<uuid string>"}
+    """
+    serialized = []
+    for value in inputs:
+        ref = getattr(value, "ref", None)
+        if ref is not None:
+            serialized.append({"ref": str(ref)})
+        elif isinstance(value, dict):
+            serialized.append({"ref": str(value["ref"])})
+        else:
+            serialized.append(value)
+    return serialized
+
+
+def input_refs(inputs: Iterable) -> List[UUID]:
+    """
+    Return the calculation ids referenced by serialized inputs, without duplicates.
+    """
+    refs = []
+    for value in inputs:
+        if isinstance(value, dict):
+            ref = UUID(str(value["ref"]))
+            if ref not in refs:
+                refs.append(ref)
+    return refs
+
+
+def resolve_inputs(inputs: Iterable, results: Dict[UUID, float]) -> list:
+    """
+    Replace each reference with the referenced calculation's result.
+
+    Args:
+        inputs: Serialized inputs
+        results: Results by calculation id (see fetch_results())
+
+    Returns:
+        list: Plain numeric inputs
+    """
+    return [results[UUID(str(value["ref"]))] if isinstance(value, dict) else value for value in inputs]
+
+
+def evaluate(calculation_type: str, inputs: Iterable, results: Dict[UUID, float]) -> float:
+    """
+    Compute a result for serialized inputs, resolving references first.
+
+    Uses a transient Calculation of the right subclass, so the arithmetic
+    and its errors (ValueError) are exactly those of the model; a result
+    that overflowed to infinity is a ValueError too. The shared
+    result cache (app/core/result_cache.py) is consulted first when enabled.
+    """
+    resolved = resolve_inputs(inputs, results)
+
+    def compute() -> float:
+        with timed("eval"):
+            return ensure_finite(Calculation.create(calculation_type, None, resolved).get_result())
+
+    cache = get_result_cache()
+    return compute() if cache is None else cache.get_or_compute(calculation_type, resolved, compute)
+
+
+def fetch_results(db: Session, user_id: UUID, ids: Iterable[UUID]) -> Dict[UUID, float]:
+    """
+    Load the results of the given calculations owned by a user.
+
+    Raises:
+        ValueError: If a calculation does not exist, belongs to another user,
+                    or has no result
+    """
+    ids = list(ids)
+    if not ids:
+        return {}
+    c = calculations_table.c
+    results = dict(db.execute(select(c.id, c.result).where(c.user_id == user_id, c.id.in_(ids))).all())
+    for ref in ids:
+        if results.get(ref) is None:
+            raise ValueError(f"Referenced calculation {ref} not found")
+    return results
+
+
+def set_dependencies(db: Session, user_id: UUID, calculation_id: UUID, refs: List[UUID]) -> None:
+    """Replace the edges into calculation_id with one edge per referenced calculation."""
+    d = dependencies_table.c
+    db.execute(delete(dependencies_table).where(d.downstream_id == calculation_id))
+    if refs:
+        db.execute(
+            insert(dependencies_table),
+            [{"upstream_id": ref, "downstream_id": calculation_id, "user_id": user_id} for ref in refs],
+        )
+
+
+def descendants(db: Session, calculation_id: UUID) -> Set[UUID]:
+    """
+    Return every calculation that depends on calculation_id, directly or transitively.
+
+        WITH RECURSIVE downstream(id) AS (
+            SELECT downstream_id FROM calculation_dependencies WHERE upstream_id = :id
+            UNION
+            SELECT e.downstream_id FROM calculation_dependencies e JOIN downstream ON e.upstream_id = downstream.id
+        )
+        SELECT id FROM downstream
+    """
+    d = dependencies_table.c
+    downstream = (
+        select(d.downstream_id.label("id"))
+        .where(d.upstream_id == calculation_id)
+        .cte("downstream", recursive=True)
+    )
+    edge = dependencies_table.alias("edge")
+    downstream = downstream.union(
+        select(edge.c.downstream_id).join(downstream, edge.c.upstream_id == downstream.c.id)
+    )
+    return set(db.execute(select(downstream.c.id)).scalars())
+
+
+def lock_user_graph(db: Session, user_id: UUID) -> None:
+    """
+    Serialize changes to a user's dependency graph until the transaction ends.
+
+    Locks the user's row FOR NO KEY UPDATE: concurrent graph edits of the same
+    user wait, while inserts that only check the foreign key do not.
+    """
+    db.execute(select(User.id).where(User.id == user_id).with_for_update(key_share=True))
+
+
+def has_dependents(db: Session, calculation_id: UUID) -> bool:
+    """Return True if any calculation references calculation_id."""
+    d = dependencies_table.c
+    return db.execute(
+        select(literal_column("1")).where(d.upstream_id == calculation_id).limit(1)
+    ).first() is not None
+
+
+def create_calculation(db: Session, calculation_type: str, user_id: UUID, inputs: Iterable) -> Calculation:
+    """
+    Create a calculation whose inputs may reference other calculations.
+
+    The calculation and its edges are added to the session and flushed;
+    the caller commits.
+
+    Raises:
+        ValueError: If a reference cannot be resolved or the result cannot be computed
+    """
+    inputs = serialize_inputs(inputs)
+    refs = input_refs(inputs)
+    calculation = Calculation.create(calculation_type, user_id, inputs)
+    calculation.result = evaluate(calculation.type, inputs, fetch_results(db, user_id, refs))
+    db.add(calculation)
+    db.flush()
+    if refs:
+        set_dependencies(db, user_id, calculation.id, refs)
+    return calculation
+
+
+def update_inputs(db: Session, calculation: Calculation, inputs: Iterable) -> int:
+    """
+    Change a calculation's inputs and recompute everything that depends on it.
+
+    Args:
+        db: SQLAlchemy database session (the caller commits, or rolls back on error)
+        calculation: The persistent calculation being edited
+        inputs: New validated inputs
+
+    Returns:
+        int: Number of dependent calculations whose result changed
+
+    Raises:
+        ValueError: If the new inputs reference the calculation itself or one
+                    of its dependents (a cycle), a reference cannot be
+                    resolved, or the calculation or a dependent cannot be computed
+    """
+    inputs = serialize_inputs(inputs)
+    refs = input_refs(inputs)
+    lock_user_graph(db, calculation.user_id)
+    downstream = descendants(db, calculation.id)
+    if calculation.id in refs or downstream.intersection(refs):
+        raise ValueError("Inputs would create a circular reference between calculations")
+
+    previous = calculation.result
+    calculation.inputs = inputs
+    calculation.result = evaluate(calculation.type, inputs, fetch_results(db, calculation.user_id, refs))
+    calculation.engine_version = ENGINE_VERSIONS[calculation.type]
+    set_dependencies(db, calculation.user_id, calculation.id, refs)
+    if not downstream or calculation.result == previous:
+        return 0
+    return recompute_downstream(db, calculation, downstream)
+
+
+def recompute_downstream(db: Session, root, downstream: Set[UUID]) -> int:
+    """
+    Re-evaluate the dependents of root in topological order and store the changed results.
+
+    Args:
+        db: SQLAlchemy database session
+        root: The calculation whose result changed (anything with id, user_id
+              and the new result)
+        downstream: Ids of all its dependents (see descendants())
+
+    Returns:
+        int: Number of calculations updated
+    """
+    c = calculations_table.c
+    d = dependencies_table.c
+    rows = {
+        row.id: row
+        for row in db.execute(
+            select(c.id, c.type, c.inputs, c.result)
+            .where(c.user_id == root.user_id, c.id.in_(list(downstream)))
+        )
+    }
+    # Edges into the affected calculations, from the root and from each other
+    graph: Dict[UUID, Set[UUID]] = {calc_id: set() for calc_id in rows}
+    for upstream_id, downstream_id in db.execute(
+        select(d.upstream_id, d.downstream_id).where(d.downstream_id.in_(list(rows)))
+    ):
+        if upstream_id == root.id or upstream_id in rows:
+            graph[downstream_id].add(upstream_id)
+
+    # Results of calculations outside the affected set, which do not change
+    outside = {ref for row in rows.values() for ref in input_refs(row.inputs)} - rows.keys() - {root.id}
+    results = fetch_results(db, root.user_id, outside)
+    results[root.id] = root.result
+
+    changed = {root.id}
+    updates = []
+    for calc_id in TopologicalSorter(graph).static_order():
+        row = rows.get(calc_id)
+        if row is None:
+            continue  # The root
+        if not graph[calc_id] & changed:
+            results[calc_id] = row.result
+            continue
+        try:
+            result = evaluate(row.type, row.inputs, results)
+        except ValueError as e:
+            raise ValueError(f"Dependent calculation {calc_id} cannot be recomputed: {e}") from e
+        results[calc_id] = result
+        if result != row.result:
+            changed.add(calc_id)
+            updates.append({
+                "calc_id": calc_id,
+                "new_result": result,
+                "new_version": ENGINE_VERSIONS[row.type],
+            })
+
+    if updates:
+        db.execute(
+            update(calculations_table)
+            .where(c.id == bindparam("calc_id"), c.user_id == root.user_id)
+            .values(
+                result=bindparam("new_result"),
+                engine_version=bindparam("new_version"),
+                updated_at=datetime.utcnow(),
+            ),
+            updates,
+        )
+        mark_written(db, root.user_id)
+    return len(updates)
@@ -0,0 +1,269 @@
+# app/operations/stale_results.py
+"""
+Stale Result Recomputation Module
+
+Each calculation row records the engine_version of the get_result() that
+computed it (see ENGINE_VERSION in app/models/calculation.py). After a
+type's ENGINE_VERSION is bumped, its older rows are stale. They are fixed
+in two ways:
+
+- Lazily on read: GET /calculations and GET /calculations/{id} recompute
+  stale rows in memory, so responses are always current, and schedule
+  refresh_calculations() to write the new results to the primary
+- In bulk: app/jobs/backfill_results.py streams all stale rows and passes
+  them through refresh_rows() in batches
+
+refresh_rows() evaluates plain rows per type with evaluate_batch() (after one
+batched lookup in the shared result cache, when enabled), resolves
+rows that reference other calculations after the rows they depend on, and
+writes everything with one executemany UPDATE. When a refreshed result
+changes, the calculations that depend on it are recomputed as well
+(app/operations/calculation_graph.py). updated_at is left alone: a refresh
+is not a user edit and must not keep old rows out of the archive.
+"""
+
+import logging
+from collections import defaultdict
+from graphlib import TopologicalSorter
+from types import SimpleNamespace
+from typing import Dict, Iterable, List, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import and_, bindparam, false, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.core.result_cache import get_result_cache
+from app.database import SessionLocal, mark_written
+from app.models.calculation import CALCULATION_CLASSES, ENGINE_VERSIONS
+from app.operations.calculation_graph import (
+    calculations_table,
+    dependencies_table,
+    descendants,
+    evaluate,
+    fetch_results,
+    input_refs,
+    recompute_downstream,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def is_stale(calculation_type: str, engine_version: int) -> bool:
+    """Return True if a result was computed by an older engine than the current one."""
+    return engine_version < ENGINE_VERSIONS.get(calculation_type, engine_version)
+
+
+def stale_condition(types: Optional[Iterable[str]] = None):
+    """
+    Build a WHERE clause matching stale calculations rows.
+
+    Args:
+        types: Only match these calculation types (default: all types)
+    """
+    c = calculations_table.c
+    versions = {t: v for t, v in ENGINE_VERSIONS.items() if types is None or t in types}
+    if not versions:
+        return false()
+    return or_(*(and_(c.type == t, c.engine_version < v) for t, v in versions.items()))
+
+
+def upstream_rows(db: Session, user_id: UUID, ids: Iterable[UUID]) -> List:
+    """
+    Load the given calculations and every calculation they reference, transitively.
+
+        WITH RECURSIVE upstream(id) AS (
+            SELECT id FROM calculations WHERE user_id = :user_id AND id IN (:ids)
+            UNION
+            SELECT e.upstream_id FROM calculation_dependencies e JOIN upstream ON e.downstream_id = upstream.id
+        )
+        SELECT id, type, inputs, result, engine_version FROM calculations JOIN upstream USING (id)
+        WHERE user_id = :user_id
+    """
+    c = calculations_table.c
+    upstream = (
+        select(c.id.label("id"))
+        .where(c.user_id == user_id, c.id.in_(list(ids)))
+        .cte("upstream", recursive=True)
+    )
+    edge = dependencies_table.alias("edge")
+    upstream = upstream.union(select(edge.c.upstream_id).join(upstream, edge.c.downstream_id == upstream.c.id))
+    return db.execute(
+        select(c.id, c.type, c.inputs, c.result, c.engine_version)
+        .select_from(calculations_table.join(upstream, c.id == upstream.c.id))
+        .where(c.user_id == user_id)
+    ).all()
+
+
+def fresh_results(db: Session, user_id: UUID, rows: Sequence) -> Dict[UUID, float]:
+    """
+    Recompute stale rows in memory, for a response.
+
+    Rows are evaluated in topological order, so a row that references a
+    stale calculation uses that calculation's fresh result. A row that is
+    current itself but references a result that changed is recomputed too.
+    References outside `rows` are loaded, with everything upstream of them,
+    in one extra query (only when some row is stale).
+
+    Args:
+        db: SQLAlchemy database session (read-only use)
+        user_id: Owner of the rows
+        rows: Rows or objects with id, type, inputs, result and engine_version
+
+    Returns:
+        dict: Current result by id, for the rows of `rows` that were
+        recomputed successfully
+    """
+    if not any(is_stale(row.type, row.engine_version) for row in rows):
+        return {}
+    known = {row.id: row for row in rows}
+    missing = {ref for row in rows for ref in input_refs(row.inputs)} - known.keys()
+    if missing:
+        for row in upstream_rows(db, user_id, missing):
+            known.setdefault(row.id, row)
+
+    graph = {calc_id: set(input_refs(row.inputs)) & known.keys() for calc_id, row in known.items()}
+    results: Dict[UUID, float] = {}
+    changed = set()
+    recomputed = set()
+    for calc_id in TopologicalSorter(graph).static_order():
+        row = known[calc_id]
+        refs = input_refs(row.inputs)
+        if is_stale(row.type, row.engine_version) or changed.intersection(refs):
+            try:
+                absent = [ref for ref in refs if ref not in results]
+                if absent:
+                    raise ValueError(f"Referenced calculation {absent[0]} not found")
+                results[calc_id] = evaluate(row.type, row.inputs, results)
+                recomputed.add(calc_id)
+                if results[calc_id] != row.result:
+                    changed.add(calc_id)
+                continue
+            except ValueError as e:
+                logger.warning(f"Cannot recompute stale calculation {calc_id}: {e}")
+        if row.result is not None:
+            results[calc_id] = row.result
+    return {row.id: results[row.id] for row in rows if row.id in recomputed}
+
+
+def refresh_rows(db: Session, rows: Sequence) -> Dict[str, int]:
+    """
+    Recompute stale rows with the current engine and write them back.
+
+    Args:
+        db: SQLAlchemy database session (the caller commits)
+        rows: Rows with id, user_id, type, inputs and result
+
+    Returns:
+        dict: "refreshed" rows written, how many of them "changed" result,
+        and how many "failed" to evaluate (left stale)
+    """
+    new_results: Dict[UUID, float] = {}
+    failed = 0
+
+    # Plain rows: one cache lookup and one evaluate_batch() call per type
+    cache = get_result_cache()
+    by_type = defaultdict(list)
+    referencing = []
+    for row in rows:
+        (referencing if input_refs(row.inputs) else by_type[row.type]).append(row)
+    for calculation_type, group in by_type.items():
+        calculation_class = CALCULATION_CLASSES.get(calculation_type)
+        if calculation_class is None:
+            failed += len(group)
+            continue
+        cached = cache.lookup_many(calculation_type, [row.inputs for row in group]) if cache else []
+        for row, result in zip(group, cached):
+            if result is not None:
+                new_results[row.id] = result
+        misses = [row for row in group if row.id not in new_results]
+        computed = []
+        for row, result in zip(misses, calculation_class.evaluate_batch([row.inputs for row in misses])):
+            if isinstance(result, ValueError):
+                logger.warning(f"Cannot recompute calculation {row.id}: {result}")
+                failed += 1
+            else:
+                new_results[row.id] = result
+                computed.append((row.inputs, result))
+        if cache:
+            cache.store_many(calculation_type, computed)
+
+    # Rows with references: after the rows in this batch they depend on
+    by_id = {row.id: row for row in referencing}
+    graph = {row.id: set(input_refs(row.inputs)) & by_id.keys() for row in referencing}
+    for calc_id in TopologicalSorter(graph).static_order():
+        row = by_id[calc_id]
+        refs = input_refs(row.inputs)
+        known = {ref: new_results[ref] for ref in refs if ref in new_results}
+        try:
+            results = {**fetch_results(db, row.user_id, [ref for ref in refs if ref not in known]), **known}
+            new_results[calc_id] = evaluate(row.type, row.inputs, results)
+        except ValueError as e:
+            logger.warning(f"Cannot recompute calculation {calc_id}: {e}")
+            failed += 1
+
+    rows_by_id = {row.id: row for row in rows}
+    if new_results:
+        c = calculations_table.c
+        db.execute(
+            update(calculations_table)
+            .where(c.id == bindparam("calc_id"), c.user_id == bindparam("owner_id"))
+            .values(
+                result=bindparam("new_result"),
+                engine_version=bindparam("new_version"),
+                updated_at=c.updated_at,  # Not an edit; also overrides the onupdate default
+            ),
+            [
+                {
+                    "calc_id": calc_id,
+                    "owner_id": rows_by_id[calc_id].user_id,
+                    "new_result": result,
+                    "new_version": ENGINE_VERSIONS[rows_by_id[calc_id].type],
+                }
+                for calc_id, result in new_results.items()
+            ],
+        )
+        for user_id in {rows_by_id[calc_id].user_id for calc_id in new_results}:
+            mark_written(db, user_id)
+
+    changed = [calc_id for calc_id, result in new_results.items() if result != rows_by_id[calc_id].result]
+    _recompute_dependents(db, [(rows_by_id[calc_id], new_results[calc_id]) for calc_id in changed])
+    return {"refreshed": len(new_results), "changed": len(changed), "failed": failed}
+
+
+def _recompute_dependents(db: Session, changed: List[tuple]) -> None:
+    """Recompute the dependents of refreshed rows whose result changed."""
+    if not changed:
+        return
+    d = dependencies_table.c
+    ids = [row.id for row, _ in changed]
+    with_dependents = set(db.execute(select(d.upstream_id).where(d.upstream_id.in_(ids)).distinct()).scalars())
+    for row, result in changed:
+        if row.id in with_dependents:
+            root = SimpleNamespace(id=row.id, user_id=row.user_id, result=result)
+            recompute_downstream(db, root, descendants(db, row.id))
+
+
+def refresh_calculations(user_id: UUID, ids: List[UUID]) -> None:
+    """
+    Background task: persist fresh results for stale calculations seen on a read.
+
+    Runs in its own primary session, because reads may be served by a
+    replica and the request has finished by the time this runs. Rows that
+    are no longer stale (e.g. refreshed concurrently) are skipped.
+    """
+    c = calculations_table.c
+    db = SessionLocal()
+    try:
+        rows = db.execute(
+            select(c.id, c.user_id, c.type, c.inputs, c.result)
+            .where(c.user_id == user_id, c.id.in_(ids), stale_condition())
+            .with_for_update(skip_locked=True)
+        ).all()
+        if rows:
+            refresh_rows(db, rows)
+        db.commit()
+    except Exception:
+        db.rollback()
+        logger.exception(f"Refreshing stale calculations of user {user_id} failed")
+    finally:
+        db.close()
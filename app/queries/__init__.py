@@ -0,0 +1,14 @@
+# app/queries/__init__.py
+from .calculation import (
+    CALCULATION_COLUMNS,
+    select_user_calculations,
+    dump_calculation_rows,
+    fetch_user_calculations_json,
+)
+
+__all__ = [
+    'CALCULATION_COLUMNS',
+    'select_user_calculations',
+    'dump_calculation_rows',
+    'fetch_user_calculations_json',
+]
@@ -0,0 +1,164 @@
+# app/queries/calculation.py
+"""
+Calculation Read Queries Module
+
+This module implements an ORM-free read path for calculations. The regular
+path loads polymorphic Calculation subclasses (Addition, Division, ...) into
+the session identity map and then validates every instance again into a
+CalculationResponse through from_attributes. For list reads that work costs
+more CPU than the query itself.
+
+Instead, this module:
+1. Builds a SQLAlchemy Core select() over the calculations table
+2. Fetches plain row tuples (no ORM hydration, no identity map)
+3. Encodes the rows straight into JSON bytes with orjson (dumps_json)
+
+Archived rows (calculations_archive, see app/jobs/archive.py) are only
+included when asked for, through a UNION ALL with the same columns.
+
+The JSON produced here is byte-compatible with what FastAPI renders for a
+List[CalculationResponse] through FastJSONResponse, so endpoints can return
+it in a raw Response.
+"""
+
+from typing import Iterable, List, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import Select, false, select, true, union_all
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from app.core.responses import dumps_json
+from app.models.calculation import Calculation
+from app.models.calculation_archive import CalculationArchive
+
+# Columns in the same order as the fields of CalculationResponse, so the
+# encoded objects have the same key order as the response_model output.
+calculations_table = Calculation.__table__
+
+CALCULATION_COLUMNS = (
+    calculations_table.c.type,
+    calculations_table.c.inputs,
+    calculations_table.c.id,
+    calculations_table.c.user_id,
+    calculations_table.c.created_at,
+    calculations_table.c.updated_at,
+    calculations_table.c.result,
+)
+
+archive_table = CalculationArchive.__table__
+
+ARCHIVE_COLUMNS = tuple(archive_table.c[column.name] for column in CALCULATION_COLUMNS)
+
+
+def select_user_calculations(
+    user_id: UUID, include_archived: bool = False, with_engine_version: bool = False
+) -> Select:
+    """
+    Build a Core SELECT for all calculations owned by a user.
+
+    Args:
+        user_id: UUID of the user whose calculations should be returned
+        include_archived: Also return the user's archived calculations
+        with_engine_version: Append engine_version after the response columns,
+                             to find stale results (see app/operations/stale_results.py)
+
+    Returns:
+        Select: A Core select statement yielding row tuples
+    """
+    hot_columns, archive_columns = CALCULATION_COLUMNS, ARCHIVE_COLUMNS
+    if with_engine_version:
+        hot_columns += (calculations_table.c.engine_version,)
+        archive_columns += (archive_table.c.engine_version,)
+    hot = select(*hot_columns).where(calculations_table.c.user_id == user_id)
+    if not include_archived:
+        return hot
+    archived = select(*archive_columns).where(archive_table.c.user_id == user_id)
+    return union_all(hot, archived)
+
+
+def _row_to_dict(row: Row) -> dict:
+    """
+    Convert a row tuple into a dict shaped like CalculationResponse.
+
+    Numeric inputs are coerced to float because CalculationResponse declares
+    them as floats (LCM stores ints in the JSON column); references to other
+    calculations ({"ref": "<id>"}) are passed through.
+    """
+    type_, inputs, id_, user_id, created_at, updated_at, result = row[:7]
+    return {
+        "type": type_,
+        "inputs": [value if isinstance(value, dict) else float(value) for value in inputs],
+        "id": id_,
+        "user_id": user_id,
+        "created_at": created_at,
+        "updated_at": updated_at,
+        "result": result,
+    }
+
+
+def dump_calculation_rows(rows: Iterable[Sequence]) -> bytes:
+    """
+    Encode calculation row tuples into a JSON array.
+
+    orjson serializes UUID and datetime natively, so the rows do not need
+    to go through jsonable_encoder or Pydantic.
+
+    Args:
+        rows: Row tuples produced by select_user_calculations() (extra
+              trailing columns such as engine_version are ignored)
+
+    Returns:
+        bytes: The JSON-encoded list of calculations
+    """
+    return dumps_json([_row_to_dict(row) for row in rows])
+
+
+def fetch_user_calculation_rows(db: Session, user_id: UUID, include_archived: bool = False) -> List[Row]:
+    """
+    Run the Core read path for a user's calculations and return the row tuples.
+
+    Rows carry engine_version as an eighth column, so callers can recompute
+    stale results before encoding them with dump_calculation_rows().
+    """
+    return db.execute(select_user_calculations(user_id, include_archived, with_engine_version=True)).all()
+
+
+def fetch_user_calculation_row(db: Session, user_id: UUID, calc_id: UUID) -> Optional[Row]:
+    """
+    Fetch one of a user's calculations, hot or archived, in a single query.
+
+    A calculation is in exactly one of the two tables, so both are searched
+    with a UNION ALL instead of a second query for the archive fallback.
+
+    Returns:
+        Row: The response columns, engine_version and an "archived" flag,
+        or None if the user has no such calculation
+    """
+    hot = select(*CALCULATION_COLUMNS, calculations_table.c.engine_version, false().label("archived")).where(
+        calculations_table.c.id == calc_id, calculations_table.c.user_id == user_id
+    )
+    archived = select(*ARCHIVE_COLUMNS, archive_table.c.engine_version, true().label("archived")).where(
+        archive_table.c.id == calc_id, archive_table.c.user_id == user_id
+    )
+    return db.execute(union_all(hot, archived).limit(1)).first()
+
+
+def dump_calculation_row(row: Sequence) -> bytes:
+    """Encode one calculation row tuple into a JSON object."""
+    return dumps_json(_row_to_dict(row))
+
+
+def fetch_user_calculations_json(db: Session, user_id: UUID, include_archived: bool = False) -> bytes:
+    """
+    Run the Core read path for a user's calculations and return JSON bytes.
+
+    Args:
+        db: SQLAlchemy database session
+        user_id: UUID of the user whose calculations should be returned
+        include_archived: Also return the user's archived calculations
+
+    Returns:
+        bytes: The JSON-encoded list of calculations
+    """
+    return dump_calculation_rows(fetch_user_calculation_rows(db, user_id, include_archived))
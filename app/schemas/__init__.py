@@ -11,11 +11,13 @@ from .user import (
 from .token import Token, TokenData, TokenResponse
 from .calculation import (
     CalculationType,
+    CalculationRef,
     CalculationBase,
     CalculationCreate,
     CalculationUpdate,
     CalculationResponse
 )
+from .job import JobStatus, JobResponse
 
 __all__ = [
     'UserBase',
@@ -28,8 +30,11 @@ __all__ = [
     'TokenData',
     'TokenResponse',
     'CalculationType',
+    'CalculationRef',
     'CalculationBase',
     'CalculationCreate',
     'CalculationUpdate',
     'CalculationResponse',
+    'JobStatus',
+    'JobResponse',
 ]
\ No newline at end of file
@@ -10,11 +10,14 @@ It includes schemas for:
 
 The schemas use Pydantic's validation system to ensure data integrity and provide
 clear error messages when validation fails.
+
+An input is either a number or a reference to another calculation's result,
+written as {"ref": "<calculation uuid>"} (see app/operations/calculation_graph.py).
 """
 
 from enum import Enum
-from pydantic import BaseModel, Field, ConfigDict, model_validator, field_validator
-from typing import List, Optional
+from pydantic import BaseModel, Field, ConfigDict, FiniteFloat, model_validator, field_validator
+from typing import List, Optional, Union
 from uuid import UUID
 from datetime import datetime 
 
@@ -38,6 +41,21 @@ class CalculationType(str, Enum):
     DIVISION = "division"
     LCM = "lcm"
 
+class CalculationRef(BaseModel):
+    """
+    Reference to another calculation, used as an input.
+
+    The referenced calculation's result is used in place of the reference,
+    and the calculation is recomputed whenever that result changes.
+    """
+    ref: UUID = Field(..., description="UUID of the calculation whose result is used")
+
+    model_config = ConfigDict(extra="forbid")
+
+# A calculation input: a finite number (JSON cannot carry NaN or Infinity
+# back out), or {"ref": "<uuid>"}
+CalculationInput = Union[FiniteFloat, CalculationRef]
+
 class CalculationBase(BaseModel):
     """
     Base schema for calculation data.
@@ -53,9 +71,9 @@ class CalculationBase(BaseModel):
         description="Type of calculation (addition, subtraction, multiplication, division, lcm)",
         example="addition"
     )
-    inputs: List[float] = Field(
+    inputs: List[CalculationInput] = Field(
         ...,  # The ... means this field is required
-        description="List of numeric inputs for the calculation",
+        description="List of numeric inputs, or {\"ref\": \"<uuid>\"} references to other calculations",
         example=[10.5, 3, 2],
         min_items=2  # Ensures at least 2 numbers are provided
     )
@@ -127,20 +145,22 @@ class CalculationBase(BaseModel):
         """
         if len(self.inputs) < 2:
             raise ValueError("At least two numbers are required for calculation")
+        # References are only resolved (and checked) when the result is computed
+        numbers = [x for x in self.inputs if not isinstance(x, CalculationRef)]
         if self.type == CalculationType.DIVISION:
             # Prevent division by zero (skip the first value as numerator)
-            if any(x == 0 for x in self.inputs[1:]):
+            if any(x == 0 for x in self.inputs[1:] if not isinstance(x, CalculationRef)):
                 raise ValueError("Cannot divide by zero")
         if self.type == CalculationType.LCM:
             # Enforce exactly two inputs
             if len(self.inputs) > 2:
                 raise ValueError("LCM requires exactly two numbers")
             # Ensure all imputs are positive integers for LCM
-            for x in self.inputs:
+            for x in numbers:
                 if not float(x).is_integer() or x <= 0:
                     raise ValueError("LCM requires positive integers only")
             # Cast to int for consistency
-            self.inputs = [int(x) for x in self.inputs]
+            self.inputs = [x if isinstance(x, CalculationRef) else int(x) for x in self.inputs]
         return self
 
     model_config = ConfigDict(
@@ -151,7 +171,8 @@ class CalculationBase(BaseModel):
         json_schema_extra={
             "examples": [
                 {"type": "addition", "inputs": [10.5, 3, 2]},
-                {"type": "division", "inputs": [100, 2]}
+                {"type": "division", "inputs": [100, 2]},
+                {"type": "multiplication", "inputs": [{"ref": "123e4567-e89b-12d3-a456-426614174999"}, 3]}
             ]
         }
     )
@@ -191,7 +212,7 @@ class CalculationUpdate(BaseModel):
     Note that all fields are optional (so clients can send partial updates),
     but if inputs are provided, they must pass validation.
     """
-    inputs: Optional[List[float]] = Field(
+    inputs: Optional[List[CalculationInput]] = Field(
         None,  # None means this field is optional
         description="Updated list of numeric inputs for the calculation",
         example=[42, 7],
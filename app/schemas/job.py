@@ -0,0 +1,42 @@
+# app/schemas/job.py
+from enum import Enum
+from uuid import UUID
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field
+
+class JobStatus(str, Enum):
+    """Lifecycle states of an asynchronous calculation job."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+class JobResponse(BaseModel):
+    """Schema for an asynchronous calculation job (POST /calculations?async=true, GET /jobs/{id})."""
+    id: UUID = Field(..., description="Job ID to poll at /jobs/{id}")
+    status: JobStatus = Field(..., description="queued, running, done or failed")
+    type: str = Field(..., description="Requested calculation type")
+    calculation_id: Optional[UUID] = Field(
+        None, description="ID of the created calculation once the job is done"
+    )
+    error: Optional[str] = Field(None, description="Error message if the job failed")
+    created_at: datetime = Field(..., description="Time when the job was queued")
+    started_at: Optional[datetime] = Field(None, description="Time when a worker claimed the job")
+    finished_at: Optional[datetime] = Field(None, description="Time when the job finished")
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
+            "example": {
+                "id": "123e4567-e89b-12d3-a456-426614174111",
+                "status": "done",
+                "type": "multiplication",
+                "calculation_id": "123e4567-e89b-12d3-a456-426614174999",
+                "error": None,
+                "created_at": "2025-01-01T00:00:00",
+                "started_at": "2025-01-01T00:00:01",
+                "finished_at": "2025-01-01T00:00:01"
+            }
+        }
+    )
@@ -0,0 +1,9 @@
+# benchmarks/__init__.py
+"""
+Performance benchmarks for the Calculations API.
+
+Benchmarks are plain modules run with `python -m benchmarks.<name>`. They are
+not collected by pytest (see testpaths in pytest.ini) and expect a reachable
+PostgreSQL database at settings.DATABASE_URL. benchmarks.load drives a
+running server over HTTP instead (or starts uvicorn with --start-server).
+"""
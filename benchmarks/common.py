@@ -0,0 +1,167 @@
+# benchmarks/common.py
+"""
+Shared helpers for the benchmark scripts.
+
+Provides:
+- A timing helper that reports min/median/mean over repeated runs
+- Seeding helpers that create a benchmark user and bulk-insert calculations
+  (multi-row INSERTs, or COPY for millions of rows)
+"""
+
+import csv
+import io
+import json
+import random
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.models.calculation import ENGINE_VERSIONS, Calculation
+from app.models.user import User
+
+CALCULATION_TYPES = ["addition", "subtraction", "multiplication", "division", "lcm"]
+
+
+def time_call(func: Callable[[], object], repeat: int = 5) -> Dict[str, float]:
+    """
+    Time a callable several times and summarize the results in milliseconds.
+
+    Args:
+        func: Zero-argument callable to time
+        repeat: Number of timed runs
+
+    Returns:
+        dict: min, median and mean duration in milliseconds
+    """
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append((time.perf_counter() - start) * 1000)
+    return {
+        "min_ms": round(min(durations), 3),
+        "median_ms": round(statistics.median(durations), 3),
+        "mean_ms": round(statistics.mean(durations), 3),
+    }
+
+
+def create_benchmark_user(db: Session) -> User:
+    """
+    Create a throwaway user to own the seeded calculations.
+
+    The password is stored as an opaque string because benchmark users
+    never log in through this path.
+    """
+    suffix = uuid.uuid4().hex[:12]
+    user = User(
+        first_name="Bench",
+        last_name="User",
+        email=f"bench_{suffix}@example.com",
+        username=f"bench_{suffix}",
+        password="not-a-real-hash",
+        is_active=True,
+        is_verified=False,
+    )
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return user
+
+
+def random_calculation_row(user_id: uuid.UUID, now: datetime) -> dict:
+    """Build one random calculations row as a plain dict."""
+    calc_type = random.choice(CALCULATION_TYPES)
+    if calc_type == "lcm":
+        inputs = [random.randint(1, 500), random.randint(1, 500)]
+    else:
+        inputs = [round(random.uniform(1, 1000), 2) for _ in range(random.randint(2, 5))]
+    instance = Calculation.create(calc_type, user_id, inputs)
+    created_at = now - timedelta(seconds=random.randint(0, 86400 * 365))
+    return {
+        "id": uuid.uuid4(),
+        "user_id": user_id,
+        "type": calc_type,
+        "inputs": inputs,
+        "result": instance.get_result(),
+        "engine_version": ENGINE_VERSIONS[calc_type],
+        "created_at": created_at,
+        "updated_at": created_at,
+    }
+
+
+def seed_calculations(db: Session, user_id: uuid.UUID, count: int, batch_size: int = 5000) -> None:
+    """
+    Bulk-insert random calculations for a user with multi-row INSERTs.
+
+    Args:
+        db: SQLAlchemy database session
+        user_id: Owner of the seeded rows
+        count: Number of rows to insert
+        batch_size: Rows per INSERT statement
+    """
+    now = datetime.utcnow()
+    table = Calculation.__table__
+    remaining = count
+    while remaining > 0:
+        size = min(batch_size, remaining)
+        rows: List[dict] = [random_calculation_row(user_id, now) for _ in range(size)]
+        db.execute(insert(table), rows)
+        remaining -= size
+    db.commit()
+
+
+COPY_COLUMNS = ("id", "user_id", "type", "inputs", "result", "engine_version", "created_at", "updated_at")
+
+
+def copy_calculations(db: Session, rows: Iterable[dict], chunk_size: int = 100_000) -> int:
+    """
+    Stream calculations rows into the table with COPY FROM STDIN.
+
+    Much faster than INSERT for large seeds; rows are buffered and sent
+    chunk_size at a time so memory stays flat.
+
+    Args:
+        db: SQLAlchemy database session (committed at the end)
+        rows: Row dicts as produced by random_calculation_row()
+        chunk_size: Rows per COPY statement
+
+    Returns:
+        int: Number of rows copied
+    """
+    statement = f"COPY calculations ({', '.join(COPY_COLUMNS)}) FROM STDIN WITH (FORMAT csv)"
+    cursor = db.connection().connection.cursor()
+    total = 0
+
+    def flush(buffer: io.StringIO) -> None:
+        buffer.seek(0)
+        cursor.copy_expert(statement, buffer)
+
+    buffer, writer, pending = io.StringIO(), None, 0
+    for row in rows:
+        if writer is None:
+            writer = csv.writer(buffer)
+        values = dict(row, inputs=json.dumps(row["inputs"]))
+        writer.writerow([values[column] for column in COPY_COLUMNS])
+        pending += 1
+        if pending == chunk_size:
+            flush(buffer)
+            total += pending
+            buffer, writer, pending = io.StringIO(), None, 0
+    if pending:
+        flush(buffer)
+        total += pending
+    cursor.close()
+    db.commit()
+    return total
+
+
+def delete_benchmark_user(db: Session, user_id: uuid.UUID) -> None:
+    """Remove a benchmark user and (through ON DELETE CASCADE) its rows."""
+    db.execute(Calculation.__table__.delete().where(Calculation.__table__.c.user_id == user_id))
+    db.execute(User.__table__.delete().where(User.__table__.c.id == user_id))
+    db.commit()
@@ -0,0 +1,87 @@
+# benchmarks/compare.py
+"""
+Compare two pytest-benchmark JSON files and flag regressions.
+
+Each benchmark present in both files is compared on one statistic
+(median by default, which is robust to the odd slow round). A benchmark
+is a regression when it got slower by more than --threshold percent; the
+command then exits with status 1, so it can gate CI.
+
+Usage:
+    python -m benchmarks.compare benchmarks/baselines/micro.json current.json --threshold 10
+"""
+
+import argparse
+import json
+import sys
+from typing import Dict, List
+
+
+def load_stats(path: str, stat: str) -> Dict[str, float]:
+    """Return {benchmark fullname: statistic in seconds} from a pytest-benchmark JSON file."""
+    with open(path) as f:
+        data = json.load(f)
+    return {bench["fullname"]: bench["stats"][stat] for bench in data["benchmarks"]}
+
+
+def compare(baseline: Dict[str, float], current: Dict[str, float], threshold: float) -> List[dict]:
+    """
+    Compare the benchmarks present in both runs.
+
+    Returns:
+        list: One row per benchmark, slowest change first, with the baseline
+        and current values, the change in percent and a regression flag
+    """
+    rows = []
+    for name in baseline.keys() & current.keys():
+        before, after = baseline[name], current[name]
+        change = (after - before) / before * 100 if before else 0.0
+        rows.append({
+            "name": name,
+            "baseline": before,
+            "current": after,
+            "change_percent": round(change, 2),
+            "regression": change > threshold,
+        })
+    return sorted(rows, key=lambda row: row["change_percent"], reverse=True)
+
+
+def format_seconds(value: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if value >= scale:
+            return f"{value / scale:.3f} {unit}"
+    return f"{value / 1e-9:.1f} ns"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("baseline", help="pytest-benchmark JSON of the reference run")
+    parser.add_argument("current", help="pytest-benchmark JSON of the run to check")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Allowed slowdown in percent")
+    parser.add_argument("--stat", default="median", choices=["min", "median", "mean", "max"],
+                        help="Statistic to compare")
+    args = parser.parse_args()
+
+    baseline, current = load_stats(args.baseline, args.stat), load_stats(args.current, args.stat)
+    rows = compare(baseline, current, args.threshold)
+
+    width = max((len(row["name"]) for row in rows), default=10)
+    print(f"{'benchmark':<{width}}  {'baseline':>12}  {'current':>12}  {'change':>9}")
+    for row in rows:
+        flag = "  REGRESSION" if row["regression"] else ""
+        print(
+            f"{row['name']:<{width}}  {format_seconds(row['baseline']):>12}  "
+            f"{format_seconds(row['current']):>12}  {row['change_percent']:>+8.1f}%{flag}"
+        )
+    for name in sorted(baseline.keys() - current.keys()):
+        print(f"missing from current run: {name}")
+    for name in sorted(current.keys() - baseline.keys()):
+        print(f"new (no baseline): {name}")
+
+    regressions = [row for row in rows if row["regression"]]
+    print(f"\n{len(regressions)} of {len(rows)} benchmarks slower than {args.threshold:g}% ({args.stat})")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+# benchmarks/json_response.py
+"""
+Benchmark: JSONResponse (stdlib json) vs. FastJSONResponse (orjson).
+
+Measures the rendering step FastAPI performs after response_model
+serialization, using a list endpoint payload of N CalculationResponse
+objects. No database is needed.
+
+Usage:
+    python -m benchmarks.json_response --rows 10000 --repeat 20
+"""
+
+import argparse
+import json
+import random
+import uuid
+from datetime import datetime
+from typing import List
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from app.core.responses import FastJSONResponse
+from app.schemas.calculation import CalculationResponse
+from benchmarks.common import random_calculation_row, time_call
+
+
+def build_payload(rows: int) -> list:
+    """Build the content FastAPI passes to the response class for a list."""
+    user_id = uuid.uuid4()
+    now = datetime.utcnow()
+    adapter = TypeAdapter(List[CalculationResponse])
+    data = [random_calculation_row(user_id, now) for _ in range(rows)]
+    return adapter.dump_python(adapter.validate_python(data), mode="json")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10_000, help="Calculations in the list payload")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed runs per response class")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for the payload")
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    content = build_payload(args.rows)
+    # Random divisions produce tiny floats, where only the exponent spelling
+    # differs (1e-09 vs 1e-9), so compare the decoded values here.
+    assert json.loads(JSONResponse(content).body) == json.loads(FastJSONResponse(content).body)
+
+    results = {
+        "rows": args.rows,
+        "bytes": len(FastJSONResponse(content).body),
+        "json_response": time_call(lambda: JSONResponse(content), args.repeat),
+        "fast_json_response": time_call(lambda: FastJSONResponse(content), args.repeat),
+    }
+    results["speedup"] = round(
+        results["json_response"]["median_ms"] / results["fast_json_response"]["median_ms"], 2
+    )
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
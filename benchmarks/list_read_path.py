@@ -0,0 +1,76 @@
+# benchmarks/list_read_path.py
+"""
+Benchmark: ORM list path vs. ORM-free Core read path.
+
+Compares, for one user with N calculations (10k by default):
+- orm: db.query(Calculation) -> List[CalculationResponse] -> JSON
+  (what list_calculations did before, including response_model validation)
+- core: select() tuples -> orjson bytes (app.queries.calculation)
+
+Usage:
+    python -m benchmarks.list_read_path --rows 10000 --repeat 5
+"""
+
+import argparse
+import json
+from typing import List
+
+from pydantic import TypeAdapter
+
+from app.database import Base, SessionLocal, engine
+from app.models.calculation import Calculation
+from app.queries.calculation import fetch_user_calculations_json
+from app.schemas.calculation import CalculationResponse
+from benchmarks.common import (
+    create_benchmark_user,
+    delete_benchmark_user,
+    seed_calculations,
+    time_call,
+)
+
+response_adapter = TypeAdapter(List[CalculationResponse])
+
+
+def orm_path(db, user_id) -> bytes:
+    """The previous list_calculations path: ORM load + response_model."""
+    calculations = db.query(Calculation).filter(Calculation.user_id == user_id).all()
+    body = response_adapter.dump_json(response_adapter.validate_python(calculations))
+    db.expunge_all()  # don't let the identity map make later runs cheaper
+    return body
+
+
+def core_path(db, user_id) -> bytes:
+    """The ORM-free read path."""
+    return fetch_user_calculations_json(db, user_id)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10_000, help="Calculations to seed")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per path")
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    user = create_benchmark_user(db)
+    try:
+        seed_calculations(db, user.id, args.rows)
+
+        # Warm up both paths once (connection, statement cache)
+        assert orm_path(db, user.id) == core_path(db, user.id)
+
+        results = {
+            "rows": args.rows,
+            "orm": time_call(lambda: orm_path(db, user.id), args.repeat),
+            "core": time_call(lambda: core_path(db, user.id), args.repeat),
+        }
+        results["speedup"] = round(results["orm"]["median_ms"] / results["core"]["median_ms"], 2)
+        print(json.dumps(results, indent=2))
+    finally:
+        db.rollback()
+        delete_benchmark_user(db, user.id)
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
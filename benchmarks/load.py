@@ -0,0 +1,313 @@
+# benchmarks/load.py
+"""
+Load test: synthetic users driving the auth and calculations BREAD endpoints.
+
+1. Registers --users users through POST /auth/register and logs them in
+   through POST /auth/login (both timed and reported like any other route)
+2. For --duration seconds, starts requests at --rps (open loop: a slow
+   server does not slow the arrival rate down) with a weighted --mix of
+   create / list / get / update / delete on /calculations. Each request
+   is made by a random user on their own calculations.
+3. Prints a JSON report with throughput and p50/p95/p99 latency per route
+
+Latency is measured from the moment a request was scheduled, so time
+spent waiting for a free connection (--concurrency) counts too; otherwise
+a saturated server would hide its queueing delay (coordinated omission).
+
+Run it against a local uvicorn and Postgres, and keep the JSON to compare
+builds:
+
+    uvicorn app.main:app --workers 4 &
+    python -m benchmarks.load --users 50 --rps 200 --duration 30 > before.json
+
+or let the script start (and stop) the server itself:
+
+    python -m benchmarks.load --start-server --workers 4 --label my-branch
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import subprocess
+import sys
+import time
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import httpx
+
+from benchmarks.common import CALCULATION_TYPES
+
+DEFAULT_MIX = "create=30,list=30,get=25,update=10,delete=5"
+PASSWORD = "LoadTest123!"
+
+# Route templates used as report keys
+ROUTES = {
+    "register": "POST /auth/register",
+    "login": "POST /auth/login",
+    "create": "POST /calculations",
+    "list": "GET /calculations",
+    "get": "GET /calculations/{calc_id}",
+    "update": "PUT /calculations/{calc_id}",
+    "delete": "DELETE /calculations/{calc_id}",
+}
+
+
+@dataclass
+class VirtualUser:
+    """A registered user, their bearer header and the calculations they own (id -> type)."""
+    username: str
+    headers: Dict[str, str] = field(default_factory=dict)
+    calculations: Dict[str, str] = field(default_factory=dict)
+
+
+class Recorder:
+    """Latencies (ms), status codes and errors per route."""
+
+    def __init__(self) -> None:
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.statuses: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self.errors: Dict[str, int] = defaultdict(int)
+
+    def record(self, route: str, milliseconds: float, status: Optional[int]) -> None:
+        self.latencies[route].append(milliseconds)
+        self.statuses[route][str(status) if status is not None else "connection_error"] += 1
+        if status is None or status >= 400:
+            self.errors[route] += 1
+
+    def report(self, elapsed: float) -> Dict[str, dict]:
+        return {
+            route: {
+                "count": len(latencies),
+                "errors": self.errors[route],
+                "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+                **latency_summary(latencies),
+                "statuses": dict(self.statuses[route]),
+            }
+            for route, latencies in sorted(self.latencies.items())
+        }
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def latency_summary(latencies: List[float]) -> Dict[str, float]:
+    ordered = sorted(latencies)
+    return {
+        "p50_ms": round(percentile(ordered, 0.50), 3),
+        "p95_ms": round(percentile(ordered, 0.95), 3),
+        "p99_ms": round(percentile(ordered, 0.99), 3),
+        "max_ms": round(ordered[-1], 3) if ordered else 0.0,
+    }
+
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    """Parse "create=30,list=30,..." into operation weights."""
+    weights = {}
+    for part in mix.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in ("create", "list", "get", "update", "delete"):
+            raise argparse.ArgumentTypeError(f"Unknown operation in --mix: {name!r}")
+        weights[name] = float(weight)
+    if not any(weights.values()):
+        raise argparse.ArgumentTypeError("--mix needs at least one positive weight")
+    return weights
+
+
+def random_inputs(calc_type: str) -> List[float]:
+    if calc_type == "lcm":
+        return [random.randint(1, 500), random.randint(1, 500)]  # LCM takes exactly two integers
+    if calc_type == "division":
+        return [round(random.uniform(1, 1000), 2) for _ in range(random.randint(2, 4))]
+    return [round(random.uniform(-1000, 1000), 2) for _ in range(random.randint(2, 5))]
+
+
+class LoadTest:
+    """
+    Drives one load test run.
+
+    Args:
+        client: httpx client pointed at the server
+        concurrency: Maximum requests in flight
+    """
+
+    def __init__(self, client: httpx.AsyncClient, concurrency: int) -> None:
+        self.client = client
+        self.recorder = Recorder()
+        self.slots = asyncio.Semaphore(concurrency)
+        self.users: List[VirtualUser] = []
+
+    async def request(self, operation: str, method: str, url: str, scheduled: float, **kwargs) -> Optional[httpx.Response]:
+        """Send a request once a slot is free; latency counts from `scheduled`."""
+        async with self.slots:
+            try:
+                response = await self.client.request(method, url, **kwargs)
+            except httpx.HTTPError:
+                response = None
+        self.recorder.record(
+            ROUTES[operation], (time.perf_counter() - scheduled) * 1000,
+            response.status_code if response is not None else None,
+        )
+        return response
+
+    async def setup_user(self, run_id: str, index: int) -> Optional[VirtualUser]:
+        user = VirtualUser(username=f"load_{run_id}_{index}")
+        await self.request("register", "POST", "/auth/register", time.perf_counter(), json={
+            "first_name": "Load", "last_name": "Test", "email": f"{user.username}@example.com",
+            "username": user.username, "password": PASSWORD, "confirm_password": PASSWORD,
+        })
+        response = await self.request("login", "POST", "/auth/login", time.perf_counter(), json={
+            "username": user.username, "password": PASSWORD,
+        })
+        if response is None or response.status_code != 200:
+            return None
+        user.headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+        return user
+
+    async def setup(self, count: int) -> None:
+        run_id = uuid.uuid4().hex[:8]
+        users = await asyncio.gather(*(self.setup_user(run_id, i) for i in range(count)))
+        self.users = [user for user in users if user is not None]
+        if not self.users:
+            raise RuntimeError("No user could register and log in; is the server running?")
+
+    async def operation(self, name: str, scheduled: float) -> None:
+        user = random.choice(self.users)
+        if name in ("get", "update", "delete") and not user.calculations:
+            name = "create"  # Nothing to read or change yet
+
+        if name == "create":
+            calc_type = random.choice(CALCULATION_TYPES)
+            response = await self.request("create", "POST", "/calculations", scheduled, headers=user.headers,
+                                          json={"type": calc_type, "inputs": random_inputs(calc_type)})
+            if response is not None and response.status_code == 201:
+                user.calculations[response.json()["id"]] = calc_type
+        elif name == "list":
+            await self.request("list", "GET", "/calculations", scheduled, headers=user.headers)
+        elif name == "get":
+            calc_id = random.choice(list(user.calculations))
+            await self.request("get", "GET", f"/calculations/{calc_id}", scheduled, headers=user.headers)
+        elif name == "update":
+            calc_id = random.choice(list(user.calculations))
+            await self.request("update", "PUT", f"/calculations/{calc_id}", scheduled, headers=user.headers,
+                               json={"inputs": random_inputs(user.calculations[calc_id])})
+        else:
+            calc_id = random.choice(list(user.calculations))
+            del user.calculations[calc_id]
+            await self.request("delete", "DELETE", f"/calculations/{calc_id}", scheduled, headers=user.headers)
+
+    async def drive(self, weights: Dict[str, float], rps: float, duration: float) -> float:
+        """Start operations at a fixed arrival rate; return the elapsed seconds."""
+        names, cumulative = list(weights), list(weights.values())
+        tasks = set()
+        start = time.perf_counter()
+        sent = 0
+        while True:
+            scheduled = start + sent / rps
+            if scheduled - start >= duration:
+                break
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            name = random.choices(names, weights=cumulative)[0]
+            task = asyncio.create_task(self.operation(name, scheduled))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            sent += 1
+        if tasks:
+            await asyncio.gather(*tasks)
+        return time.perf_counter() - start
+
+
+async def run(args: argparse.Namespace) -> dict:
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=args.timeout) as client:
+        test = LoadTest(client, args.concurrency)
+        setup_start = time.perf_counter()
+        await test.setup(args.users)
+        setup_elapsed = time.perf_counter() - setup_start
+        auth_report = test.recorder.report(setup_elapsed)
+
+        test.recorder = Recorder()
+        elapsed = await test.drive(args.mix, args.rps, args.duration)
+        routes = test.recorder.report(elapsed)
+
+    total = sum(route["count"] for route in routes.values())
+    all_latencies = [latency for latencies in test.recorder.latencies.values() for latency in latencies]
+    return {
+        "label": args.label,
+        "base_url": args.base_url,
+        "users": len(test.users),
+        "target_rps": args.rps,
+        "concurrency": args.concurrency,
+        "mix": args.mix,
+        "duration_seconds": round(elapsed, 3),
+        "requests": total,
+        "throughput_rps": round(total / elapsed, 2),
+        "errors": sum(route["errors"] for route in routes.values()),
+        "latency": latency_summary(all_latencies),
+        "routes": {**auth_report, **routes},
+    }
+
+
+def start_server(base_url: str, workers: int) -> subprocess.Popen:
+    """Start uvicorn on base_url's port and wait until /health answers."""
+    url = httpx.URL(base_url)
+    process = subprocess.Popen([
+        sys.executable, "-m", "uvicorn", "app.main:app",
+        "--host", url.host, "--port", str(url.port or 80), "--workers", str(workers), "--log-level", "warning",
+    ], stdout=sys.stderr)  # Keep stdout for the JSON report
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{base_url}/health", timeout=1).status_code == 200:
+                return process
+        except httpx.HTTPError:
+            pass
+        if process.poll() is not None:
+            break
+        time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError(f"uvicorn did not become healthy at {base_url}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000", help="Server to load")
+    parser.add_argument("--users", type=int, default=20, help="Synthetic users to register and log in")
+    parser.add_argument("--rps", type=float, default=100, help="Target request rate (arrivals per second)")
+    parser.add_argument("--duration", type=float, default=30, help="Seconds of load after setup")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix(DEFAULT_MIX),
+                        help=f"Operation weights (default: {DEFAULT_MIX})")
+    parser.add_argument("--concurrency", type=int, default=100, help="Maximum requests in flight")
+    parser.add_argument("--timeout", type=float, default=30, help="Per-request timeout in seconds")
+    parser.add_argument("--seed", type=int, help="Random seed, for repeatable operation sequences")
+    parser.add_argument("--label", help="Free-form build label copied into the report")
+    parser.add_argument("--start-server", action="store_true", help="Start uvicorn at --base-url for the run")
+    parser.add_argument("--workers", type=int, default=4, help="uvicorn workers with --start-server")
+    args = parser.parse_args()
+
+    if args.seed is not None:
+        random.seed(args.seed)
+    server = start_server(args.base_url, args.workers) if args.start_server else None
+    try:
+        report = asyncio.run(run(args))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=10)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
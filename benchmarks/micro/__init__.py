@@ -0,0 +1,15 @@
+# benchmarks/micro/__init__.py
+"""
+Micro-benchmarks of the CPU hot paths, written for pytest-benchmark.
+
+They need no database or Redis and are not part of the test suite
+(testpaths in pytest.ini only covers tests/). Coverage tracing distorts
+timings, so always run them with --no-cov:
+
+    pytest benchmarks/micro --no-cov --benchmark-json=benchmarks/baselines/micro.json
+    pytest benchmarks/micro --no-cov --benchmark-json=current.json
+    python -m benchmarks.compare benchmarks/baselines/micro.json current.json --threshold 10
+
+(`make bench-baseline` and `make bench-check` do the same.) Baselines
+depend on the machine; record and compare them on the same hardware.
+"""
@@ -0,0 +1,48 @@
+# benchmarks/micro/test_auth.py
+"""
+JWT round trips and bcrypt verification (at the configured BCRYPT_ROUNDS).
+
+decode_token() also asks Redis whether the token was revoked. That network
+round trip is what benchmarks.load measures; here it is replaced by a
+local answer so only the JWT work is timed.
+"""
+
+import asyncio
+import uuid
+
+import pytest
+
+import app.auth.jwt as jwt_module
+from app.auth.jwt import create_token, decode_token, get_password_hash, pwd_context
+from app.schemas.token import TokenType
+
+
+@pytest.fixture
+def without_blacklist(monkeypatch):
+    async def never_blacklisted(jti: str) -> bool:
+        return False
+    monkeypatch.setattr(jwt_module, "is_blacklisted", never_blacklisted)
+
+
+def test_create_token(benchmark):
+    user_id = uuid.uuid4()
+    assert benchmark(create_token, user_id, TokenType.ACCESS)
+
+
+def test_token_round_trip(benchmark, without_blacklist):
+    user_id = uuid.uuid4()
+    loop = asyncio.new_event_loop()
+
+    def round_trip():
+        token = create_token(user_id, TokenType.ACCESS)
+        return loop.run_until_complete(decode_token(token, TokenType.ACCESS))
+
+    try:
+        assert benchmark(round_trip)["sub"] == str(user_id)
+    finally:
+        loop.close()
+
+
+def test_password_verify(benchmark):
+    hashed = get_password_hash("SecurePass123!")
+    assert benchmark(pwd_context.verify, "SecurePass123!", hashed)
@@ -0,0 +1,30 @@
+# benchmarks/micro/test_evaluation.py
+"""
+get_result() of every Calculation subclass, from 2 to 1e6 inputs.
+
+LCM is only defined for exactly two integers, so its "size" is the
+magnitude of the operands instead of their count.
+"""
+
+import pytest
+
+from app.models.calculation import Calculation
+
+SIZES = [2, 100, 10_000, 1_000_000]
+
+
+def make_inputs(calculation_type: str, size: int) -> list:
+    if calculation_type == "lcm":
+        return [size - 1 if size > 2 else 2, size + 1]
+    if calculation_type in ("multiplication", "division"):
+        return [1.5] + [1.000001] * (size - 1)  # Stays finite for any size
+    return [float(i % 1000) for i in range(size)]
+
+
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("calculation_type", ["addition", "subtraction", "multiplication", "division", "lcm"])
+def test_get_result(benchmark, calculation_type, size):
+    calculation = Calculation.create(calculation_type, None, make_inputs(calculation_type, size))
+    benchmark.group = f"get_result[{calculation_type}]"
+    result = benchmark(calculation.get_result)
+    assert result is not None
@@ -0,0 +1,58 @@
+# benchmarks/micro/test_serialization.py
+"""
+Serializing lists of calculations for a response.
+
+- response_model: what FastAPI does for List[CalculationResponse]
+  (validate from ORM attributes, dump to JSON-able values, encode)
+- core_rows: the ORM-free path of GET /calculations (dump_calculation_rows)
+"""
+
+import uuid
+from datetime import datetime, timezone
+from typing import List
+
+import pytest
+from pydantic import TypeAdapter
+
+from app.core.responses import dumps_json
+from app.models.calculation import Calculation
+from app.queries.calculation import dump_calculation_rows
+from app.schemas.calculation import CalculationResponse
+
+SIZES = [10, 1_000]
+
+response_adapter = TypeAdapter(List[CalculationResponse])
+
+
+def make_calculations(count: int) -> List[Calculation]:
+    user_id, now = uuid.uuid4(), datetime.now(timezone.utc)
+    calculations = []
+    for i in range(count):
+        calculation = Calculation.create("addition", user_id, [float(i), 2.5])
+        calculation.id = uuid.uuid4()
+        calculation.result = calculation.get_result()
+        calculation.created_at = calculation.updated_at = now
+        calculations.append(calculation)
+    return calculations
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_response_model(benchmark, size):
+    calculations = make_calculations(size)
+
+    def serialize():
+        validated = response_adapter.validate_python(calculations, from_attributes=True)
+        return dumps_json(response_adapter.dump_python(validated, mode="json"))
+
+    benchmark.group = f"serialize[{size}]"
+    assert benchmark(serialize).startswith(b"[{")
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_core_rows(benchmark, size):
+    rows = [
+        (c.type, c.inputs, c.id, c.user_id, c.created_at, c.updated_at, c.result)
+        for c in make_calculations(size)
+    ]
+    benchmark.group = f"serialize[{size}]"
+    assert benchmark(dump_calculation_rows, rows).startswith(b"[{")
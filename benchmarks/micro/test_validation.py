@@ -0,0 +1,22 @@
+# benchmarks/micro/test_validation.py
+"""Request schema validation: CalculationBase at several input counts, and UserCreate."""
+
+import pytest
+
+from app.schemas.calculation import CalculationBase
+from app.schemas.user import UserCreate
+
+
+@pytest.mark.parametrize("size", [2, 100, 10_000])
+def test_calculation_base(benchmark, size):
+    payload = {"type": "division", "inputs": [100.0] + [2.0] * (size - 1)}
+    benchmark.group = "validate[CalculationBase]"
+    assert benchmark(CalculationBase.model_validate, payload).type == "division"
+
+
+def test_user_create(benchmark):
+    payload = {
+        "first_name": "Bench", "last_name": "User", "email": "bench@example.com",
+        "username": "benchuser", "password": "SecurePass123!", "confirm_password": "SecurePass123!",
+    }
+    assert benchmark(UserCreate.model_validate, payload).username == "benchuser"
@@ -0,0 +1,136 @@
+# benchmarks/partitioning.py
+"""
+Benchmark: calculations as one heap vs. hash-partitioned by user_id.
+
+Seeds N calculations (10M by default) spread evenly over U users with COPY,
+then measures, before and after running the partitioning migration
+(migrations/versions/9b2f4c7d1e30_*.py):
+- list: the list_calculations read path for one user (Core select -> JSON)
+- insert: one ORM insert + commit, as create_calculation does
+
+The calculations table must be a plain (unpartitioned) table to start with.
+The migration is downgraded again at the end unless --keep-partitioned is
+given. Seeded users and rows are removed afterwards.
+
+Usage:
+    python -m benchmarks.partitioning --rows 10000000 --users 1000 --partitions 16
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import random
+from datetime import datetime
+from pathlib import Path
+
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from sqlalchemy import text
+
+from app.database import Base, SessionLocal, engine
+from app.models.calculation import Calculation
+from app.queries.calculation import fetch_user_calculations_json
+from benchmarks.common import (
+    copy_calculations,
+    create_benchmark_user,
+    delete_benchmark_user,
+    random_calculation_row,
+    time_call,
+)
+
+MIGRATION_PATH = next(Path(__file__).resolve().parent.parent.glob("migrations/versions/9b2f4c7d1e30_*.py"))
+
+
+def load_migration():
+    """Import the partitioning migration module from its file."""
+    spec = importlib.util.spec_from_file_location("partition_migration", MIGRATION_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_migration(step) -> None:
+    """Run a migration's upgrade() or downgrade() outside the alembic command."""
+    with engine.connect() as conn:
+        context = MigrationContext.configure(conn)
+        with Operations.context(context), context.begin_transaction():
+            step()
+        conn.commit()
+
+
+def is_partitioned() -> bool:
+    with engine.connect() as conn:
+        return bool(conn.execute(text(
+            "SELECT count(*) FROM pg_partitioned_table WHERE partrelid = 'calculations'::regclass"
+        )).scalar())
+
+
+def measure(db, user_ids, repeat):
+    """Time the list and insert paths for randomly chosen users."""
+    def list_one():
+        fetch_user_calculations_json(db, random.choice(user_ids))
+
+    def insert_one():
+        calc = Calculation.create("addition", random.choice(user_ids), [1, 2])
+        calc.result = calc.get_result()
+        db.add(calc)
+        db.commit()
+
+    list_one()  # Warm up (connection, statement cache)
+    return {
+        "list": time_call(list_one, repeat),
+        "insert": time_call(insert_one, repeat),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10_000_000, help="Calculations to seed")
+    parser.add_argument("--users", type=int, default=1000, help="Users the rows are spread over")
+    parser.add_argument("--partitions", type=int, default=16, help="Hash partitions to create")
+    parser.add_argument("--repeat", type=int, default=50, help="Timed runs per path")
+    parser.add_argument("--keep-partitioned", action="store_true", help="Skip the final downgrade")
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+    if is_partitioned():
+        parser.error("calculations is already partitioned; downgrade the migration first")
+
+    migration = load_migration()
+    os.environ["CALCULATION_PARTITIONS"] = str(args.partitions)
+    db = SessionLocal()
+    user_ids = [create_benchmark_user(db).id for _ in range(args.users)]
+    partitioned = False
+    try:
+        now = datetime.utcnow()
+        copy_calculations(db, (
+            random_calculation_row(user_ids[i % len(user_ids)], now) for i in range(args.rows)
+        ))
+        db.execute(text("ANALYZE calculations"))
+        db.commit()
+
+        results = {"rows": args.rows, "users": args.users, "partitions": args.partitions}
+        results["heap"] = measure(db, user_ids, args.repeat)
+        db.close()
+
+        run_migration(migration.upgrade)
+        partitioned = True
+        db = SessionLocal()
+        db.execute(text("ANALYZE calculations"))
+        db.commit()
+        results["partitioned"] = measure(db, user_ids, args.repeat)
+        print(json.dumps(results, indent=2))
+    finally:
+        db.rollback()
+        db.close()
+        if partitioned and not args.keep_partitioned:
+            run_migration(migration.downgrade)
+        db = SessionLocal()
+        for user_id in user_ids:
+            delete_benchmark_user(db, user_id)
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
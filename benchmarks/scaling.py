@@ -0,0 +1,235 @@
+# benchmarks/scaling.py
+"""
+Benchmark: read latency against data volume, with and without indexes.
+
+Grows the calculations table through --sizes (1k, 100k and 10M rows by
+default) with COPY. Rows are spread over --users users with a Zipf-like
+skew, so the first user owns far more rows than the median one. After each
+size is reached the table is analyzed and these reads are timed, for the
+heaviest and for the median user:
+- list: the list_calculations read path (Core select -> JSON)
+- get: the get_calculation lookup (hot + archive UNION ALL by id)
+- filter: the user's calculations of one type
+- page: the user's newest --page-size calculations
+- stats: count and average result per type for the user
+
+The API has no filter, pagination or stats endpoint yet; those three are
+timed as the Core queries such endpoints would run, so new indexes can be
+judged before the endpoints exist.
+
+Each read is timed under every index set in --indexes:
+- none: without the model's secondary indexes (the primary key stays)
+- model: the indexes the model declares (user_id, type)
+- composite: model plus (user_id, created_at DESC, id DESC) and (user_id, type)
+
+Index changes are made inside a transaction that is rolled back after
+timing, so the table always ends up with the model's indexes. DROP INDEX
+locks the table for the whole transaction: run this against a scratch
+database. Seeded users and rows are removed at the end.
+
+Usage:
+    python -m benchmarks.scaling --sizes 1000,100000,10000000 --users 1000 --skew 1.0
+    python -m benchmarks.scaling --sizes 1000,100000 --indexes none,model --json
+"""
+
+import argparse
+import itertools
+import json
+import random
+import uuid
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List
+
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import Session
+
+from app.database import Base, SessionLocal, engine
+from app.queries.calculation import (
+    calculations_table,
+    fetch_user_calculation_row,
+    fetch_user_calculations_json,
+    select_user_calculations,
+)
+from benchmarks.common import (
+    CALCULATION_TYPES,
+    copy_calculations,
+    create_benchmark_user,
+    delete_benchmark_user,
+    random_calculation_row,
+    time_call,
+)
+
+# DDL applied (and rolled back) around the timed reads of each index set
+INDEX_SETS: Dict[str, List[str]] = {
+    "none": [
+        "DROP INDEX ix_calculations_user_id",
+        "DROP INDEX ix_calculations_type",
+    ],
+    "model": [],
+    "composite": [
+        "CREATE INDEX bench_calculations_user_created ON calculations (user_id, created_at DESC, id DESC)",
+        "CREATE INDEX bench_calculations_user_type ON calculations (user_id, type)",
+    ],
+}
+
+OPERATIONS = ("list", "get", "filter", "page", "stats")
+
+
+def parse_sizes(value: str) -> List[int]:
+    """Parse "1000,100000" into ascending table sizes."""
+    sizes = [int(part) for part in value.split(",")]
+    if sizes != sorted(set(sizes)) or sizes[0] <= 0:
+        raise argparse.ArgumentTypeError("--sizes must be positive and strictly ascending")
+    return sizes
+
+
+def parse_index_sets(value: str) -> List[str]:
+    names = [part.strip() for part in value.split(",")]
+    unknown = [name for name in names if name not in INDEX_SETS]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"Unknown index set(s): {', '.join(unknown)}")
+    return names
+
+
+def skewed_owners(user_ids: List[uuid.UUID], skew: float, chunk_size: int = 10_000) -> Iterator[uuid.UUID]:
+    """Endless owners drawn with weight 1 / rank**skew (rank 1 is user_ids[0])."""
+    cum_weights = list(itertools.accumulate(1 / rank ** skew for rank in range(1, len(user_ids) + 1)))
+    while True:
+        yield from random.choices(user_ids, cum_weights=cum_weights, k=chunk_size)
+
+
+def grow(db: Session, owners: Iterator[uuid.UUID], count: int) -> None:
+    """COPY `count` more random calculations into the table, then analyze it."""
+    now = datetime.utcnow()
+    copy_calculations(db, (random_calculation_row(next(owners), now) for _ in range(count)))
+    db.execute(text("ANALYZE calculations"))
+    db.commit()
+
+
+def read_operations(db: Session, user_id: uuid.UUID, calc_ids: List[uuid.UUID], page_size: int) -> Dict[str, Callable[[], object]]:
+    """The timed reads for one user, as zero-argument callables."""
+    table = calculations_table
+
+    def filter_by_type():
+        calc_type = random.choice(CALCULATION_TYPES)
+        return db.execute(select_user_calculations(user_id).where(table.c.type == calc_type)).all()
+
+    def newest_page():
+        return db.execute(
+            select_user_calculations(user_id).order_by(table.c.created_at.desc(), table.c.id.desc()).limit(page_size)
+        ).all()
+
+    def stats_by_type():
+        return db.execute(
+            select(table.c.type, func.count(), func.avg(table.c.result))
+            .where(table.c.user_id == user_id)
+            .group_by(table.c.type)
+        ).all()
+
+    return {
+        "list": lambda: fetch_user_calculations_json(db, user_id),
+        "get": lambda: fetch_user_calculation_row(db, user_id, random.choice(calc_ids)),
+        "filter": filter_by_type,
+        "page": newest_page,
+        "stats": stats_by_type,
+    }
+
+
+def measure(index_set: str, users: Dict[str, uuid.UUID], repeat: int, page_size: int) -> Dict[str, Dict[str, dict]]:
+    """
+    Time every read for every tracked user under one index set.
+
+    Returns:
+        dict: {operation: {user label: time_call() summary}}
+    """
+    results: Dict[str, Dict[str, dict]] = {operation: {} for operation in OPERATIONS}
+    with engine.connect() as conn:
+        transaction = conn.begin()
+        try:
+            for statement in INDEX_SETS[index_set]:
+                conn.execute(text(statement))
+            db = Session(bind=conn)
+            for label, user_id in users.items():
+                calc_ids = db.execute(
+                    select(calculations_table.c.id).where(calculations_table.c.user_id == user_id).limit(1000)
+                ).scalars().all() or [uuid.uuid4()]  # A user without rows times the miss
+                for operation, read in read_operations(db, user_id, calc_ids, page_size).items():
+                    read()  # Warm up (statement cache, buffers)
+                    results[operation][label] = time_call(read, repeat)
+            db.close()
+        finally:
+            transaction.rollback()
+    return results
+
+
+def format_table(results: dict, sizes: List[int], index_sets: List[str], users: List[str]) -> str:
+    """Render the median latencies as one row per (indexes, operation, user) and one column per size."""
+    header = ["indexes", "operation", "user"] + [f"{size:,} rows" for size in sizes]
+    lines = [header]
+    for index_set, operation, user in itertools.product(index_sets, OPERATIONS, users):
+        cells = [f"{results[str(size)][index_set][operation][user]['median_ms']:.3f} ms" for size in sizes]
+        lines.append([index_set, operation, user] + cells)
+    widths = [max(len(line[i]) for line in lines) for i in range(len(header))]
+    return "\n".join(
+        "  ".join(cell.ljust(width) if i < 3 else cell.rjust(width) for i, (cell, width) in enumerate(zip(line, widths)))
+        for line in lines
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=parse_sizes, default=[1_000, 100_000, 10_000_000],
+                        help="Table sizes to measure at, ascending (rows are added between sizes)")
+    parser.add_argument("--users", type=int, default=1000, help="Users the rows are spread over")
+    parser.add_argument("--skew", type=float, default=1.0, help="Zipf exponent of rows per user (0 = even)")
+    parser.add_argument("--indexes", type=parse_index_sets, default=list(INDEX_SETS),
+                        help=f"Comma-separated index sets to compare (default: {','.join(INDEX_SETS)})")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per read")
+    parser.add_argument("--page-size", type=int, default=20, help="Rows per page for the page read")
+    parser.add_argument("--seed", type=int, help="Random seed, for a repeatable data set")
+    parser.add_argument("--json", action="store_true", help="Print the full results as JSON instead of a table")
+    args = parser.parse_args()
+
+    if args.seed is not None:
+        random.seed(args.seed)
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    user_ids = [create_benchmark_user(db).id for _ in range(args.users)]
+    users = {"heaviest": user_ids[0], "median": user_ids[len(user_ids) // 2]}
+    owners = skewed_owners(user_ids, args.skew)
+    results: dict = {}
+    try:
+        seeded = 0
+        for size in args.sizes:
+            grow(db, owners, size - seeded)
+            seeded = size
+            counts = dict(db.execute(
+                select(calculations_table.c.user_id, func.count())
+                .where(calculations_table.c.user_id.in_(users.values()))
+                .group_by(calculations_table.c.user_id)
+            ).all())
+            db.commit()  # Release the table lock before the index DDL
+            results[str(size)] = {
+                "user_rows": {label: counts.get(user_id, 0) for label, user_id in users.items()},
+                **{index_set: measure(index_set, users, args.repeat, args.page_size) for index_set in args.indexes},
+            }
+
+        if args.json:
+            print(json.dumps({
+                "sizes": args.sizes, "users": args.users, "skew": args.skew, "results": results,
+            }, indent=2))
+        else:
+            for size in args.sizes:
+                rows = results[str(size)]["user_rows"]
+                print(f"{size:,} rows: heaviest user owns {rows['heaviest']:,}, median user {rows['median']:,}")
+            print()
+            print(format_table(results, args.sizes, args.indexes, list(users)))
+    finally:
+        db.rollback()
+        for user_id in user_ids:
+            delete_benchmark_user(db, user_id)
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+# benchmarks/write_buffer.py
+"""
+Benchmark: one commit per insert vs. the group-commit write buffer.
+
+T threads each create N calculations, like T concurrent create_calculation
+requests:
+- direct: ORM add + commit per row (what create_calculation does by default)
+- buffered: GroupCommitBuffer.submit(row).result() (WRITE_BUFFER_ENABLED)
+
+Reports throughput (rows/s) and per-insert latency for both.
+
+Usage:
+    python -m benchmarks.write_buffer --threads 32 --rows-per-thread 200
+"""
+
+import argparse
+import json
+import statistics
+import threading
+import time
+
+from app.core.write_buffer import GroupCommitBuffer
+from app.database import Base, SessionLocal, engine
+from app.models.calculation import Calculation
+from benchmarks.common import create_benchmark_user, delete_benchmark_user
+
+
+def direct_insert(user_id) -> None:
+    db = SessionLocal()
+    try:
+        calc = Calculation.create("addition", user_id, [1, 2])
+        calc.result = calc.get_result()
+        db.add(calc)
+        db.commit()
+    finally:
+        db.close()
+
+
+def run(threads: int, rows_per_thread: int, insert_one) -> dict:
+    """Run insert_one from many threads and summarize throughput/latency."""
+    latencies = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(threads + 1)
+
+    def worker():
+        local = []
+        barrier.wait()
+        for _ in range(rows_per_thread):
+            start = time.perf_counter()
+            insert_one()
+            local.append((time.perf_counter() - start) * 1000)
+        with lock:
+            latencies.extend(local)
+
+    pool = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in pool:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in pool:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "rows_per_second": round(len(latencies) / elapsed, 1),
+        "median_ms": round(statistics.median(latencies), 3),
+        "p99_ms": round(latencies[int(len(latencies) * 0.99) - 1], 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=32, help="Concurrent writers")
+    parser.add_argument("--rows-per-thread", type=int, default=200, help="Inserts per writer")
+    parser.add_argument("--max-rows", type=int, default=100, help="Buffer flush size")
+    parser.add_argument("--max-delay-ms", type=float, default=5.0, help="Buffer flush delay")
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    user = create_benchmark_user(db)
+    buffer = GroupCommitBuffer(SessionLocal, Calculation.__table__, args.max_rows, args.max_delay_ms)
+    row = {"user_id": user.id, "type": "addition", "inputs": [1, 2], "result": 3.0}
+    try:
+        results = {
+            "threads": args.threads,
+            "rows": args.threads * args.rows_per_thread,
+            "direct": run(args.threads, args.rows_per_thread, lambda: direct_insert(user.id)),
+            "buffered": run(args.threads, args.rows_per_thread, lambda: buffer.submit(row).result()),
+        }
+        results["buffered"]["mean_batch_size"] = round(buffer.rows / buffer.batches, 1)
+        results["speedup"] = round(
+            results["buffered"]["rows_per_second"] / results["direct"]["rows_per_second"], 2
+        )
+        print(json.dumps(results, indent=2))
+    finally:
+        buffer.stop()
+        delete_benchmark_user(db, user.id)
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""partition calculations by user_id
+
+Revision ID: 9b2f4c7d1e30
+Revises: 62764213f456
+Create Date: 2026-10-19 09:30:00.000000
+
+Converts calculations into a table hash-partitioned by user_id, without
+taking the application offline for the copy:
+
+1. Create calculations_partitioned (same columns, PARTITION BY HASH
+   (user_id)) with N partitions calculations_p0 .. calculations_p<N-1>
+2. Install a trigger that mirrors every INSERT/UPDATE/DELETE on the old
+   table into the new one, so writes made during the copy are not lost
+3. Copy existing rows in keyset-ordered batches, each committed on its own
+   (autocommit), so no long transaction holds back vacuum
+4. Swap: under an ACCESS EXCLUSIVE lock, reconcile the two tables, drop the
+   old one and rename the new table, constraints and indexes into place
+
+Postgres requires the partition key in every unique constraint, so the
+primary key becomes (id, user_id). The Calculation model keeps mapping id
+as its primary key and works unchanged; every query in app/main.py also
+filters by user_id, so they are pruned to a single partition.
+
+Options (alembic -x takes precedence over the environment):
+    alembic -x partitions=32 -x batch_size=50000 upgrade head
+    CALCULATION_PARTITIONS=32 CALCULATION_COPY_BATCH_SIZE=50000 alembic upgrade head
+
+The downgrade copies the rows back into a plain table in one transaction
+(it is not online).
+"""
+import os
+from typing import List, Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b2f4c7d1e30'
+down_revision: Union[str, Sequence[str], None] = '62764213f456'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE = "calculations"
+NEW_TABLE = "calculations_partitioned"
+OLD_TABLE = "calculations_unpartitioned"
+MIRROR = "calculations_mirror"
+DEFAULT_PARTITIONS = 16
+DEFAULT_BATCH_SIZE = 20_000
+MIN_UUID = "00000000-0000-0000-0000-000000000000"
+
+
+def _option(name: str, env_var: str, default: int) -> int:
+    """Read an integer option from `alembic -x name=value` or the environment."""
+    try:
+        x_args = context.get_x_argument(as_dictionary=True)
+    except NameError:  # Not running under the alembic command (e.g. tests)
+        x_args = {}
+    return int(x_args.get(name) or os.environ.get(env_var) or default)
+
+
+def _column_names(bind) -> List[str]:
+    return [column["name"] for column in sa.inspect(bind).get_columns(TABLE)]
+
+
+def create_partitioned_table(bind, partitions: int) -> None:
+    """Create the empty hash-partitioned copy of calculations."""
+    if partitions < 1:
+        raise ValueError("partitions must be at least 1")
+    bind.execute(sa.text(f"""
+        CREATE TABLE {NEW_TABLE} (LIKE {TABLE} INCLUDING DEFAULTS)
+        PARTITION BY HASH (user_id)
+    """))
+    bind.execute(sa.text(f"""
+        ALTER TABLE {NEW_TABLE}
+            ADD CONSTRAINT {NEW_TABLE}_pkey PRIMARY KEY (id, user_id),
+            ADD CONSTRAINT {NEW_TABLE}_user_id_fkey FOREIGN KEY (user_id)
+                REFERENCES users (id) ON DELETE CASCADE
+    """))
+    for remainder in range(partitions):
+        bind.execute(sa.text(f"""
+            CREATE TABLE {TABLE}_p{remainder} PARTITION OF {NEW_TABLE}
+            FOR VALUES WITH (MODULUS {partitions}, REMAINDER {remainder})
+        """))
+    bind.execute(sa.text(f"CREATE INDEX {NEW_TABLE}_user_id_idx ON {NEW_TABLE} (user_id)"))
+    bind.execute(sa.text(f"CREATE INDEX {NEW_TABLE}_type_idx ON {NEW_TABLE} (type)"))
+
+
+def install_mirror_trigger(bind) -> None:
+    """Mirror writes on the old table into the new one while the copy runs."""
+    columns = _column_names(bind)
+    updates = ", ".join(f"{name} = EXCLUDED.{name}" for name in columns if name not in ("id", "user_id"))
+    bind.execute(sa.text(f"""
+        CREATE FUNCTION {MIRROR}() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                DELETE FROM {NEW_TABLE} WHERE id = OLD.id AND user_id = OLD.user_id;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                INSERT INTO {NEW_TABLE} SELECT NEW.*
+                ON CONFLICT (id, user_id) DO UPDATE SET {updates};
+            END IF;
+            RETURN NULL;
+        END
+        $$
+    """))
+    bind.execute(sa.text(f"""
+        CREATE TRIGGER {MIRROR} AFTER INSERT OR UPDATE OR DELETE ON {TABLE}
+        FOR EACH ROW EXECUTE FUNCTION {MIRROR}()
+    """))
+
+
+def copy_in_batches(bind, batch_size: int) -> int:
+    """
+    Copy existing rows into the new table, batch_size rows per statement.
+
+    Must run in autocommit mode so each batch commits on its own. Rows the
+    trigger already mirrored are skipped (ON CONFLICT DO NOTHING), so a
+    mirrored newer version is never overwritten by an older copy.
+
+    Returns:
+        int: Number of batches executed
+    """
+    copy_batch = sa.text(f"""
+        WITH batch AS (
+            SELECT * FROM {TABLE} WHERE id > CAST(:last_id AS uuid) ORDER BY id LIMIT :batch_size
+        ), copied AS (
+            INSERT INTO {NEW_TABLE} SELECT * FROM batch ON CONFLICT DO NOTHING
+        )
+        SELECT id FROM batch ORDER BY id DESC LIMIT 1
+    """)
+    last_id, batches = MIN_UUID, 0
+    while True:
+        last_id = bind.execute(copy_batch, {"last_id": last_id, "batch_size": batch_size}).scalar()
+        if last_id is None:
+            return batches
+        batches += 1
+
+
+def swap_tables(bind) -> None:
+    """Reconcile under an exclusive lock, then put the partitioned table in place."""
+    bind.execute(sa.text(f"LOCK TABLE {TABLE} IN ACCESS EXCLUSIVE MODE"))
+    # A batch can copy a row that a concurrent transaction deleted before the
+    # batch committed; remove those, and pick up anything not yet copied.
+    bind.execute(sa.text(f"""
+        DELETE FROM {NEW_TABLE} n
+        WHERE NOT EXISTS (SELECT 1 FROM {TABLE} o WHERE o.id = n.id AND o.user_id = n.user_id)
+    """))
+    bind.execute(sa.text(f"""
+        INSERT INTO {NEW_TABLE}
+        SELECT o.* FROM {TABLE} o
+        WHERE NOT EXISTS (SELECT 1 FROM {NEW_TABLE} n WHERE n.id = o.id AND n.user_id = o.user_id)
+    """))
+    bind.execute(sa.text(f"DROP TRIGGER {MIRROR} ON {TABLE}"))
+    bind.execute(sa.text(f"DROP FUNCTION {MIRROR}()"))
+    bind.execute(sa.text(f"DROP TABLE {TABLE}"))
+    bind.execute(sa.text(f"ALTER TABLE {NEW_TABLE} RENAME TO {TABLE}"))
+    bind.execute(sa.text(f"ALTER TABLE {TABLE} RENAME CONSTRAINT {NEW_TABLE}_pkey TO {TABLE}_pkey"))
+    bind.execute(sa.text(f"ALTER TABLE {TABLE} RENAME CONSTRAINT {NEW_TABLE}_user_id_fkey TO {TABLE}_user_id_fkey"))
+    # Index names match what the model declares (index=True)
+    bind.execute(sa.text(f"ALTER INDEX {NEW_TABLE}_user_id_idx RENAME TO ix_{TABLE}_user_id"))
+    bind.execute(sa.text(f"ALTER INDEX {NEW_TABLE}_type_idx RENAME TO ix_{TABLE}_type"))
+
+
+def upgrade() -> None:
+    """Upgrade schema: hash-partition calculations by user_id."""
+    partitions = _option("partitions", "CALCULATION_PARTITIONS", DEFAULT_PARTITIONS)
+    batch_size = _option("batch_size", "CALCULATION_COPY_BATCH_SIZE", DEFAULT_BATCH_SIZE)
+    bind = op.get_bind()
+
+    create_partitioned_table(bind, partitions)
+    install_mirror_trigger(bind)
+    # Commits the DDL above (so the trigger is live for other sessions),
+    # then runs every batch in its own transaction
+    with op.get_context().autocommit_block():
+        copy_in_batches(bind, batch_size)
+    swap_tables(bind)
+
+
+def downgrade() -> None:
+    """Downgrade schema: copy calculations back into a single plain table."""
+    bind = op.get_bind()
+    bind.execute(sa.text(f"LOCK TABLE {TABLE} IN ACCESS EXCLUSIVE MODE"))
+    bind.execute(sa.text(f"CREATE TABLE {OLD_TABLE} (LIKE {TABLE} INCLUDING DEFAULTS)"))
+    bind.execute(sa.text(f"INSERT INTO {OLD_TABLE} SELECT * FROM {TABLE}"))
+    bind.execute(sa.text(f"DROP TABLE {TABLE}"))  # Drops the partitions too
+    bind.execute(sa.text(f"ALTER TABLE {OLD_TABLE} RENAME TO {TABLE}"))
+    bind.execute(sa.text(f"""
+        ALTER TABLE {TABLE}
+            ADD CONSTRAINT {TABLE}_pkey PRIMARY KEY (id),
+            ADD CONSTRAINT {TABLE}_user_id_fkey FOREIGN KEY (user_id)
+                REFERENCES users (id) ON DELETE CASCADE
+    """))
+    bind.execute(sa.text(f"CREATE INDEX ix_{TABLE}_user_id ON {TABLE} (user_id)"))
+    bind.execute(sa.text(f"CREATE INDEX ix_{TABLE}_type ON {TABLE} (type)"))
@@ -0,0 +1,36 @@
+"""create calculation result cache
+
+Revision ID: a8c4e7f2b519
+Revises: f3a6d9b1c428
+Create Date: 2026-10-19 14:00:00.000000
+
+Postgres tier of the content-addressed result cache
+(app/core/result_cache.py, RESULT_CACHE_BACKENDS=["postgres"]).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8c4e7f2b519'
+down_revision: Union[str, Sequence[str], None] = 'f3a6d9b1c428'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: create calculation_result_cache."""
+    op.create_table(
+        'calculation_result_cache',
+        sa.Column('key', sa.String(64), primary_key=True),
+        sa.Column('result', sa.Float(), nullable=False),
+        sa.Column('created_at', postgresql.TIMESTAMP(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema: drop calculation_result_cache."""
+    op.drop_table('calculation_result_cache')
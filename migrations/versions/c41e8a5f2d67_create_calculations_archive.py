@@ -0,0 +1,43 @@
+"""create calculations archive
+
+Revision ID: c41e8a5f2d67
+Revises: 9b2f4c7d1e30
+Create Date: 2026-10-19 10:15:00.000000
+
+Cold table for calculations moved out of the hot table by the archival
+job (app/jobs/archive.py).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41e8a5f2d67'
+down_revision: Union[str, Sequence[str], None] = '9b2f4c7d1e30'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: create calculations_archive."""
+    op.create_table(
+        'calculations_archive',
+        sa.Column('id', sa.UUID(), primary_key=True),
+        sa.Column('user_id', sa.UUID(), sa.ForeignKey('users.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('type', sa.String(50), nullable=False),
+        sa.Column('inputs', postgresql.JSON(), nullable=False),
+        sa.Column('result', sa.Float()),
+        sa.Column('created_at', postgresql.TIMESTAMP(), nullable=False),
+        sa.Column('updated_at', postgresql.TIMESTAMP(), nullable=False),
+        sa.Column('archived_at', postgresql.TIMESTAMP(), nullable=False),
+    )
+    op.create_index('ix_calculations_archive_user_id', 'calculations_archive', ['user_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema: drop calculations_archive."""
+    op.drop_index('ix_calculations_archive_user_id', table_name='calculations_archive')
+    op.drop_table('calculations_archive')
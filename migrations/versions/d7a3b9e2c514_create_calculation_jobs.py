@@ -0,0 +1,48 @@
+"""create calculation jobs
+
+Revision ID: d7a3b9e2c514
+Revises: c41e8a5f2d67
+Create Date: 2026-10-19 11:00:00.000000
+
+Queue table for asynchronous calculations (POST /calculations?async=true),
+processed by app/jobs/calculation_worker.py.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7a3b9e2c514'
+down_revision: Union[str, Sequence[str], None] = 'c41e8a5f2d67'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: create calculation_jobs."""
+    op.create_table(
+        'calculation_jobs',
+        sa.Column('id', sa.UUID(), primary_key=True),
+        sa.Column('user_id', sa.UUID(), sa.ForeignKey('users.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('type', sa.String(50), nullable=False),
+        sa.Column('inputs', postgresql.JSON(), nullable=False),
+        sa.Column('status', sa.String(20), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('calculation_id', sa.UUID()),
+        sa.Column('error', sa.Text()),
+        sa.Column('created_at', postgresql.TIMESTAMP(), nullable=False),
+        sa.Column('started_at', postgresql.TIMESTAMP()),
+        sa.Column('finished_at', postgresql.TIMESTAMP()),
+    )
+    op.create_index('ix_calculation_jobs_user_id', 'calculation_jobs', ['user_id'])
+    op.create_index('ix_calculation_jobs_status_created_at', 'calculation_jobs', ['status', 'created_at'])
+
+
+def downgrade() -> None:
+    """Downgrade schema: drop calculation_jobs."""
+    op.drop_index('ix_calculation_jobs_status_created_at', table_name='calculation_jobs')
+    op.drop_index('ix_calculation_jobs_user_id', table_name='calculation_jobs')
+    op.drop_table('calculation_jobs')
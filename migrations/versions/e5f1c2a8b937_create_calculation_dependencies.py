@@ -0,0 +1,40 @@
+"""create calculation dependencies
+
+Revision ID: e5f1c2a8b937
+Revises: d7a3b9e2c514
+Create Date: 2026-10-19 12:00:00.000000
+
+Edge table for calculations whose inputs reference other calculations'
+results ({"ref": "<id>"}), see app/operations/calculation_graph.py.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5f1c2a8b937'
+down_revision: Union[str, Sequence[str], None] = 'd7a3b9e2c514'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: create calculation_dependencies."""
+    op.create_table(
+        'calculation_dependencies',
+        sa.Column('upstream_id', sa.UUID(), nullable=False),
+        sa.Column('downstream_id', sa.UUID(), nullable=False),
+        sa.Column('user_id', sa.UUID(), sa.ForeignKey('users.id', ondelete='CASCADE'), nullable=False),
+        sa.PrimaryKeyConstraint('upstream_id', 'downstream_id'),
+    )
+    op.create_index(
+        'ix_calculation_dependencies_downstream_id', 'calculation_dependencies', ['downstream_id']
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema: drop calculation_dependencies."""
+    op.drop_index('ix_calculation_dependencies_downstream_id', table_name='calculation_dependencies')
+    op.drop_table('calculation_dependencies')
@@ -0,0 +1,41 @@
+"""add engine version to calculations
+
+Revision ID: f3a6d9b1c428
+Revises: e5f1c2a8b937
+Create Date: 2026-10-19 13:00:00.000000
+
+Records which ENGINE_VERSION of a type's get_result() computed each
+stored result, so rows become detectably stale when an implementation is
+fixed (see app/operations/stale_results.py). Existing rows are version 1.
+
+Adding a NOT NULL column with a constant default is a catalog-only change
+in PostgreSQL 11+, so no table rewrite happens, also not on the hash
+partitions of calculations.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a6d9b1c428'
+down_revision: Union[str, Sequence[str], None] = 'e5f1c2a8b937'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('calculations', 'calculations_archive')
+
+
+def upgrade() -> None:
+    """Upgrade schema: add engine_version (1 for existing rows)."""
+    for table in TABLES:
+        op.add_column(table, sa.Column('engine_version', sa.Integer(), nullable=False, server_default='1'))
+        # The application always supplies the version (see the model's column default)
+        op.alter_column(table, 'engine_version', server_default=None)
+
+
+def downgrade() -> None:
+    """Downgrade schema: drop engine_version."""
+    for table in TABLES:
+        op.drop_column(table, 'engine_version')
@@ -0,0 +1,356 @@
+// static/js/dashboard.js
+document.addEventListener('DOMContentLoaded', function() {
+  // Check if user is logged in
+  const token = localStorage.getItem('access_token');
+  if (!token) {
+    window.location.href = '/login';
+    return;
+  }
+
+  // Display welcome message in layout nav
+  const username = localStorage.getItem('username') || "User";
+  const layoutWelcome = document.getElementById('layoutUserWelcome');
+  if (layoutWelcome) layoutWelcome.textContent = `Welcome, ${username}!`;
+
+  // Attach logout logic
+  const layoutLogoutBtn = document.getElementById('layoutLogoutBtn');
+  if (layoutLogoutBtn) {
+    layoutLogoutBtn.addEventListener('click', () => {
+      if (confirm('Are you sure you want to logout?')) {
+        localStorage.clear();
+        window.location.href = '/login';
+      }
+    });
+  }
+
+  // Alert helper functions
+  function showError(msg) {
+    const errorAlert = document.getElementById('errorAlert');
+    const errorMessage = document.getElementById('errorMessage');
+    errorMessage.textContent = msg;
+    errorAlert.classList.remove('hidden');
+    
+    // Auto hide after 5 seconds
+    setTimeout(() => {
+      errorAlert.classList.add('opacity-0');
+      setTimeout(() => {
+        errorAlert.classList.add('hidden');
+        errorAlert.classList.remove('opacity-0');
+      }, 300);
+    }, 5000);
+    
+    // Scroll to the error message if not visible
+    errorAlert.scrollIntoView({ behavior: 'smooth', block: 'center' });
+  }
+  
+  function showSuccess(msg) {
+    const successAlert = document.getElementById('successAlert');
+    const successMessage = document.getElementById('successMessage');
+    successMessage.textContent = msg;
+    successAlert.classList.remove('hidden');
+    
+    // Auto hide after 5 seconds
+    setTimeout(() => {
+      successAlert.classList.add('opacity-0');
+      setTimeout(() => {
+        successAlert.classList.add('hidden');
+        successAlert.classList.remove('opacity-0');
+      }, 300);
+    }, 5000);
+    
+    // Scroll to the success message if not visible
+    successAlert.scrollIntoView({ behavior: 'smooth', block: 'center' });
+  }
+
+  // Load the calculations from the API
+  async function loadCalculations() {
+    try {
+      const tableBody = document.getElementById('calculationsTable');
+      // Show loading indicator
+      document.getElementById('loadingRow')?.classList.remove('hidden');
+      
+      const response = await fetch('/calculations', {
+        headers: { 'Authorization': `Bearer ${token}` }
+      });
+      
+      if (!response.ok) {
+        if (response.status === 401) {
+          localStorage.clear();
+          window.location.href = '/login';
+          return;
+        }
+        throw new Error('Failed to load calculations');
+      }
+
+      const calculations = await response.json();
+      tableBody.innerHTML = '';
+
+      if (calculations.length === 0) {
+        const noDataRow = document.createElement('tr');
+        noDataRow.innerHTML = `
+          <td colspan="5" class="px-6 py-10 text-center">
+            <div class="flex flex-col items-center justify-center text-gray-500">
+              <svg class="w-12 h-12 mb-3 text-gray-300" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M9 5H7a2 2 0 00-2 2v12a2 2 0 002 2h10a2 2 0 002-2V7a2 2 0 00-2-2h-2M9 5a2 2 0 002 2h2a2 2 0 002-2M9 5a2 2 0 012-2h2a2 2 0 012 2"></path>
+              </svg>
+              <p class="text-lg font-medium">No calculations found</p>
+              <p class="text-sm mt-1">Create your first calculation above!</p>
+            </div>
+          </td>
+        `;
+        tableBody.appendChild(noDataRow);
+        return;
+      }
+
+      calculations.forEach(calc => {
+        const row = document.createElement('tr');
+        row.classList.add('hover:bg-gray-50', 'transition-colors');
+        
+        // Format the date nicely
+        const calcDate = new Date(calc.created_at);
+        const dateOptions = { year: 'numeric', month: 'short', day: 'numeric' };
+        const formattedDate = calcDate.toLocaleDateString(undefined, dateOptions);
+        const formattedTime = calcDate.toLocaleTimeString(undefined, { hour: '2-digit', minute: '2-digit' });
+        
+        row.innerHTML = `
+          <td class="px-6 py-4 text-gray-800 whitespace-nowrap">
+            <span class="font-medium capitalize">${calc.type}</span>
+          </td>
+          <td class="px-6 py-4 text-gray-800 whitespace-nowrap">
+            ${calc.inputs.join(', ')}
+          </td>
+          <td class="px-6 py-4 text-gray-800 whitespace-nowrap font-semibold">
+            ${calc.result}
+          </td>
+          <td class="px-6 py-4 text-gray-800 whitespace-nowrap">
+            <div class="text-sm">
+              <div>${formattedDate}</div>
+              <div class="text-gray-500">${formattedTime}</div>
+            </div>
+          </td>
+          <td class="px-6 py-4">
+            <div class="flex space-x-3">
+              <a 
+                href="/dashboard/view/${calc.id}"
+                class="text-blue-700 hover:text-blue-800 font-medium flex items-center"
+              >
+                <svg class="w-4 h-4 mr-1" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                  <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M15 12a3 3 0 11-6 0 3 3 0 016 0z"></path>
+                  <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M2.458 12C3.732 7.943 7.523 5 12 5c4.478 0 8.268 2.943 9.542 7-1.274 4.057-5.064 7-9.542 7-4.477 0-8.268-2.943-9.542-7z"></path>
+                </svg>
+                View
+              </a>
+              <a 
+                href="/dashboard/edit/${calc.id}"
+                class="text-gray-700 hover:text-gray-800 font-medium flex items-center"
+              >
+                <svg class="w-4 h-4 mr-1" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                  <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M11 5H6a2 2 0 00-2 2v11a2 2 0 002 2h11a2 2 0 002-2v-5m-1.414-9.414a2 2 0 112.828 2.828L11.828 15H9v-2.828l8.586-8.586z"></path>
+                </svg>
+                Edit
+              </a>
+              <button 
+                class="text-red-600 hover:text-red-800 font-medium delete-calc flex items-center"
+                data-id="${calc.id}"
+              >
+                <svg class="w-4 h-4 mr-1" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                  <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M19 7l-.867 12.142A2 2 0 0116.138 21H7.862a2 2 0 01-1.995-1.858L5 7m5 4v6m4-6v6m1-10V4a1 1 0 00-1-1h-4a1 1 0 00-1 1v3M4 7h16"></path>
+                </svg>
+                Delete
+              </button>
+            </div>
+          </td>
+        `;
+        tableBody.appendChild(row);
+      });
+
+      // Attach delete handlers
+      document.querySelectorAll('.delete-calc').forEach(btn => {
+        btn.addEventListener('click', async (e) => {
+          if (!confirm('Are you sure you want to delete this calculation?')) return;
+
+          const calcId = e.target.closest('.delete-calc').dataset.id;
+          
+          // Show loading spinner in the button
+          const originalContent = e.target.closest('.delete-calc').innerHTML;
+          e.target.closest('.delete-calc').innerHTML = '<svg class="animate-spin h-4 w-4 mr-1" xmlns="http://www.w3.org/2000/svg" fill="none" viewBox="0 0 24 24"><circle class="opacity-25" cx="12" cy="12" r="10" stroke="currentColor" stroke-width="4"></circle><path class="opacity-75" fill="currentColor" d="M4 12a8 8 0 018-8V0C5.373 0 0 5.373 0 12h4zm2 5.291A7.962 7.962 0 014 12H0c0 3.042 1.135 5.824 3 7.938l3-2.647z"></path></svg> Deleting...';
+          e.target.closest('.delete-calc').disabled = true;
+          
+          try {
+            const delResp = await fetch(`/calculations/${calcId}`, {
+              method: 'DELETE',
+              headers: { 'Authorization': `Bearer ${token}` }
+            });
+            
+            if (!delResp.ok) {
+              if (delResp.status === 401) {
+                localStorage.clear();
+                window.location.href = '/login';
+                return;
+              }
+              throw new Error('Failed to delete calculation');
+            }
+            
+            showSuccess('Calculation deleted successfully');
+            // Fade out the row before removing it
+            const row = e.target.closest('tr');
+            row.style.transition = 'opacity 0.5s';
+            row.style.opacity = '0';
+            setTimeout(() => {
+              loadCalculations();
+            }, 500);
+            
+          } catch (err) {
+            // Restore the button
+            e.target.closest('.delete-calc').innerHTML = originalContent;
+            e.target.closest('.delete-calc').disabled = false;
+            
+            showError(err.message || 'Error deleting calculation');
+          }
+        });
+      });
+    } catch (err) {
+      showError(err.message || 'Error loading calculations');
+      
+      // Show error state in the table
+      const tableBody = document.getElementById('calculationsTable');
+      tableBody.innerHTML = `
+        <tr>
+          <td colspan="5" class="px-6 py-10 text-center">
+            <div class="flex flex-col items-center justify-center text-red-600">
+              <svg class="w-12 h-12 mb-3" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M12 8v4m0 4h.01M21 12a9 9 0 11-18 0 9 9 0 0118 0z"></path>
+              </svg>
+              <p class="text-lg font-medium">Failed to load calculations</p>
+              <button id="retryButton" class="mt-3 bg-blue-700 text-white px-4 py-2 rounded">
+                Retry
+              </button>
+            </div>
+          </td>
+        </tr>
+      `;
+      
+      // Add retry button functionality
+      document.getElementById('retryButton')?.addEventListener('click', loadCalculations);
+    }
+  }
+
+  // Handle form submission for new calculation
+  document.getElementById('calculationForm').addEventListener('submit', async (e) => {
+    e.preventDefault();
+    
+    const form = e.target;
+    const submitButton = form.querySelector('button[type="submit"]');
+    const originalButtonContent = submitButton.innerHTML;
+    
+    const inputsVal = document.getElementById('calcInputs').value;
+    const inputs = inputsVal.split(',')
+      .map(num => parseFloat(num.trim()))
+      .filter(num => !isNaN(num));
+
+    if (inputs.length < 2) {
+      showError('Please enter at least two valid numbers, separated by commas');
+      
+      // Highlight the input field with an error state
+      const inputField = document.getElementById('calcInputs');
+      inputField.classList.add('border-red-500');
+      inputField.focus();
+      
+      // Remove error highlight after 3 seconds or when user types
+      setTimeout(() => inputField.classList.remove('border-red-500'), 3000);
+      inputField.addEventListener('input', () => inputField.classList.remove('border-red-500'), { once: true });
+      
+      return;
+    }
+
+    const newCalc = {
+      type: document.getElementById('calcType').value,
+      inputs
+    };
+
+    // Show loading state in the button
+    submitButton.disabled = true;
+    submitButton.innerHTML = '<svg class="animate-spin -ml-1 mr-2 h-4 w-4 text-white" xmlns="http://www.w3.org/2000/svg" fill="none" viewBox="0 0 24 24"><circle class="opacity-25" cx="12" cy="12" r="10" stroke="currentColor" stroke-width="4"></circle><path class="opacity-75" fill="currentColor" d="M4 12a8 8 0 018-8V0C5.373 0 0 5.373 0 12h4zm2 5.291A7.962 7.962 0 014 12H0c0 3.042 1.135 5.824 3 7.938l3-2.647z"></path></svg> Calculating...';
+
+    try {
+      const response = await fetch('/calculations', {
+        method: 'POST',
+        headers: {
+          'Content-Type': 'application/json',
+          'Authorization': `Bearer ${token}`
+        },
+        body: JSON.stringify(newCalc)
+      });
+      
+      if (!response.ok) {
+        if (response.status === 401) {
+          localStorage.clear();
+          window.location.href = '/login';
+          return;
+        }
+        
+        const errorData = await response.json();
+        throw new Error(errorData.detail || 'Failed to create calculation');
+      }
+      
+      // Get the created calculation data
+      const result = await response.json();
+      
+      showSuccess(`Calculation complete: ${result.result}`);
+      form.reset();
+      loadCalculations();
+      
+      // Add a highlight effect to the table to draw attention to the new entry
+      setTimeout(() => {
+        const tableBody = document.getElementById('calculationsTable');
+        if (tableBody.firstChild) {
+          tableBody.firstChild.classList.add('bg-blue-50');
+          setTimeout(() => {
+            tableBody.firstChild.classList.remove('bg-blue-50');
+          }, 2000);
+        }
+      }, 500);
+      
+    } catch (error) {
+      showError(error.message || 'Error creating calculation');
+    } finally {
+      // Restore button state
+      submitButton.disabled = false;
+      submitButton.innerHTML = originalButtonContent;
+    }
+  });
+
+  // Initial load
+  loadCalculations();
+  
+  // Optional features:
+  
+  // 1. Auto-refresh every 30 seconds
+  // const refreshInterval = setInterval(loadCalculations, 30000);
+  
+  // 2. Add clear form button
+  const calcInputs = document.getElementById('calcInputs');
+  calcInputs.addEventListener('input', function() {
+    if (this.value.trim() !== '') {
+      // Show clear button when there's input
+      if (!this.nextElementSibling || !this.nextElementSibling.classList.contains('clear-button')) {
+        const clearButton = document.createElement('button');
+        clearButton.type = 'button';
+        clearButton.className = 'clear-button absolute right-2 top-1/2 -translate-y-1/2 text-gray-400 hover:text-gray-600';
+        clearButton.innerHTML = '×';
+        clearButton.addEventListener('click', () => {
+          this.value = '';
+          this.focus();
+          clearButton.remove();
+        });
+        
+        // Make sure the input's parent is position relative
+        this.parentElement.style.position = 'relative';
+        this.parentElement.appendChild(clearButton);
+      }
+    } else if (this.nextElementSibling && this.nextElementSibling.classList.contains('clear-button')) {
+      // Remove clear button when input is empty
+      this.nextElementSibling.remove();
+    }
+  });
+});
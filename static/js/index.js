@@ -0,0 +1,10 @@
+// static/js/index.js
+  document.addEventListener('DOMContentLoaded', function() {
+    // If there are footer auth links and we're on the homepage, hide them
+    const footerAuthLinks = document.querySelectorAll('footer a[href*="login"], footer a[href*="register"]');
+    if (footerAuthLinks.length) {
+      footerAuthLinks.forEach(link => {
+        link.style.display = 'none';
+      });
+    }
+  });
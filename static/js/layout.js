@@ -0,0 +1,119 @@
+// static/js/layout.js
+document.addEventListener('DOMContentLoaded', function() {
+  // Brand link adjustment based on auth status
+  const brandLink = document.getElementById('brandLink');
+  if (brandLink) {
+    const token = localStorage.getItem('access_token');
+    // If user is logged in, set the brand link to /dashboard
+    if (token) {
+      brandLink.href = '/dashboard';
+    }
+  }
+
+  // Set user welcome message if logged in
+  const welcomeElement = document.getElementById('layoutUserWelcome');
+  if (welcomeElement) {
+    const username = localStorage.getItem('username');
+    if (username) {
+      welcomeElement.textContent = `Welcome, ${username}!`;
+      welcomeElement.classList.remove('hidden');
+    } else {
+      welcomeElement.classList.add('hidden');
+    }
+  }
+
+  // Logout button logic
+  const logoutBtn = document.getElementById('layoutLogoutBtn');
+  if (logoutBtn) {
+    // Only show logout button if user is logged in
+    const token = localStorage.getItem('access_token');
+    if (!token) {
+      logoutBtn.classList.add('hidden');
+    } else {
+      logoutBtn.classList.remove('hidden');
+
+      // Attach logout handler
+      logoutBtn.addEventListener('click', function() {
+        if (confirm('Are you sure you want to logout?')) {
+          // Show logout in progress
+          const originalContent = logoutBtn.innerHTML;
+          logoutBtn.innerHTML = '<svg class="animate-spin h-4 w-4 mr-1" xmlns="http://www.w3.org/2000/svg" fill="none" viewBox="0 0 24 24"><circle class="opacity-25" cx="12" cy="12" r="10" stroke="currentColor" stroke-width="4"></circle><path class="opacity-75" fill="currentColor" d="M4 12a8 8 0 018-8V0C5.373 0 0 5.373 0 12h4zm2 5.291A7.962 7.962 0 014 12H0c0 3.042 1.135 5.824 3 7.938l3-2.647z"></path></svg> Logging out...';
+          logoutBtn.disabled = true;
+
+          // Clear local storage
+          localStorage.clear();
+
+          // Show toast notification
+          showToast('Logged out successfully', 'success');
+
+          // Redirect after a short delay
+          setTimeout(() => {
+            window.location.href = '/login';
+          }, 500);
+        }
+      });
+    }
+  }
+
+  // Toast notification system
+  window.showToast = function(message, type = 'info', duration = 5000) {
+    const toast = document.createElement('div');
+
+    // Set toast classes based on type
+    let bgColor, icon;
+    switch(type) {
+      case 'success':
+        bgColor = 'bg-green-500';
+        icon = '<svg class="w-5 h-5 mr-2" fill="none" stroke="currentColor" viewBox="0 0 24 24"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M5 13l4 4L19 7"></path></svg>';
+        break;
+      case 'error':
+        bgColor = 'bg-red-500';
+        icon = '<svg class="w-5 h-5 mr-2" fill="none" stroke="currentColor" viewBox="0 0 24 24"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M6 18L18 6M6 6l12 12"></path></svg>';
+        break;
+      case 'warning':
+        bgColor = 'bg-yellow-500';
+        icon = '<svg class="w-5 h-5 mr-2" fill="none" stroke="currentColor" viewBox="0 0 24 24"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M12 9v2m0 4h.01m-6.938 4h13.856c1.54 0 2.502-1.667 1.732-3L13.732 4c-.77-1.333-2.694-1.333-3.464 0L3.34 16c-.77 1.333.192 3 1.732 3z"></path></svg>';
+        break;
+      default:
+        bgColor = 'bg-blue-500';
+        icon = '<svg class="w-5 h-5 mr-2" fill="none" stroke="currentColor" viewBox="0 0 24 24"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M13 16h-1v-4h-1m1-4h.01M21 12a9 9 0 11-18 0 9 9 0 0118 0z"></path></svg>';
+    }
+
+    toast.className = `${bgColor} text-white px-4 py-3 rounded-lg shadow-lg flex items-center transform transition-all duration-300 opacity-0 translate-y-2`;
+    toast.innerHTML = `
+      ${icon}
+      <p class="text-sm font-medium">${message}</p>
+      <button class="ml-auto text-white hover:text-gray-200" aria-label="Close">
+        <svg class="w-4 h-4" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+          <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M6 18L18 6M6 6l12 12"></path>
+        </svg>
+      </button>
+    `;
+
+    // Add to container
+    const container = document.getElementById('toastContainer');
+    container.appendChild(toast);
+
+    // Transition in
+    setTimeout(() => {
+      toast.classList.remove('opacity-0', 'translate-y-2');
+    }, 10);
+
+    // Attach close button handler
+    toast.querySelector('button').addEventListener('click', () => {
+      removeToast(toast);
+    });
+
+    // Auto-remove after duration
+    setTimeout(() => {
+      removeToast(toast);
+    }, duration);
+  }
+
+  function removeToast(toast) {
+    toast.classList.add('opacity-0', 'translate-y-2');
+    setTimeout(() => {
+      toast.remove();
+    }, 300);
+  }
+});
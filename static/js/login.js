@@ -0,0 +1,127 @@
+// static/js/login.js
+// Wait for DOM to be fully loaded
+document.addEventListener('DOMContentLoaded', function() {
+    // Get form and alert elements
+    const form = document.getElementById('loginForm');
+    const errorAlert = document.getElementById('errorAlert');
+    const errorMessage = document.getElementById('errorMessage');
+    const successAlert = document.getElementById('successAlert');
+    const successMessage = document.getElementById('successMessage');
+
+    // Verify elements exist
+    if (!form || !errorAlert || !errorMessage || !successAlert || !successMessage) {
+        console.error('Required elements not found');
+        return;
+    }
+
+    function showError(message) {
+        errorMessage.textContent = message;
+        errorAlert.classList.remove('hidden');
+        successAlert.classList.add('hidden');
+        
+        // Scroll to the error message if it's not visible
+        errorAlert.scrollIntoView({ behavior: 'smooth', block: 'nearest' });
+    }
+
+    function showSuccess(message) {
+        successMessage.textContent = message;
+        successAlert.classList.remove('hidden');
+        errorAlert.classList.add('hidden');
+        
+        // Scroll to the success message if it's not visible
+        successAlert.scrollIntoView({ behavior: 'smooth', block: 'nearest' });
+    }
+
+    function storeTokens(tokenData) {
+        localStorage.setItem('access_token', tokenData.access_token);
+        localStorage.setItem('refresh_token', tokenData.refresh_token);
+        localStorage.setItem('token_expires', tokenData.expires_at);
+        localStorage.setItem('user_id', tokenData.user_id);
+        localStorage.setItem('username', tokenData.username);
+    }
+
+    // Handle form submission
+    form.addEventListener('submit', async function(e) {
+        e.preventDefault();
+
+        // Clear previous alerts
+        errorAlert.classList.add('hidden');
+        successAlert.classList.add('hidden');
+
+        // Get form data
+        const formData = {
+            username: form.username.value.trim(),
+            password: form.password.value
+        };
+
+        // Basic validation
+        if (!formData.username || !formData.password) {
+            showError('Please fill in all fields');
+            return;
+        }
+
+        // Show loading state on button
+        const submitButton = form.querySelector('button[type="submit"]');
+        const originalButtonText = submitButton.innerHTML;
+        submitButton.disabled = true;
+        submitButton.innerHTML = '<svg class="animate-spin -ml-1 mr-2 h-4 w-4 text-white" xmlns="http://www.w3.org/2000/svg" fill="none" viewBox="0 0 24 24"><circle class="opacity-25" cx="12" cy="12" r="10" stroke="currentColor" stroke-width="4"></circle><path class="opacity-75" fill="currentColor" d="M4 12a8 8 0 018-8V0C5.373 0 0 5.373 0 12h4zm2 5.291A7.962 7.962 0 014 12H0c0 3.042 1.135 5.824 3 7.938l3-2.647z"></path></svg> Signing in...';
+
+        try {
+            const response = await fetch('/auth/login', {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json',
+                },
+                body: JSON.stringify(formData)
+            });
+
+            const data = await response.json();
+
+            if (!response.ok) {
+                throw new Error(data.detail || 'Login failed');
+            }
+
+            // Store tokens and user data
+            storeTokens(data);
+
+            // Handle remember me
+            if (form.remember.checked) {
+                localStorage.setItem('remember_login', 'true');
+                localStorage.setItem('remembered_username', formData.username);
+            } else {
+                localStorage.removeItem('remember_login');
+                localStorage.removeItem('remembered_username');
+            }
+
+            showSuccess('Login successful! Redirecting...');
+
+            // Redirect to dashboard
+            setTimeout(() => {
+                window.location.href = '/dashboard';
+            }, 1000);
+
+        } catch (error) {
+            showError(error.message || 'Invalid username or password');
+            
+            // Reset button state
+            submitButton.disabled = false;
+            submitButton.innerHTML = originalButtonText;
+        }
+    });
+
+    // Load remembered username if exists
+    if (localStorage.getItem('remember_login') === 'true') {
+        const rememberedUsername = localStorage.getItem('remembered_username');
+        if (rememberedUsername) {
+            form.username.value = rememberedUsername;
+            form.remember.checked = true;
+        }
+    }
+    
+    // Add touch device enhancement for better mobile experience
+    if ('ontouchstart' in document.documentElement) {
+        document.querySelectorAll('input, button').forEach(el => {
+            el.style.fontSize = '16px'; // Prevent zoom on iOS
+        });
+    }
+});
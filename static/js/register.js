@@ -0,0 +1,194 @@
+// static/js/register.js
+document.addEventListener('DOMContentLoaded', function() {
+    const form = document.getElementById('registrationForm');
+    const errorAlert = document.getElementById('errorAlert');
+    const errorMessage = document.getElementById('errorMessage');
+    const successAlert = document.getElementById('successAlert');
+    const successMessage = document.getElementById('successMessage');
+    const passwordMatchError = document.getElementById('passwordMatchError');
+
+    // Helper function to show error
+    function showError(message) {
+        errorMessage.textContent = message;
+        errorAlert.classList.remove('hidden');
+        successAlert.classList.add('hidden');
+        
+        // Scroll to the error message if it's not visible
+        errorAlert.scrollIntoView({ behavior: 'smooth', block: 'nearest' });
+    }
+
+    // Helper function to show success
+    function showSuccess(message) {
+        successMessage.textContent = message;
+        successAlert.classList.remove('hidden');
+        errorAlert.classList.add('hidden');
+        
+        // Scroll to the success message if it's not visible
+        successAlert.scrollIntoView({ behavior: 'smooth', block: 'nearest' });
+    }
+
+    // Helper function to validate email format
+    function isValidEmail(email) {
+        return /^[^\s@]+@[^\s@]+\.[^\s@]+$/.test(email);
+    }
+
+    // Helper function to validate password strength
+    function isValidPassword(password) {
+        return password.length >= 8 && // at least 8 characters
+               /[A-Z]/.test(password) && // at least one uppercase
+               /[a-z]/.test(password) && // at least one lowercase
+               /[0-9]/.test(password); // at least one number
+    }
+    
+    // Helper function to add validation styling
+    function setInputValidation(input, isValid) {
+        if (isValid) {
+            input.classList.remove('border-red-500');
+            input.classList.add('border-green-500');
+        } else {
+            input.classList.remove('border-green-500');
+            input.classList.add('border-red-500');
+        }
+    }
+
+    form.addEventListener('submit', async function(e) {
+        e.preventDefault();
+
+        // Clear previous alerts
+        errorAlert.classList.add('hidden');
+        successAlert.classList.add('hidden');
+
+        // Get form data
+        const formData = {
+            username: form.username.value.trim(),
+            email: form.email.value.trim(),
+            password: form.password.value,
+            confirm_password: form.confirm_password.value,
+            first_name: form.first_name.value.trim(),
+            last_name: form.last_name.value.trim()
+        };
+
+        // Reset all validation styling
+        form.querySelectorAll('input').forEach(input => {
+            input.classList.remove('border-red-500', 'border-green-500');
+        });
+        
+        // Perform client-side validation
+        let hasErrors = false;
+        
+        if (!formData.username || formData.username.length < 3) {
+            setInputValidation(form.username, false);
+            showError('Username must be at least 3 characters long');
+            hasErrors = true;
+        }
+
+        if (!isValidEmail(formData.email)) {
+            setInputValidation(form.email, false);
+            if (!hasErrors) showError('Please enter a valid email address');
+            hasErrors = true;
+        }
+
+        if (!isValidPassword(formData.password)) {
+            setInputValidation(form.password, false);
+            if (!hasErrors) showError('Password must be at least 8 characters long and contain uppercase, lowercase, and numbers');
+            hasErrors = true;
+        }
+
+        if (formData.password !== formData.confirm_password) {
+            setInputValidation(form.confirm_password, false);
+            passwordMatchError.classList.remove('hidden');
+            if (!hasErrors) showError('Passwords do not match');
+            hasErrors = true;
+        }
+        
+        if (hasErrors) return;
+
+        // Show loading state on button
+        const submitButton = form.querySelector('button[type="submit"]');
+        const originalButtonText = submitButton.innerHTML;
+        submitButton.disabled = true;
+        submitButton.innerHTML = '<svg class="animate-spin -ml-1 mr-2 h-4 w-4 text-white" xmlns="http://www.w3.org/2000/svg" fill="none" viewBox="0 0 24 24"><circle class="opacity-25" cx="12" cy="12" r="10" stroke="currentColor" stroke-width="4"></circle><path class="opacity-75" fill="currentColor" d="M4 12a8 8 0 018-8V0C5.373 0 0 5.373 0 12h4zm2 5.291A7.962 7.962 0 014 12H0c0 3.042 1.135 5.824 3 7.938l3-2.647z"></path></svg> Creating Account...';
+
+        try {
+            const response = await fetch('/auth/register', {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json',
+                },
+                body: JSON.stringify(formData)
+            });
+
+            const data = await response.json();
+
+            if (!response.ok) {
+                throw new Error(data.detail || 'Registration failed');
+            }
+
+            // Show success message
+            showSuccess('Registration successful! Redirecting to login...');
+
+            // Redirect to login page after 2 seconds
+            setTimeout(() => {
+                window.location.href = '/login';
+            }, 2000);
+
+        } catch (error) {
+            showError(error.message || 'An error occurred during registration');
+            
+            // Reset button state
+            submitButton.disabled = false;
+            submitButton.innerHTML = originalButtonText;
+        }
+    });
+
+    // Real-time password match validation
+    const passwordInput = form.password;
+    const confirmPasswordInput = form.confirm_password;
+
+    function validatePasswordMatch() {
+        if (confirmPasswordInput.value) {
+            if (passwordInput.value !== confirmPasswordInput.value) {
+                passwordMatchError.classList.remove('hidden');
+                setInputValidation(confirmPasswordInput, false);
+            } else {
+                passwordMatchError.classList.add('hidden');
+                setInputValidation(confirmPasswordInput, true);
+            }
+        }
+    }
+
+    // Password strength indicator
+    passwordInput.addEventListener('input', function() {
+        const password = this.value;
+        // Only validate if there's something to validate
+        if (password.length > 0) {
+            setInputValidation(this, isValidPassword(password));
+        } else {
+            this.classList.remove('border-red-500', 'border-green-500');
+        }
+    });
+
+    passwordInput.addEventListener('change', validatePasswordMatch);
+    confirmPasswordInput.addEventListener('input', validatePasswordMatch);
+    
+    // Email validation on blur
+    form.email.addEventListener('blur', function() {
+        if (this.value) {
+            setInputValidation(this, isValidEmail(this.value));
+        }
+    });
+    
+    // Username validation on blur
+    form.username.addEventListener('blur', function() {
+        if (this.value) {
+            setInputValidation(this, this.value.length >= 3);
+        }
+    });
+    
+    // Add touch device enhancement for better mobile experience
+    if ('ontouchstart' in document.documentElement) {
+        document.querySelectorAll('input, button').forEach(el => {
+            el.style.fontSize = '16px'; // Prevent zoom on iOS
+        });
+    }
+});
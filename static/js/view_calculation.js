@@ -0,0 +1,244 @@
+// static/js/view_calculation.js
+// The calculation ID is passed in through the script tag's data-calc-id
+// attribute; document.currentScript is only available while the script
+// first runs, so read it before the DOMContentLoaded handler.
+const pageCalcId = document.currentScript.dataset.calcId;
+
+document.addEventListener('DOMContentLoaded', async () => {
+  // Check auth token
+  const token = localStorage.getItem('access_token');
+  if (!token) {
+    window.location.href = '/login';
+    return;
+  }
+
+  // Helper: show/hide alerts
+  function showError(message) {
+    const errorAlert = document.getElementById('errorAlert');
+    const errorMessage = document.getElementById('errorMessage');
+    errorMessage.textContent = message;
+    errorAlert.classList.remove('hidden');
+    
+    // Smooth fade out
+    setTimeout(() => {
+      errorAlert.classList.add('opacity-0');
+      setTimeout(() => {
+        errorAlert.classList.add('hidden');
+        errorAlert.classList.remove('opacity-0');
+      }, 300);
+    }, 5000);
+  }
+  
+  function showSuccess(message) {
+    const successAlert = document.getElementById('successAlert');
+    const successMessage = document.getElementById('successMessage');
+    successMessage.textContent = message;
+    successAlert.classList.remove('hidden');
+    
+    // Smooth fade out
+    setTimeout(() => {
+      successAlert.classList.add('opacity-0');
+      setTimeout(() => {
+        successAlert.classList.add('hidden');
+        successAlert.classList.remove('opacity-0');
+      }, 300);
+    }, 5000);
+  }
+
+  // Get calc ID passed in by the page template
+  const calcId = pageCalcId;
+
+  // Function to create a simple visual representation of the calculation
+  function createCalculationVisual(type, inputs, result) {
+    const visualDiv = document.getElementById('calculationVisual');
+    
+    let operator;
+    switch (type) {
+      case 'addition':
+        operator = '+';
+        break;
+      case 'subtraction':
+        operator = '-';
+        break;
+      case 'multiplication':
+        operator = '×';
+        break;
+      case 'division':
+        operator = '÷';
+        break;
+      default:
+        operator = '?';
+    }
+    
+    const html = `
+      <div class="text-center">
+        <h3 class="text-lg font-semibold text-gray-700 mb-4 capitalize">${type} Operation</h3>
+        <div class="flex flex-col items-center justify-center bg-white rounded-lg p-4 shadow-sm">
+          ${inputs.map((input, i) => `
+            <div class="flex items-center w-full justify-center mb-2">
+              <span class="text-xl font-medium text-gray-800">${input}</span>
+              ${i < inputs.length - 1 ? `<span class="mx-2 text-xl text-blue-700 font-bold">${operator}</span>` : ''}
+            </div>
+          `).join('')}
+          <div class="w-full border-t border-gray-300 my-2"></div>
+          <div class="text-2xl font-bold text-blue-700">${result}</div>
+        </div>
+      </div>
+    `;
+    
+    visualDiv.innerHTML = html;
+  }
+  
+  // Function to format date nicely
+  function formatDate(dateString) {
+    const date = new Date(dateString);
+    const options = { 
+      year: 'numeric', 
+      month: 'long', 
+      day: 'numeric',
+      hour: 'numeric',
+      minute: 'numeric'
+    };
+    return date.toLocaleDateString(undefined, options);
+  }
+
+  // Load the calculation details
+  async function loadCalculation() {
+    try {
+      // Show loading state
+      document.getElementById('loadingState').classList.remove('hidden');
+      document.getElementById('calculationCard').classList.add('hidden');
+      document.getElementById('errorState').classList.add('hidden');
+      
+      const response = await fetch(`/calculations/${calcId}`, {
+        headers: { 'Authorization': `Bearer ${token}` }
+      });
+      
+      if (!response.ok) {
+        if (response.status === 401) {
+          localStorage.clear();
+          window.location.href = '/login';
+          return;
+        }
+        
+        if (response.status === 404) {
+          // Show not found state
+          document.getElementById('loadingState').classList.add('hidden');
+          document.getElementById('errorState').classList.remove('hidden');
+          return;
+        }
+        
+        throw new Error('Failed to load calculation');
+      }
+      
+      const calc = await response.json();
+      
+      // Hide loading, show calculation card
+      document.getElementById('loadingState').classList.add('hidden');
+      document.getElementById('calculationCard').classList.remove('hidden');
+
+      // Populate details
+      const calcDetailsDiv = document.getElementById('calcDetails');
+      calcDetailsDiv.innerHTML = `
+        <div class="bg-blue-50 p-4 rounded-lg border border-blue-100 mb-4">
+          <div class="font-bold text-blue-800 text-lg mb-1">Result</div>
+          <div class="text-3xl font-bold text-blue-700">${calc.result}</div>
+        </div>
+        
+        <div>
+          <p class="text-sm text-gray-500 uppercase font-semibold tracking-wide mb-1">Operation Type</p>
+          <p class="font-medium text-gray-800 capitalize">${calc.type}</p>
+        </div>
+        
+        <div>
+          <p class="text-sm text-gray-500 uppercase font-semibold tracking-wide mb-1">Input Values</p>
+          <p class="font-medium text-gray-800">${calc.inputs.join(', ')}</p>
+        </div>
+        
+        <div>
+          <p class="text-sm text-gray-500 uppercase font-semibold tracking-wide mb-1">Created</p>
+          <p class="font-medium text-gray-800">${formatDate(calc.created_at)}</p>
+        </div>
+        
+        ${calc.updated_at && calc.updated_at !== calc.created_at ? 
+          `<div>
+            <p class="text-sm text-gray-500 uppercase font-semibold tracking-wide mb-1">Last Updated</p>
+            <p class="font-medium text-gray-800">${formatDate(calc.updated_at)}</p>
+          </div>` : 
+          ''
+        }
+        
+        <div>
+          <p class="text-sm text-gray-500 uppercase font-semibold tracking-wide mb-1">Calculation ID</p>
+          <p class="font-mono text-sm text-gray-600">${calc.id}</p>
+        </div>
+      `;
+      
+      // Create visual representation
+      createCalculationVisual(calc.type, calc.inputs, calc.result);
+
+      // Set Edit link
+      const editLink = document.getElementById('editLink');
+      if (editLink) {
+        editLink.setAttribute('href', `/dashboard/edit/${calc.id}`);
+      }
+      
+      // Set up delete button
+      const deleteBtn = document.getElementById('deleteBtn');
+      if (deleteBtn) {
+        deleteBtn.addEventListener('click', async () => {
+          if (confirm('Are you sure you want to delete this calculation? This action cannot be undone.')) {
+            try {
+              // Show loading state on button
+              const originalContent = deleteBtn.innerHTML;
+              deleteBtn.innerHTML = '<svg class="animate-spin h-4 w-4 mr-2" xmlns="http://www.w3.org/2000/svg" fill="none" viewBox="0 0 24 24"><circle class="opacity-25" cx="12" cy="12" r="10" stroke="currentColor" stroke-width="4"></circle><path class="opacity-75" fill="currentColor" d="M4 12a8 8 0 018-8V0C5.373 0 0 5.373 0 12h4zm2 5.291A7.962 7.962 0 014 12H0c0 3.042 1.135 5.824 3 7.938l3-2.647z"></path></svg> Deleting...';
+              deleteBtn.disabled = true;
+              
+              const response = await fetch(`/calculations/${calc.id}`, {
+                method: 'DELETE',
+                headers: { 'Authorization': `Bearer ${token}` }
+              });
+              
+              if (!response.ok) {
+                if (response.status === 401) {
+                  localStorage.clear();
+                  window.location.href = '/login';
+                  return;
+                }
+                throw new Error('Failed to delete calculation');
+              }
+              
+              // Use toast notification if available in layout
+              if (typeof window.showToast === 'function') {
+                window.showToast('Calculation deleted successfully', 'success');
+              } else {
+                showSuccess('Calculation deleted successfully');
+              }
+              
+              // Redirect to dashboard after a brief delay
+              setTimeout(() => {
+                window.location.href = '/dashboard';
+              }, 1000);
+              
+            } catch (error) {
+              // Restore button
+              deleteBtn.innerHTML = originalContent;
+              deleteBtn.disabled = false;
+              
+              showError(error.message || 'Error deleting calculation');
+            }
+          }
+        });
+      }
+      
+    } catch (error) {
+      // Hide loading, show error
+      document.getElementById('loadingState').classList.add('hidden');
+      document.getElementById('errorState').classList.remove('hidden');
+      showError(error.message || 'Failed to load calculation');
+    }
+  }
+
+  // Load data
+  loadCalculation();
+});
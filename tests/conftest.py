@@ -8,9 +8,29 @@ from dotenv import load_dotenv
 os.environ["ENV"] = "test"
 load_dotenv(".env.test", override=True)
 
+# Every request made by the tests must stay within its endpoint's query
+# budget and must not lazy-load relationships (app/core/query_budget.py)
+os.environ.setdefault("QUERY_BUDGET_MODE", "raise")
+
+# Every test process (each pytest-xdist worker, or "master" without xdist)
+# gets its own database, cloned from a template at session start (see
+# test_database below). Point the app at it before any engine is created.
+from sqlalchemy.engine import make_url
+from app.core.config import settings
+
+# xdist workers inherit the controller's environment, DATABASE_URL included,
+# so the configured URL is kept aside once for all of them
+BASE_DATABASE_URL = make_url(os.environ.setdefault("TEST_BASE_DATABASE_URL", settings.DATABASE_URL))
+WORKER_ID = os.environ.get("PYTEST_XDIST_WORKER", "master")
+WORKER_DATABASE = f"{BASE_DATABASE_URL.database}_{WORKER_ID}"
+settings.DATABASE_URL = os.environ["DATABASE_URL"] = (
+    BASE_DATABASE_URL.set(database=WORKER_DATABASE).render_as_string(hide_password=False)
+)
+
 # ======================================================================================
 # Original imports
 # ======================================================================================
+import hashlib
 import socket
 import subprocess
 import time
@@ -18,17 +38,24 @@ import logging
 from typing import Generator, Dict, List
 from contextlib import contextmanager
 
+import httpx
 import pytest
 import requests
+from fastapi.testclient import TestClient
 from faker import Faker
+from sqlalchemy import create_engine, delete, text
+from sqlalchemy.engine import Connection
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.pool import NullPool
+from sqlalchemy.schema import CreateIndex, CreateTable
 from playwright.sync_api import sync_playwright, Browser, Page
 
-from app.database import Base, get_engine, get_sessionmaker
+from app.database import Base, engine as app_engine, get_engine, get_sessionmaker
+from app.models import calculation, calculation_archive, calculation_dependency, calculation_job, calculation_result  # noqa: F401 (every table on Base.metadata)
 from app.models.user import User
-from app.core.config import settings
 from app.auth.jwt import get_password_hash
+from app.core.query_budget import count_queries
 
 # ======================================================================================
 # Logging Configuration
@@ -45,20 +72,84 @@ logger = logging.getLogger(__name__)
 fake = Faker()
 Faker.seed(12345)
 
-# Now that .env.test is loaded, settings.DATABASE_URL points to mytestdb
+# settings.DATABASE_URL now points to this process' own database
 test_engine = get_engine(database_url=settings.DATABASE_URL)
 TestingSessionLocal = get_sessionmaker(engine=test_engine)
 
 # ======================================================================================
-# Create/drop tables for the test database
+# Per-process test database, cloned from a template
 # ======================================================================================
+# The template holds the empty schema (Base.metadata.create_all) and is named
+# after a hash of that schema's DDL, so it is built once and reused until a
+# model changes. Cloning it (CREATE DATABASE ... TEMPLATE) is a file copy,
+# much faster than creating the tables in every worker. Templates and clones
+# are created under an advisory lock, so concurrent workers and test runs
+# build a template only once.
+TEMPLATE_PREFIX = f"{BASE_DATABASE_URL.database}_template_"
+
+
+def schema_hash() -> str:
+    """Short hash of the DDL create_all() runs for Base.metadata."""
+    dialect = test_engine.dialect
+    ddl = []
+    for table in Base.metadata.sorted_tables:
+        ddl.append(str(CreateTable(table).compile(dialect=dialect)))
+        for index in sorted(table.indexes, key=lambda index: index.name or ""):
+            ddl.append(str(CreateIndex(index).compile(dialect=dialect)))
+    return hashlib.sha256("\n".join(ddl).encode()).hexdigest()[:12]
+
+
+def ensure_template(admin: Connection) -> str:
+    """
+    Return the name of the template database for the current schema.
+
+    Builds it if it does not exist yet, and drops templates of older schemas.
+    Must be called while holding the template advisory lock.
+    """
+    name = TEMPLATE_PREFIX + schema_hash()
+    existing = set(admin.execute(
+        text("SELECT datname FROM pg_database WHERE starts_with(datname, :prefix)"), {"prefix": TEMPLATE_PREFIX}
+    ).scalars())
+    for stale in existing - {name}:
+        admin.execute(text(f'DROP DATABASE IF EXISTS "{stale}" WITH (FORCE)'))
+    if name in existing:
+        return name
+
+    logger.info(f"Building test template database {name}...")
+    admin.execute(text(f'CREATE DATABASE "{name}"'))
+    template_engine = create_engine(BASE_DATABASE_URL.set(database=name), poolclass=NullPool)
+    try:
+        Base.metadata.create_all(bind=template_engine)
+    except Exception:
+        template_engine.dispose()
+        admin.execute(text(f'DROP DATABASE IF EXISTS "{name}" WITH (FORCE)'))
+        raise
+    template_engine.dispose()
+    return name
+
+
 @pytest.fixture(scope="session", autouse=True)
-def create_test_tables():
-    logger.info("Creating test database tables...")
-    Base.metadata.create_all(bind=test_engine)
-    yield
-    logger.info("Dropping test database tables...")
-    Base.metadata.drop_all(bind=test_engine)
+def test_database(request):
+    """Clone this process' database from the template; drop it at the end unless --preserve-db."""
+    admin_engine = create_engine(BASE_DATABASE_URL, isolation_level="AUTOCOMMIT", poolclass=NullPool)
+    with admin_engine.connect() as admin:
+        admin.execute(text("SELECT pg_advisory_lock(hashtext(:key))"), {"key": TEMPLATE_PREFIX})
+        try:
+            template = ensure_template(admin)
+            admin.execute(text(f'DROP DATABASE IF EXISTS "{WORKER_DATABASE}" WITH (FORCE)'))
+            admin.execute(text(f'CREATE DATABASE "{WORKER_DATABASE}" TEMPLATE "{template}"'))
+        finally:
+            admin.execute(text("SELECT pg_advisory_unlock(hashtext(:key))"), {"key": TEMPLATE_PREFIX})
+    logger.info(f"Test database {WORKER_DATABASE} cloned from {template}.")
+    yield WORKER_DATABASE
+
+    test_engine.dispose()
+    app_engine.dispose()
+    if not request.config.getoption("--preserve-db"):
+        logger.info(f"Dropping test database {WORKER_DATABASE}...")
+        with admin_engine.connect() as admin:
+            admin.execute(text(f'DROP DATABASE IF EXISTS "{WORKER_DATABASE}" WITH (FORCE)'))
+    admin_engine.dispose()
 
 # ======================================================================================
 # Helper Functions
@@ -89,15 +180,21 @@ def managed_db_session():
 # ======================================================================================
 @pytest.fixture
 def db_session() -> Generator[Session, None, None]:
-    session = TestingSessionLocal()
+    """
+    A session inside an outer transaction that is rolled back after the test.
+
+    session.commit() only releases a SAVEPOINT, so nothing the test writes
+    is ever committed, and other connections (the app's) do not see it.
+    """
+    connection = test_engine.connect()
+    transaction = connection.begin()
+    session = TestingSessionLocal(bind=connection, join_transaction_mode="create_savepoint")
     try:
         yield session
-        session.commit()
-    except Exception:
-        session.rollback()
-        raise
     finally:
         session.close()
+        transaction.rollback()
+        connection.close()
 
 @pytest.fixture
 def fake_user_data() -> Dict[str, str]:
@@ -113,6 +210,37 @@ def test_user(db_session: Session) -> User:
     logger.info(f"Created test user ID: {user.id}")
     return user
 
+@pytest.fixture
+def committed_db_session() -> Generator[Session, None, None]:
+    """
+    A plain session whose commits are real, for tests whose data must be
+    seen by other connections (the app, worker threads, a second session).
+    """
+    session = TestingSessionLocal()
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+@pytest.fixture
+def committed_user(committed_db_session: Session) -> Generator[User, None, None]:
+    """A committed user, deleted (with its rows, ON DELETE CASCADE) after the test."""
+    user = User(**create_fake_user())
+    committed_db_session.add(user)
+    committed_db_session.commit()
+    committed_db_session.refresh(user)
+    committed_db_session.expunge(user)
+    committed_db_session.commit()  # End the refresh transaction, so no lock on users is held
+    user_id = user.id
+    yield user
+    committed_db_session.rollback()
+    committed_db_session.execute(delete(User).where(User.id == user_id))
+    committed_db_session.commit()
+
 @pytest.fixture
 def seed_users(db_session: Session, request) -> List[User]:
     num_users = getattr(request, "param", 5)
@@ -122,6 +250,16 @@ def seed_users(db_session: Session, request) -> List[User]:
     logger.info(f"Seeded {len(users)} users.")
     return users
 
+@pytest.fixture
+def query_counter():
+    """
+    count_queries() from app/core/query_budget.py, for code called directly:
+
+        with query_counter(budget=1) as log:
+            fetch_user_calculation_rows(db_session, user.id)
+    """
+    return count_queries
+
 ##############################################################################
 # Server Helper Functions
 ##################################################################################
@@ -187,6 +325,30 @@ def fastapi_server():
         process.kill()
         logger.warning("Test server forcefully stopped.")
 
+# ======================================================================================
+# E2E API Client Fixture
+# ======================================================================================
+@pytest.fixture(scope="session")
+def e2e_client(request) -> Generator[httpx.Client, None, None]:
+    """
+    An httpx client for end-to-end API tests; request paths are relative ("/health").
+
+    By default it drives app.main:app in-process through Starlette's ASGI
+    transport (TestClient), with the app's lifespan entered as uvicorn would,
+    so there is no server to start and no port to find. With --e2e-server
+    it talks to the uvicorn subprocess of fastapi_server instead; Playwright
+    tests always need that real server.
+    """
+    if request.config.getoption("--e2e-server"):
+        server_url = request.getfixturevalue("fastapi_server")
+        with httpx.Client(base_url=server_url.rstrip("/")) as client:
+            yield client
+        return
+
+    from app.main import app
+    with TestClient(app, base_url="http://testserver") as client:
+        yield client
+
 # ======================================================================================
 # Playwright Fixtures
 # ======================================================================================
@@ -225,6 +387,8 @@ def page(browser_context: Browser):
 def pytest_addoption(parser):
     parser.addoption("--preserve-db", action="store_true", help="Keep test database after tests")
     parser.addoption("--run-slow", action="store_true", help="Run tests marked as slow")
+    parser.addoption("--e2e-server", action="store_true",
+                     help="Run e2e API tests against a uvicorn subprocess instead of in-process")
 
 def pytest_collection_modifyitems(config, items):
     if not config.getoption("--run-slow"):
@@ -0,0 +1,121 @@
+# tests/integration/test_archive.py
+import uuid
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event, update
+
+from app import database
+from app.jobs.archive import archive_old_calculations
+from app.main import app
+from app.models.calculation import Calculation
+from app.models.calculation_archive import CalculationArchive
+from app.operations.calculation_graph import create_calculation
+
+client = TestClient(app)
+
+
+def age_calculations(db_session, ids, days=200):
+    """Backdate calculations so the archival job picks them up."""
+    db_session.execute(
+        update(Calculation.__table__)
+        .where(Calculation.__table__.c.id.in_(ids))
+        .values(updated_at=datetime.utcnow() - timedelta(days=days))
+    )
+    db_session.commit()
+
+
+def add_calculations(db_session, user, count):
+    calcs = []
+    for i in range(count):
+        calc = Calculation.create("addition", user.id, [i, 1])
+        calc.result = calc.get_result()
+        db_session.add(calc)
+        calcs.append(calc)
+    db_session.commit()
+    return [calc.id for calc in calcs]
+
+
+def test_archive_moves_only_old_rows(db_session, test_user):
+    ids = add_calculations(db_session, test_user, 5)
+    age_calculations(db_session, ids[:3])
+
+    moved = archive_old_calculations(db_session, timedelta(days=90), batch_size=2)
+
+    assert moved == 3
+    hot = {c.id for c in db_session.query(Calculation).filter(Calculation.user_id == test_user.id)}
+    assert hot == set(ids[3:])
+    archived = db_session.query(CalculationArchive).filter(CalculationArchive.user_id == test_user.id).all()
+    assert {a.id for a in archived} == set(ids[:3])
+    assert all(a.archived_at is not None and a.type == "addition" for a in archived)
+    assert sorted(a.result for a in archived) == [1.0, 2.0, 3.0]
+
+
+def test_archive_respects_max_batches(db_session, test_user):
+    ids = add_calculations(db_session, test_user, 4)
+    age_calculations(db_session, ids)
+
+    assert archive_old_calculations(db_session, timedelta(days=90), batch_size=1, max_batches=2) == 2
+    assert archive_old_calculations(db_session, timedelta(days=90), batch_size=10) == 2
+
+
+def test_archive_keeps_calculations_in_the_dependency_graph(db_session, test_user):
+    upstream, standalone = add_calculations(db_session, test_user, 2)
+    downstream = create_calculation(db_session, "addition", test_user.id, [{"ref": str(upstream)}, 1]).id
+    db_session.commit()
+    age_calculations(db_session, [upstream, standalone, downstream])
+
+    archive_old_calculations(db_session, timedelta(days=90))
+
+    hot = {c.id for c in db_session.query(Calculation).filter(Calculation.user_id == test_user.id)}
+    assert hot == {upstream, downstream}
+
+
+def test_list_reads_hot_rows_unless_include_archived(committed_db_session):
+    username = f"archiver_{uuid.uuid4().hex[:8]}"
+    client.post("/auth/register", json={
+        "first_name": "Arch", "last_name": "Iver", "email": f"{username}@example.com",
+        "username": username, "password": "SecurePass123!", "confirm_password": "SecurePass123!",
+    })
+    token = client.post("/auth/login", json={"username": username, "password": "SecurePass123!"}).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    old = client.post("/calculations", json={"type": "addition", "inputs": [1, 2]}, headers=headers).json()
+    new = client.post("/calculations", json={"type": "addition", "inputs": [3, 4]}, headers=headers).json()
+    age_calculations(committed_db_session, [uuid.UUID(old["id"])])
+    archive_old_calculations(committed_db_session, timedelta(days=90))
+
+    hot = client.get("/calculations", headers=headers).json()
+    assert [c["id"] for c in hot] == [new["id"]]
+
+    everything = client.get("/calculations?include_archived=true", headers=headers).json()
+    assert {c["id"] for c in everything} == {old["id"], new["id"]}
+    archived = next(c for c in everything if c["id"] == old["id"])
+    assert archived["result"] == 3.0 and archived["inputs"] == [1.0, 2.0]
+
+    # Links to archived calculations keep working
+    response = client.get(f"/calculations/{old['id']}", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["id"] == old["id"]
+
+
+def test_archive_aware_reads_are_served_by_the_replica(committed_db_session, monkeypatch):
+    username = f"archiver_{uuid.uuid4().hex[:8]}"
+    client.post("/auth/register", json={
+        "first_name": "Arch", "last_name": "Iver", "email": f"{username}@example.com",
+        "username": username, "password": "SecurePass123!", "confirm_password": "SecurePass123!",
+    })
+    token = client.post("/auth/login", json={"username": username, "password": "SecurePass123!"}).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    calc = client.post("/calculations", json={"type": "addition", "inputs": [1, 2]}, headers=headers).json()
+
+    replica = database.get_engine()  # A second engine on the same database stands in for a replica
+    statements = []
+    event.listen(replica, "before_cursor_execute", lambda conn, cursor, statement, *args: statements.append(statement))
+    # A fresh router has no record of the writes above, so the reads are not pinned to the primary
+    monkeypatch.setattr(database, "replica_router", database.ReplicaRouter(database.engine, [replica]))
+    try:
+        assert client.get(f"/calculations/{calc['id']}", headers=headers).json()["result"] == 3.0
+        assert client.get("/calculations?include_archived=true", headers=headers).status_code == 200
+    finally:
+        replica.dispose()
+    assert sum("UNION ALL" in statement for statement in statements) == 2
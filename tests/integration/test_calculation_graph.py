@@ -0,0 +1,194 @@
+# tests/integration/test_calculation_graph.py
+import threading
+import uuid
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from app.jobs.calculation_worker import run_worker
+from app.main import app
+from app.models.calculation import Calculation
+from app.models.calculation_dependency import CalculationDependency
+from app.operations import calculation_graph
+from tests.conftest import TestingSessionLocal
+
+client = TestClient(app)
+
+
+def register_and_login():
+    username = f"graph_{uuid.uuid4().hex[:8]}"
+    client.post("/auth/register", json={
+        "first_name": "Graph", "last_name": "User", "email": f"{username}@example.com",
+        "username": username, "password": "SecurePass123!", "confirm_password": "SecurePass123!",
+    })
+    token = client.post("/auth/login", json={"username": username, "password": "SecurePass123!"}).json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def create(headers, calc_type, inputs):
+    response = client.post("/calculations", json={"type": calc_type, "inputs": inputs}, headers=headers)
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+def result_of(headers, calc):
+    return client.get(f"/calculations/{calc['id']}", headers=headers).json()["result"]
+
+
+def test_create_resolves_references():
+    headers = register_and_login()
+    base = create(headers, "addition", [2, 4])
+    product = create(headers, "multiplication", [{"ref": base["id"]}, 7])
+    assert product["result"] == 42
+    assert product["inputs"] == [{"ref": base["id"]}, 7.0]
+
+    listed = {calc["id"]: calc for calc in client.get("/calculations", headers=headers).json()}
+    assert listed[product["id"]]["inputs"] == [{"ref": base["id"]}, 7.0]
+
+
+def test_reference_must_exist_and_belong_to_user():
+    owner, other = register_and_login(), register_and_login()
+    theirs = create(other, "addition", [1, 1])
+    for ref in (theirs["id"], str(uuid.uuid4())):
+        response = client.post(
+            "/calculations", json={"type": "addition", "inputs": [{"ref": ref}, 1]}, headers=owner
+        )
+        assert response.status_code == 400
+        assert "not found" in response.json()["detail"]
+
+
+def test_update_recomputes_dependents_in_topological_order():
+    headers = register_and_login()
+    a = create(headers, "addition", [1, 1])                               # 2
+    b = create(headers, "multiplication", [{"ref": a["id"]}, 10])        # 20
+    c = create(headers, "addition", [{"ref": a["id"]}, {"ref": b["id"]}])  # 22
+    d = create(headers, "subtraction", [{"ref": c["id"]}, 2])           # 20
+    unrelated = create(headers, "addition", [5, 5])
+
+    updated = client.put(f"/calculations/{a['id']}", json={"inputs": [2, 3]}, headers=headers)
+    assert updated.status_code == 200
+    assert updated.json()["result"] == 5
+    assert result_of(headers, b) == 50
+    assert result_of(headers, c) == 55
+    assert result_of(headers, d) == 53
+    assert client.get(f"/calculations/{unrelated['id']}", headers=headers).json()["updated_at"] == unrelated["updated_at"]
+
+
+def test_recompute_is_one_batched_update():
+    headers = register_and_login()
+    a = create(headers, "addition", [1, 1])
+    for factor in range(2, 6):
+        create(headers, "multiplication", [{"ref": a["id"]}, factor])
+
+    with patch.object(calculation_graph, "update", wraps=calculation_graph.update) as update_statement:
+        client.put(f"/calculations/{a['id']}", json={"inputs": [1, 2]}, headers=headers)
+    assert update_statement.call_count == 1
+
+
+def test_unchanged_result_does_not_touch_dependents():
+    headers = register_and_login()
+    a = create(headers, "addition", [1, 3])
+    b = create(headers, "multiplication", [{"ref": a["id"]}, 2])
+
+    client.put(f"/calculations/{a['id']}", json={"inputs": [2, 2]}, headers=headers)  # Still 4
+    assert client.get(f"/calculations/{b['id']}", headers=headers).json()["updated_at"] == b["updated_at"]
+
+
+def test_cycles_are_rejected():
+    headers = register_and_login()
+    a = create(headers, "addition", [1, 1])
+    b = create(headers, "addition", [{"ref": a["id"]}, 1])
+    c = create(headers, "addition", [{"ref": b["id"]}, 1])
+
+    for target, inputs in ((a, [{"ref": c["id"]}, 1]), (a, [{"ref": a["id"]}, 1])):
+        response = client.put(f"/calculations/{target['id']}", json={"inputs": inputs}, headers=headers)
+        assert response.status_code == 400
+        assert "circular" in response.json()["detail"]
+    assert result_of(headers, a) == 2
+
+
+def test_concurrent_updates_cannot_close_a_cycle(committed_db_session, committed_user):
+    a = Calculation.create("addition", committed_user.id, [1, 1])
+    b = Calculation.create("addition", committed_user.id, [2, 2])
+    a.result, b.result = 2, 4
+    committed_db_session.add_all([a, b])
+    committed_db_session.commit()
+
+    first, second = TestingSessionLocal(), TestingSessionLocal()
+    outcome = []
+
+    def point_b_at_a():
+        try:
+            calculation_graph.update_inputs(second, second.get(Calculation, b.id), [{"ref": str(a.id)}, 1])
+            outcome.append("updated")
+        except ValueError as e:
+            outcome.append(str(e))
+
+    try:
+        calculation_graph.update_inputs(first, first.get(Calculation, a.id), [{"ref": str(b.id)}, 1])
+        thread = threading.Thread(target=point_b_at_a)
+        thread.start()
+        thread.join(0.5)
+        assert thread.is_alive()  # Waits for the first edit to commit
+        first.commit()
+        thread.join(5)
+    finally:
+        second.rollback()
+        first.close()
+        second.close()
+    assert len(outcome) == 1 and "circular" in outcome[0]
+
+
+def test_failing_dependent_rolls_back_the_update():
+    headers = register_and_login()
+    a = create(headers, "addition", [1, 1])
+    quotient = create(headers, "division", [10, {"ref": a["id"]}])
+
+    response = client.put(f"/calculations/{a['id']}", json={"inputs": [1, -1]}, headers=headers)
+    assert response.status_code == 400
+    assert quotient["id"] in response.json()["detail"]
+    assert result_of(headers, a) == 2
+    assert result_of(headers, quotient) == 5
+
+
+def test_rewiring_references_replaces_edges():
+    headers = register_and_login()
+    a = create(headers, "addition", [1, 1])
+    b = create(headers, "addition", [3, 3])
+    c = create(headers, "multiplication", [{"ref": a["id"]}, 2])
+
+    client.put(f"/calculations/{c['id']}", json={"inputs": [{"ref": b["id"]}, 2]}, headers=headers)
+    assert result_of(headers, c) == 12
+
+    client.put(f"/calculations/{a['id']}", json={"inputs": [50, 50]}, headers=headers)
+    assert result_of(headers, c) == 12
+    with TestingSessionLocal() as db:
+        edges = db.execute(
+            select(CalculationDependency.upstream_id).where(CalculationDependency.downstream_id == uuid.UUID(c["id"]))
+        ).scalars().all()
+    assert edges == [uuid.UUID(b["id"])]
+
+
+def test_delete_referenced_calculation_conflicts():
+    headers = register_and_login()
+    a = create(headers, "addition", [1, 1])
+    b = create(headers, "addition", [{"ref": a["id"]}, 1])
+
+    assert client.delete(f"/calculations/{a['id']}", headers=headers).status_code == 409
+    assert client.delete(f"/calculations/{b['id']}", headers=headers).status_code == 204
+    assert client.delete(f"/calculations/{a['id']}", headers=headers).status_code == 204
+
+
+def test_async_job_resolves_references():
+    headers = register_and_login()
+    a = create(headers, "addition", [20, 1])
+    job = client.post(
+        "/calculations?async=true", json={"type": "multiplication", "inputs": [{"ref": a["id"]}, 2]}, headers=headers
+    ).json()
+    run_worker(max_jobs=100)
+    polled = client.get(f"/jobs/{job['id']}", headers=headers).json()
+    assert polled["status"] == "done"
+
+    client.put(f"/calculations/{a['id']}", json={"inputs": [1, 1]}, headers=headers)
+    assert client.get(f"/calculations/{polled['calculation_id']}", headers=headers).json()["result"] == 4
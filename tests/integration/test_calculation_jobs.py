@@ -0,0 +1,159 @@
+# tests/integration/test_calculation_jobs.py
+import uuid
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy import select, update
+from sqlalchemy.exc import OperationalError
+
+from app.core.config import settings
+from app.jobs import calculation_worker
+from app.jobs.calculation_worker import claim_job, process_job, requeue_stale_jobs, run_worker
+from app.main import app
+from app.models.calculation import Calculation
+from app.models.calculation_job import CalculationJob
+from tests.conftest import TestingSessionLocal
+
+client = TestClient(app)
+
+
+def register_and_login():
+    username = f"jobs_{uuid.uuid4().hex[:8]}"
+    client.post("/auth/register", json={
+        "first_name": "Job", "last_name": "Runner", "email": f"{username}@example.com",
+        "username": username, "password": "SecurePass123!", "confirm_password": "SecurePass123!",
+    })
+    token = client.post("/auth/login", json={"username": username, "password": "SecurePass123!"}).json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_async_create_returns_job_and_worker_completes_it():
+    headers = register_and_login()
+    response = client.post(
+        "/calculations?async=true", json={"type": "multiplication", "inputs": [6, 7]}, headers=headers
+    )
+    assert response.status_code == 202
+    job = response.json()
+    assert job["status"] == "queued" and job["calculation_id"] is None
+    assert response.headers["location"] == f"/jobs/{job['id']}"
+
+    assert client.get(f"/jobs/{job['id']}", headers=headers).json()["status"] == "queued"
+
+    assert run_worker(max_jobs=100) >= 1
+
+    polled = client.get(f"/jobs/{job['id']}", headers=headers).json()
+    assert polled["status"] == "done"
+    assert polled["started_at"] and polled["finished_at"]
+    calculation = client.get(f"/calculations/{polled['calculation_id']}", headers=headers).json()
+    assert calculation["result"] == 42
+
+
+def test_job_is_private_to_its_owner():
+    owner, other = register_and_login(), register_and_login()
+    job = client.post("/calculations?async=true", json={"type": "addition", "inputs": [1, 2]}, headers=owner).json()
+    assert client.get(f"/jobs/{job['id']}", headers=other).status_code == 404
+    assert client.get(f"/jobs/{uuid.uuid4()}", headers=owner).status_code == 404
+
+
+def test_failed_evaluation_marks_job_failed(committed_db_session, committed_user):
+    job = CalculationJob(user_id=committed_user.id, type="modulo", inputs=[1, 2])
+    committed_db_session.add(job)
+    committed_db_session.commit()
+
+    run_worker(max_jobs=100)
+
+    committed_db_session.refresh(job)
+    assert job.status == "failed"
+    assert "Unsupported calculation type" in job.error
+    assert job.calculation_id is None
+
+
+def test_claims_skip_locked_jobs(committed_db_session, committed_user):
+    run_worker(max_jobs=100)  # Start from an empty queue
+    jobs = [CalculationJob(user_id=committed_user.id, type="addition", inputs=[i, 1]) for i in range(2)]
+    committed_db_session.add_all(jobs)
+    committed_db_session.commit()
+
+    holder = TestingSessionLocal()
+    try:
+        locked = holder.execute(
+            select(CalculationJob.id).where(CalculationJob.id == jobs[0].id).with_for_update()
+        ).scalar()
+        claimer = TestingSessionLocal()
+        claimed = claim_job(claimer)
+        assert claimed.id != locked
+        assert claim_job(claimer) is None  # The only other job is still locked
+        claimer.close()
+    finally:
+        holder.rollback()
+        holder.close()
+
+
+def test_stale_running_jobs_are_requeued_then_failed(db_session, test_user):
+    started = datetime.utcnow() - timedelta(hours=1)
+    retry = CalculationJob(user_id=test_user.id, type="addition", inputs=[1, 2],
+                           status="running", attempts=1, started_at=started)
+    give_up = CalculationJob(user_id=test_user.id, type="addition", inputs=[1, 2],
+                             status="running", attempts=3, started_at=started)
+    db_session.add_all([retry, give_up])
+    db_session.commit()
+
+    assert requeue_stale_jobs(db_session, timedelta(minutes=5), max_attempts=3) >= 2
+
+    db_session.refresh(retry)
+    db_session.refresh(give_up)
+    assert retry.status == "queued" and retry.error is None
+    assert give_up.status == "failed" and give_up.finished_at is not None
+
+
+def test_requeued_job_is_completed_once(committed_db_session, committed_user):
+    run_worker(max_jobs=100)  # Start from an empty queue
+    job = CalculationJob(user_id=committed_user.id, type="addition", inputs=[2, 3])
+    committed_db_session.add(job)
+    committed_db_session.commit()
+
+    slow, fast = TestingSessionLocal(), TestingSessionLocal()
+    try:
+        first = claim_job(slow)
+        # The first worker looks dead: its claim goes stale and the job is claimed again
+        committed_db_session.execute(
+            update(CalculationJob).where(CalculationJob.id == job.id)
+            .values(started_at=datetime.utcnow() - timedelta(hours=1))
+        )
+        committed_db_session.commit()
+        requeue_stale_jobs(fast, timedelta(minutes=5), max_attempts=3)
+        second = claim_job(fast)
+        assert first.id == second.id == job.id and (first.attempts, second.attempts) == (1, 2)
+
+        assert process_job(slow, first) is False
+        assert process_job(fast, second) is True
+    finally:
+        slow.close()
+        fast.close()
+
+    committed_db_session.refresh(job)
+    assert job.status == "done"
+    stored = committed_db_session.query(Calculation).filter(Calculation.user_id == committed_user.id).all()
+    assert [calc.id for calc in stored] == [job.calculation_id]
+
+
+def test_worker_survives_database_errors(committed_db_session, committed_user, monkeypatch):
+    run_worker(max_jobs=100)  # Start from an empty queue
+    job = CalculationJob(user_id=committed_user.id, type="addition", inputs=[2, 3])
+    committed_db_session.add(job)
+    committed_db_session.commit()
+
+    calls = []
+
+    def flaky_claim(db):
+        calls.append(db)
+        if len(calls) == 1:
+            raise OperationalError("SELECT 1", {}, Exception("server closed the connection unexpectedly"))
+        return claim_job(db)
+
+    monkeypatch.setattr(calculation_worker, "claim_job", flaky_claim)
+    monkeypatch.setattr(settings, "JOB_POLL_INTERVAL_SECONDS", 0.01)
+    assert run_worker(max_jobs=100) == 1
+
+    committed_db_session.refresh(job)
+    assert job.status == "done"
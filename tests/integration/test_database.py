@@ -6,6 +6,9 @@ from sqlalchemy.engine import Engine
 from sqlalchemy.orm.session import Session
 import importlib
 import sys
+import uuid
+
+from sqlalchemy import select, text
 
 DATABASE_MODULE = "app.database"
 
@@ -53,3 +56,88 @@ def test_get_sessionmaker(mock_settings):
     engine = database.get_engine()
     SessionLocal = database.get_sessionmaker(engine)
     assert isinstance(SessionLocal, sessionmaker)
+
+def test_engine_uses_configured_pool(mock_settings):
+    """Test that get_engine applies the pool settings and instrumentation."""
+    database = reload_database_module()
+    engine = database.get_engine()
+    assert isinstance(engine.pool, database.TimedQueuePool)
+    assert engine.pool.size() == database.settings.POOL_SIZE
+    assert engine.pool._max_overflow == database.settings.MAX_OVERFLOW
+    assert engine.pool._pre_ping == database.settings.POOL_PRE_PING
+
+def test_pool_metrics_track_checkouts():
+    """Test that pool event listeners record checkouts, wait time and gauges."""
+    database = reload_database_module()
+    engine = database.get_engine()
+    try:
+        before = database.get_pool_metrics(engine)
+        assert before["checkouts"] == 0
+        with engine.connect() as conn:
+            during = database.get_pool_metrics(engine)
+            assert during["checked_out"] == 1
+            assert during["checkouts"] == 1
+            assert during["connections_created"] == 1
+        after = database.get_pool_metrics(engine)
+        assert after["checked_out"] == 0
+        assert after["checked_out_max"] == 1
+        assert after["checkout_wait_seconds_total"] >= 0
+        assert after["pool_size"] == database.settings.POOL_SIZE
+    finally:
+        engine.dispose()
+
+def test_pool_metrics_survive_dispose():
+    """Test that listeners (and metrics) survive engine.dispose() recreating the pool."""
+    database = reload_database_module()
+    engine = database.get_engine()
+    try:
+        with engine.connect():
+            pass
+        engine.dispose()
+        with engine.connect():
+            pass
+        metrics = database.get_pool_metrics(engine)
+        assert metrics["checkouts"] == 2
+        assert isinstance(engine.pool, database.TimedQueuePool)
+    finally:
+        engine.dispose()
+
+def test_read_session_routes_selects_to_replica(monkeypatch):
+    """Test that read_session() reads from a replica and writes pin a user to the primary."""
+    database = reload_database_module()
+    from app.models.calculation import Addition
+    from app.models.user import User
+
+    replica = database.get_engine()  # A second engine on the same database stands in for a replica
+    router = database.ReplicaRouter(database.engine, [replica], read_your_writes_seconds=60)
+    monkeypatch.setattr(database, "replica_router", router)
+    writer = database.SessionLocal()
+    user = User(
+        first_name="Replica", last_name="Reader", email=f"replica-{uuid.uuid4()}@example.com",
+        username=f"replica-{uuid.uuid4()}", password="x",
+    )
+    try:
+        writer.add(user)
+        writer.commit()
+        assert not router.wrote_recently(user.id)
+
+        session = next(database.read_session(user.id))
+        assert session.info["replica"] is replica
+        assert session.execute(select(text("1"))).scalar() == 1
+        assert router.replica_lag(replica) == 0.0  # Not in recovery, so no lag
+        # One checkout for the lag check, one for the SELECT
+        assert database.get_pool_metrics(replica)["checkouts"] == 2
+        session.close()
+
+        # Committing a calculation owned by the user pins their reads to the primary
+        writer.add(Addition(user_id=user.id, inputs=[1, 2]))
+        writer.commit()
+        assert router.wrote_recently(user.id)
+        session = next(database.read_session(user.id))
+        assert "replica" not in session.info
+        session.close()
+    finally:
+        writer.delete(user)
+        writer.commit()
+        writer.close()
+        replica.dispose()
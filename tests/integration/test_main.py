@@ -1,6 +1,7 @@
 # tests/integration/test_main.py
 import pytest
 from fastapi.testclient import TestClient
+from app.core.config import settings
 from app.main import app
 from app.models import calculation 
 from app.models.user import User
@@ -190,6 +191,15 @@ def test_update_calculation_not_found(auth_headers):
     response = client.put(f"/calculations/{fake_id}", json=update_payload, headers=auth_headers)
     assert response.status_code == 404
 
+@pytest.mark.parametrize("calc_type, inputs", [
+    ("multiplication", [1e308, 10]),  # Overflows to infinity, which JSON cannot carry
+    ("lcm", [1e300, 9.999999999999999e299]),  # An exact int beyond the float range
+])
+def test_create_calculation_overflowing_result(auth_headers, calc_type, inputs):
+    response = client.post("/calculations", json={"type": calc_type, "inputs": inputs}, headers=auth_headers)
+    assert response.status_code == 400
+    assert "too large" in response.json()["detail"]
+
 def test_delete_calculation_not_found(auth_headers):
     import uuid
     fake_id = str(uuid.uuid4())
@@ -287,3 +297,33 @@ def test_login_json_force_none(monkeypatch):
 
 
 
+
+def test_pages_load_scripts_from_static():
+    """Page scripts are served as static files instead of being inlined"""
+    response = client.get("/dashboard")
+    assert 'src="/static/' in response.text and "/js/dashboard." in response.text
+    response = client.get("/dashboard/view/abc123")
+    assert 'data-calc-id="abc123"' in response.text
+    script = client.get("/static/js/view_calculation.js")
+    assert script.status_code == 200
+    assert "document.currentScript.dataset.calcId" in script.text
+
+def test_pages_are_served_with_etag():
+    """Cached pages carry an ETag and answer revalidation with 304"""
+    response = client.get("/login")
+    etag = response.headers["etag"]
+    assert 'href="/register"' in response.text
+    response = client.get("/login", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+def test_pool_health_endpoint(auth_headers, monkeypatch):
+    """Verify the /health/pool endpoint exposes pool metrics to admins only"""
+    assert client.get("/health/pool").status_code == 401
+    assert client.get("/health/pool", headers=auth_headers).status_code == 403
+
+    monkeypatch.setattr(settings, "ADMIN_USERNAMES", ["calctester"])
+    response = client.get("/health/pool", headers=auth_headers)
+    assert response.status_code == 200
+    data = response.json()
+    for key in ["checkouts", "checkout_wait_seconds_total", "checked_out", "overflow", "pool_size"]:
+        assert key in data
@@ -0,0 +1,104 @@
+# tests/integration/test_metrics.py
+import os
+import subprocess
+import sys
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+from prometheus_client.parser import text_string_to_metric_families
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+from app.main import app
+
+client = TestClient(app)
+
+
+def sample(body: str, name: str, **labels) -> float:
+    for family in text_string_to_metric_families(body):
+        for s in family.samples:
+            if s.name == name and all(s.labels.get(k) == v for k, v in labels.items()):
+                return s.value
+    return 0.0
+
+
+def register_and_login():
+    username = f"metrics_{uuid.uuid4().hex[:8]}"
+    client.post("/auth/register", json={
+        "first_name": "Metric", "last_name": "User", "email": f"{username}@example.com",
+        "username": username, "password": "SecurePass123!", "confirm_password": "SecurePass123!",
+    })
+    token = client.post("/auth/login", json={"username": username, "password": "SecurePass123!"}).json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_latency_is_labelled_by_route_template():
+    headers = register_and_login()
+    calc = client.post("/calculations", json={"type": "addition", "inputs": [1, 2]}, headers=headers).json()
+    route = "/calculations/{calc_id}"
+    before = sample(client.get("/metrics").text, "http_request_duration_seconds_count",
+                    method="GET", route=route, status="200")
+
+    client.get(f"/calculations/{calc['id']}", headers=headers)
+    client.get(f"/calculations/{calc['id']}", headers=headers)
+    client.get(f"/calculations/{uuid.uuid4()}", headers=headers)
+
+    body = client.get("/metrics").text
+    assert sample(body, "http_request_duration_seconds_count", method="GET", route=route, status="200") == before + 2
+    assert sample(body, "http_request_duration_seconds_count", method="GET", route=route, status="404") >= 1
+    assert calc["id"] not in body  # Raw paths never become labels
+
+
+def test_sql_bcrypt_and_in_flight_metrics():
+    register_and_login()
+    body = client.get("/metrics").text
+    assert sample(body, "db_queries_per_request_count", route="/auth/register") >= 1
+    assert sample(body, "db_queries_per_request_sum", route="/auth/register") >= 1
+    assert sample(body, "db_queries_total") > 0
+    assert sample(body, "bcrypt_duration_seconds_count", operation="hash") >= 1
+    assert sample(body, "bcrypt_duration_seconds_count", operation="verify") >= 1
+    # The /metrics request itself is in flight while rendering
+    assert sample(body, "http_requests_in_progress") >= 1
+
+
+def test_failed_statements_leave_no_start_time(db_session):
+    connection = db_session.connection()
+    for _ in range(3):
+        with pytest.raises(DBAPIError):
+            with connection.begin_nested():
+                connection.execute(text("SELECT 1/0"))
+    connection.execute(text("SELECT 1"))
+    assert "metrics_query_start" not in connection.info
+
+
+def test_unmatched_paths_share_one_label():
+    client.get(f"/no-such-page/{uuid.uuid4()}")
+    body = client.get("/metrics").text
+    assert sample(body, "http_request_duration_seconds_count", route="<unmatched>", status="404") >= 1
+
+
+WORKER = """
+import sys
+from app.core.metrics import REQUEST_LATENCY, REQUESTS_IN_PROGRESS, mark_process_dead
+REQUEST_LATENCY.labels("GET", "/calculations", "200").observe(0.01)
+REQUESTS_IN_PROGRESS.inc()
+if sys.argv[1] == "shutdown":
+    mark_process_dead()
+"""
+
+COLLECT = """
+from app.core.metrics import generate_metrics
+print(generate_metrics().decode())
+"""
+
+
+def test_multiprocess_mode_merges_worker_processes(tmp_path):
+    env = dict(os.environ, PROMETHEUS_MULTIPROC_DIR=str(tmp_path))
+    for mode in ("shutdown", "shutdown", "killed"):
+        subprocess.run([sys.executable, "-c", WORKER, mode], env=env, check=True)
+    body = subprocess.run([sys.executable, "-c", COLLECT], env=env, check=True,
+                          capture_output=True, text=True).stdout
+    assert sample(body, "http_request_duration_seconds_count", route="/calculations") == 3
+    # Workers that shut down cleanly drop their in-flight gauge
+    assert sample(body, "http_requests_in_progress") == 1
@@ -0,0 +1,153 @@
+# tests/integration/test_partition_migration.py
+"""
+Runs the calculations partitioning migration inside a scratch schema.
+
+The schema gets its own copy of the calculations table (users stays in
+public), and search_path points the migration's unqualified table names
+at it, so the shared test tables are never touched.
+"""
+import importlib.util
+from pathlib import Path
+
+import pytest
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.models.calculation import Calculation
+from tests.conftest import test_engine
+
+MIGRATION_PATH = next(Path("migrations/versions").glob("9b2f4c7d1e30_*.py"))
+SCHEMA = "partition_migration_test"
+
+
+def load_migration():
+    spec = importlib.util.spec_from_file_location("partition_migration", MIGRATION_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_migration(conn, step):
+    """Run the migration's upgrade/downgrade the way alembic would."""
+    context = MigrationContext.configure(conn)
+    with Operations.context(context), context.begin_transaction():
+        step()
+
+
+@pytest.fixture
+def scratch(committed_user):
+    """A connection whose search_path resolves calculations to a scratch table."""
+    user_id = committed_user.id
+
+    conn = test_engine.connect()
+    conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+    conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+    conn.execute(text(f"CREATE TABLE {SCHEMA}.calculations (LIKE public.calculations INCLUDING ALL)"))
+    conn.execute(text(f"""
+        ALTER TABLE {SCHEMA}.calculations ADD FOREIGN KEY (user_id)
+        REFERENCES public.users (id) ON DELETE CASCADE
+    """))
+    conn.execute(text(f"SET search_path TO {SCHEMA}, public"))
+    conn.commit()
+    try:
+        yield conn, user_id
+    finally:
+        conn.rollback()
+        conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        conn.execute(text("SET search_path TO public"))
+        conn.commit()
+        conn.close()
+
+
+def seed(conn, user_id, count):
+    session = Session(bind=conn)
+    for i in range(count):
+        session.add(Calculation.create("addition", user_id, [i, 1]))
+    session.commit()
+    session.close()
+
+
+def test_upgrade_partitions_and_copies_rows(scratch, monkeypatch):
+    conn, user_id = scratch
+    seed(conn, user_id, 25)
+    monkeypatch.setenv("CALCULATION_PARTITIONS", "4")
+    monkeypatch.setenv("CALCULATION_COPY_BATCH_SIZE", "7")
+
+    run_migration(conn, load_migration().upgrade)
+
+    assert conn.execute(text("""
+        SELECT count(*) FROM pg_partitioned_table
+        WHERE partrelid = 'calculations'::regclass
+    """)).scalar() == 1
+    assert conn.execute(text("""
+        SELECT count(*) FROM pg_inherits WHERE inhparent = 'calculations'::regclass
+    """)).scalar() == 4
+    assert conn.execute(text("SELECT count(*) FROM calculations")).scalar() == 25
+    indexes = set(conn.execute(text(
+        "SELECT indexname FROM pg_indexes WHERE schemaname = :schema AND tablename = 'calculations'"
+    ), {"schema": SCHEMA}).scalars())
+    assert indexes == {"calculations_pkey", "ix_calculations_user_id", "ix_calculations_type"}
+
+
+def test_model_works_unchanged_after_upgrade(scratch):
+    conn, user_id = scratch
+    seed(conn, user_id, 3)
+    run_migration(conn, load_migration().upgrade)
+
+    session = Session(bind=conn)
+    calc = Calculation.create("multiplication", user_id, [2, 3])
+    calc.result = calc.get_result()
+    session.add(calc)
+    session.commit()
+
+    loaded = session.query(Calculation).filter(
+        Calculation.id == calc.id, Calculation.user_id == user_id
+    ).one()
+    assert loaded.result == 6
+    loaded.inputs = [4, 5]
+    loaded.result = loaded.get_result()
+    session.commit()
+    session.delete(loaded)
+    session.commit()
+    assert session.query(Calculation).filter(Calculation.user_id == user_id).count() == 3
+    session.close()
+
+
+def test_mirror_trigger_keeps_new_table_in_sync(scratch):
+    conn, user_id = scratch
+    migration = load_migration()
+    run_migration(conn, lambda: (
+        migration.create_partitioned_table(conn, 2),
+        migration.install_mirror_trigger(conn),
+    ))
+    seed(conn, user_id, 2)
+    calc_id = conn.execute(text("SELECT id FROM calculations LIMIT 1")).scalar()
+    conn.execute(text("UPDATE calculations SET result = 42 WHERE id = :id"), {"id": calc_id})
+    conn.commit()
+    assert conn.execute(text(
+        "SELECT result FROM calculations_partitioned WHERE id = :id"
+    ), {"id": calc_id}).scalar() == 42
+
+    conn.execute(text("DELETE FROM calculations WHERE id = :id"), {"id": calc_id})
+    conn.commit()
+    assert conn.execute(text("SELECT count(*) FROM calculations_partitioned")).scalar() == 1
+
+
+def test_downgrade_restores_plain_table(scratch):
+    conn, user_id = scratch
+    seed(conn, user_id, 5)
+    migration = load_migration()
+    run_migration(conn, migration.upgrade)
+    run_migration(conn, migration.downgrade)
+
+    assert conn.execute(text("""
+        SELECT count(*) FROM pg_partitioned_table
+        WHERE partrelid = 'calculations'::regclass
+    """)).scalar() == 0
+    assert conn.execute(text("SELECT count(*) FROM calculations")).scalar() == 5
+    assert conn.execute(text(
+        "SELECT pg_get_constraintdef(oid) FROM pg_constraint WHERE conname = 'calculations_pkey' "
+        "AND connamespace = :schema ::regnamespace"
+    ), {"schema": SCHEMA}).scalar() == "PRIMARY KEY (id)"
@@ -0,0 +1,62 @@
+# tests/integration/test_profiler.py
+import time
+import uuid
+
+from fastapi.testclient import TestClient
+
+import app.main as main_module
+from app.core.config import settings
+from app.main import app
+
+client = TestClient(app)
+
+
+def register_and_login():
+    username = f"profiler_{uuid.uuid4().hex[:8]}"
+    client.post("/auth/register", json={
+        "first_name": "Pro", "last_name": "Filer", "email": f"{username}@example.com",
+        "username": username, "password": "SecurePass123!", "confirm_password": "SecurePass123!",
+    })
+    token = client.post("/auth/login", json={"username": username, "password": "SecurePass123!"}).json()["access_token"]
+    return username, {"Authorization": f"Bearer {token}"}
+
+
+def slow_dump(original):
+    """Wrap dump_calculation_rows so the request is long enough to be sampled."""
+    def slow_dump_calculation_rows(rows):
+        deadline = time.perf_counter() + 0.05
+        while time.perf_counter() < deadline:
+            pass
+        return original(rows)
+    return slow_dump_calculation_rows
+
+
+def test_worker_profile_is_admin_only(monkeypatch):
+    username, headers = register_and_login()
+    assert client.post("/admin/profile?seconds=0.05", headers=headers).status_code == 403
+
+    monkeypatch.setattr(settings, "ADMIN_USERNAMES", [username])
+    response = client.post("/admin/profile?seconds=0.2", headers=headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "attachment" in response.headers["content-disposition"]
+    for line in response.text.splitlines():
+        stack, count = line.rsplit(" ", 1)
+        assert stack and int(count) > 0
+
+
+def test_profile_query_parameter_returns_the_request_profile(monkeypatch):
+    username, headers = register_and_login()
+    client.post("/calculations", json={"type": "addition", "inputs": [1, 2]}, headers=headers)
+    monkeypatch.setattr(main_module, "dump_calculation_rows", slow_dump(main_module.dump_calculation_rows))
+
+    # Non-admins are served normally
+    response = client.get("/calculations?profile=1", headers=headers)
+    assert response.status_code == 200 and response.json()[0]["result"] == 3
+
+    monkeypatch.setattr(settings, "ADMIN_USERNAMES", [username])
+    response = client.get("/calculations?profile=1", headers=headers)
+    assert response.status_code == 200
+    assert response.headers["x-profiled-status"] == "200"
+    stacks = response.text.splitlines()
+    assert any("list_calculations (app/main.py)" in line and "slow_dump_calculation_rows" in line for line in stacks)
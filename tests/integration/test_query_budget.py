@@ -0,0 +1,120 @@
+# tests/integration/test_query_budget.py
+import logging
+import uuid
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app.core.query_budget import QueryBudgetExceeded, QueryBudgetMiddleware, count_queries, query_budget
+from app.database import SessionLocal
+from app.main import app
+from app.models.calculation import Calculation
+from app.models.user import User
+from app.queries.calculation import fetch_user_calculation_rows
+
+client = TestClient(app)
+
+
+def register_and_login():
+    username = f"budget_{uuid.uuid4().hex[:8]}"
+    client.post("/auth/register", json={
+        "first_name": "Budget", "last_name": "User", "email": f"{username}@example.com",
+        "username": username, "password": "SecurePass123!", "confirm_password": "SecurePass123!",
+    })
+    token = client.post("/auth/login", json={"username": username, "password": "SecurePass123!"}).json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def budget_app(mode: str) -> TestClient:
+    """A tiny app whose endpoints run a fixed number of statements."""
+    budget_app = FastAPI()
+
+    @budget_app.get("/two")
+    @query_budget(1)
+    def two_queries():
+        with SessionLocal() as db:
+            db.execute(text("SELECT 1"))
+            db.execute(text("SELECT 2"))
+        return {"ok": True}
+
+    @budget_app.get("/unbudgeted")
+    def unbudgeted():
+        with SessionLocal() as db:
+            db.execute(text("SELECT 1"))
+            db.execute(text("SELECT 2"))
+        return {"ok": True}
+
+    budget_app.add_middleware(QueryBudgetMiddleware, mode=mode)
+    return TestClient(budget_app)
+
+
+def test_list_and_get_use_one_query_regardless_of_row_count():
+    headers = register_and_login()
+    ids = [
+        client.post("/calculations", json={"type": "addition", "inputs": [i, 1]}, headers=headers).json()["id"]
+        for i in range(5)
+    ]
+
+    listed = client.get("/calculations", headers=headers)
+    assert len(listed.json()) == 5
+    assert listed.headers["x-query-count"] == "1"
+    assert client.get("/calculations?include_archived=true", headers=headers).headers["x-query-count"] == "1"
+
+    fetched = client.get(f"/calculations/{ids[0]}", headers=headers)
+    assert fetched.json()["result"] == 1.0
+    assert fetched.headers["x-query-count"] == "1"
+
+    missing = client.get(f"/calculations/{uuid.uuid4()}", headers=headers)
+    assert missing.status_code == 404 and missing.headers["x-query-count"] == "1"
+
+
+def test_raise_mode_replaces_the_response_of_an_endpoint_over_budget():
+    response = budget_app("raise").get("/two")
+    assert response.status_code == 500
+    assert "2 SQL statements executed, budget is 1" in response.json()["detail"]
+    assert response.headers["x-query-count"] == "2"
+
+
+def test_log_mode_logs_the_statements_and_keeps_the_response(caplog):
+    with caplog.at_level(logging.ERROR, logger="app.core.query_budget"):
+        response = budget_app("log").get("/two")
+    assert response.status_code == 200 and response.json() == {"ok": True}
+    assert "Query budget exceeded in GET two_queries" in caplog.text
+    assert "[2] SELECT 2" in caplog.text
+
+
+def test_endpoints_without_a_budget_are_only_counted():
+    response = budget_app("raise").get("/unbudgeted")
+    assert response.status_code == 200
+    assert response.headers["x-query-count"] == "2"
+
+
+def test_lazy_loads_of_relationships_are_detected(db_session, test_user):
+    calculation = Calculation.create("addition", test_user.id, [1, 2])
+    calculation.result = 3
+    db_session.add(calculation)
+    db_session.commit()
+    calc_id, user_id = calculation.id, test_user.id
+    db_session.expunge_all()
+
+    calculation = db_session.get(Calculation, calc_id)
+    with pytest.raises(QueryBudgetExceeded, match="lazy load of Calculation.user"):
+        with count_queries():
+            calculation.user
+
+    user = db_session.get(User, user_id)
+    with pytest.raises(QueryBudgetExceeded, match="lazy load of User.calculations"):
+        with count_queries():
+            user.calculations
+
+
+def test_query_counter_fixture_checks_direct_calls(db_session, test_user, query_counter):
+    with query_counter(budget=1, name="fetch_user_calculation_rows") as log:
+        fetch_user_calculation_rows(db_session, test_user.id, include_archived=True)
+    assert log.count == 1
+
+    with pytest.raises(QueryBudgetExceeded, match="budget is 0"):
+        with query_counter(budget=0):
+            db_session.execute(text("SELECT 1"))
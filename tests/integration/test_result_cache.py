@@ -0,0 +1,79 @@
+# tests/integration/test_result_cache.py
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core import result_cache as result_cache_module
+from app.core.config import settings
+from app.core.result_cache import MemoryResultStore, PostgresResultStore, ResultCache, cache_key
+from app.main import app
+from tests.conftest import test_engine
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def shared_cache(monkeypatch):
+    cache = ResultCache([MemoryResultStore()])
+    monkeypatch.setattr(result_cache_module, "result_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def admin_headers(monkeypatch):
+    username = f"cache_admin_{uuid.uuid4().hex[:8]}"
+    monkeypatch.setattr(settings, "ADMIN_USERNAMES", [username])
+    return register_and_login(username)
+
+
+def register_and_login(username=None):
+    username = username or f"cache_{uuid.uuid4().hex[:8]}"
+    client.post("/auth/register", json={
+        "first_name": "Cache", "last_name": "User", "email": f"{username}@example.com",
+        "username": username, "password": "SecurePass123!", "confirm_password": "SecurePass123!",
+    })
+    token = client.post("/auth/login", json={"username": username, "password": "SecurePass123!"}).json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_identical_calculations_share_results_across_users(shared_cache, admin_headers):
+    first, second = register_and_login(), register_and_login()
+    body = {"type": "division", "inputs": [22, 7]}
+
+    assert client.post("/calculations", json=body, headers=first).json()["result"] == 22 / 7
+    assert client.post("/calculations", json=body, headers=second).json()["result"] == 22 / 7
+
+    stats = client.get("/health/result-cache", headers=admin_headers).json()
+    assert stats["hits"] == 1 and stats["misses"] == 1
+    assert stats["bytes_saved"] > 0
+
+
+def test_update_and_references_consult_the_cache(shared_cache):
+    headers = register_and_login()
+    base = client.post("/calculations", json={"type": "addition", "inputs": [1, 2]}, headers=headers).json()
+    client.post("/calculations", json={"type": "multiplication", "inputs": [{"ref": base["id"]}, 2]}, headers=headers)
+    # [3, 2] resolved from the reference is the same content as literal inputs
+    client.post("/calculations", json={"type": "multiplication", "inputs": [3, 2]}, headers=headers)
+    assert shared_cache.stats()["hits"] == 1
+
+    client.put(f"/calculations/{base['id']}", json={"inputs": [1, 2]}, headers=headers)
+    assert shared_cache.stats()["hits"] >= 2
+
+
+def test_cache_disabled_reports_it(admin_headers):
+    assert client.get("/health/result-cache", headers=admin_headers).json() == {"enabled": False}
+
+
+def test_cache_stats_are_admin_only():
+    assert client.get("/health/result-cache").status_code == 401
+    assert client.get("/health/result-cache", headers=register_and_login()).status_code == 403
+
+
+def test_postgres_store_round_trip():
+    store = PostgresResultStore(test_engine)
+    key = cache_key("addition", [uuid.uuid4().int % 1000, 1])
+    assert store.get_many([key]) == [None]
+    store.set_many({key: 5.0})
+    store.set_many({key: 5.0})  # Duplicate inserts are ignored
+    assert store.get_many([key]) == [5.0]
@@ -0,0 +1,58 @@
+# tests/integration/test_server_timing.py
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+from app.main import app
+
+client = TestClient(app)
+
+
+def timings(response) -> dict:
+    entries = {}
+    for part in response.headers["server-timing"].split(","):
+        name, _, duration = part.strip().partition(";dur=")
+        entries[name] = float(duration)
+    return entries
+
+
+def register_and_login():
+    username = f"timing_{uuid.uuid4().hex[:8]}"
+    client.post("/auth/register", json={
+        "first_name": "Timing", "last_name": "User", "email": f"{username}@example.com",
+        "username": username, "password": "SecurePass123!", "confirm_password": "SecurePass123!",
+    })
+    token = client.post("/auth/login", json={"username": username, "password": "SecurePass123!"}).json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_api_responses_break_down_auth_db_eval_and_serialization():
+    headers = register_and_login()
+    created = client.post("/calculations", json={"type": "multiplication", "inputs": [6, 7]}, headers=headers)
+    phases = timings(created)
+    assert phases["auth"] > 0
+    assert phases["db"] > 0
+    assert phases["eval"] > 0
+    assert phases["serialize"] > 0
+    assert phases["total"] >= phases["db"]
+
+    listed = timings(client.get("/calculations", headers=headers))
+    assert listed["db"] > 0 and listed["serialize"] > 0 and listed["eval"] == 0
+
+
+def test_unauthenticated_and_error_responses_carry_the_header():
+    assert "server-timing" in client.get("/health").headers
+    assert "server-timing" in client.get("/calculations").headers  # 401
+
+
+def test_failed_statements_leave_no_start_time(db_session):
+    connection = db_session.connection()
+    for _ in range(3):
+        with pytest.raises(DBAPIError):
+            with connection.begin_nested():
+                connection.execute(text("SELECT 1/0"))
+    connection.execute(text("SELECT 1"))
+    assert "server_timing_start" not in connection.info
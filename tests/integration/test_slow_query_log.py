@@ -0,0 +1,131 @@
+# tests/integration/test_slow_query_log.py
+import logging
+import time
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.core.config import settings
+from app.database import SlowQueryLog, get_engine, instrument_slow_queries
+from app.main import app
+
+client = TestClient(app)
+
+
+def register_and_login():
+    username = f"slowlog_{uuid.uuid4().hex[:8]}"
+    client.post("/auth/register", json={
+        "first_name": "Slow", "last_name": "Log", "email": f"{username}@example.com",
+        "username": username, "password": "SecurePass123!", "confirm_password": "SecurePass123!",
+    })
+    token = client.post("/auth/login", json={"username": username, "password": "SecurePass123!"}).json()["access_token"]
+    return username, {"Authorization": f"Bearer {token}"}
+
+
+def wait_for_plan(log, fragment, timeout=5.0):
+    """Return the plan of the shape containing `fragment`, once the EXPLAIN thread has stored it."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        for shape in log.snapshot()["shapes"]:
+            if fragment in shape["statement"] and shape["plan"] is not None:
+                return shape["plan"]
+        time.sleep(0.01)
+    raise AssertionError(f"No plan for {fragment!r} after {timeout}s")
+
+
+@pytest.fixture
+def logged_engine():
+    """A separate engine whose every statement counts as slow."""
+    engine = get_engine(settings.DATABASE_URL)
+    log = SlowQueryLog(threshold_seconds=0, max_entries=3)
+    instrument_slow_queries(engine, log)
+    yield engine, log
+    log.close()
+    engine.dispose()
+
+
+def test_slow_statements_are_logged_with_redacted_parameters(logged_engine, caplog):
+    engine, log = logged_engine
+    with caplog.at_level(logging.WARNING, logger="app.database"):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT CAST(:secret AS text) AS value"), {"secret": "hunter2"})
+
+    assert "hunter2" not in caplog.text
+    assert "{'secret': '<str>'}" in caplog.text
+    recent = log.snapshot()["recent"]
+    assert recent[0]["parameters"] == {"secret": "<str>"}
+
+
+def test_first_statement_of_each_shape_is_explained_once(logged_engine):
+    engine, log = logged_engine
+    with engine.connect() as conn:
+        for limit in (1, 2, 3):
+            conn.execute(text("SELECT id FROM users WHERE username = :name LIMIT :n"), {"name": "x", "n": limit})
+
+    shapes = [s for s in log.snapshot()["shapes"] if "FROM users" in s["statement"]]
+    assert len(shapes) == 1
+    assert shapes[0]["count"] == 3
+    plan = wait_for_plan(log, "FROM users")
+    assert plan[0]["Plan"]["Node Type"] == "Limit"
+    # The EXPLAIN itself is not logged as a slow statement
+    assert not any(s["statement"].startswith("EXPLAIN") for s in log.snapshot()["shapes"])
+
+
+def test_ring_buffer_keeps_the_newest_entries(logged_engine):
+    engine, log = logged_engine
+    with engine.connect() as conn:
+        for i in range(5):
+            conn.execute(text(f"SELECT {i} AS n_{i}"))
+
+    snapshot = log.snapshot()
+    assert len(snapshot["recent"]) == 3
+    assert len(snapshot["shapes"]) == 3
+    assert snapshot["shapes"][0]["statement"] == "SELECT ? AS n_4"
+
+
+def test_explain_does_not_need_a_connection_from_the_pool():
+    # The only pooled connection is busy running the slow statement
+    engine = create_engine(settings.DATABASE_URL, pool_size=1, max_overflow=0, pool_timeout=30)
+    log = SlowQueryLog(threshold_seconds=0)
+    instrument_slow_queries(engine, log)
+    try:
+        with engine.connect() as conn:
+            started = time.monotonic()
+            conn.execute(text("SELECT id FROM users WHERE email = :email"), {"email": "x"})
+            assert time.monotonic() - started < 1
+            assert wait_for_plan(log, "FROM users")[0]["Plan"]["Node Type"]
+    finally:
+        log.close()
+        engine.dispose()
+
+
+def test_explain_is_cut_off_by_statement_timeout():
+    engine = create_engine(settings.DATABASE_URL)
+    log = SlowQueryLog(threshold_seconds=0, explain_timeout_ms=100)
+    table = f"slowlog_locked_{uuid.uuid4().hex[:8]}"
+    try:
+        with engine.begin() as conn:
+            conn.execute(text(f"CREATE TABLE {table} (id int)"))
+        with engine.connect() as holder:
+            holder.execute(text(f"LOCK TABLE {table} IN ACCESS EXCLUSIVE MODE"))
+            plan = log.explain_plan(log.explain_engine(engine), f"SELECT id FROM {table}", None)
+            holder.rollback()
+        assert "statement timeout" in plan["error"]
+    finally:
+        with engine.begin() as conn:
+            conn.execute(text(f"DROP TABLE IF EXISTS {table}"))
+        log.close()
+        engine.dispose()
+
+
+def test_admin_endpoint_requires_an_admin(monkeypatch):
+    username, headers = register_and_login()
+    assert client.get("/admin/slow-queries", headers=headers).status_code == 403
+    assert client.get("/admin/slow-queries").status_code == 401
+
+    monkeypatch.setattr(settings, "ADMIN_USERNAMES", [username])
+    response = client.get("/admin/slow-queries", headers=headers)
+    assert response.status_code == 200
+    assert {"enabled", "threshold_ms", "recent", "shapes"} <= response.json().keys()
@@ -0,0 +1,143 @@
+# tests/integration/test_stale_results.py
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from app.jobs.backfill_results import backfill_results
+from app.main import app
+from app.models import calculation as calculation_model
+from app.models.calculation import Calculation
+from app.operations.calculation_graph import create_calculation
+from tests.conftest import TestingSessionLocal
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def bumped_division(monkeypatch):
+    """Pretend Division.get_result() was fixed: rows below version 2 are stale."""
+    monkeypatch.setitem(calculation_model.ENGINE_VERSIONS, "division", 2)
+    return 2
+
+
+def register_and_login():
+    username = f"engine_{uuid.uuid4().hex[:8]}"
+    client.post("/auth/register", json={
+        "first_name": "Engine", "last_name": "User", "email": f"{username}@example.com",
+        "username": username, "password": "SecurePass123!", "confirm_password": "SecurePass123!",
+    })
+    token = client.post("/auth/login", json={"username": username, "password": "SecurePass123!"}).json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def corrupt(calc_id, result, engine_version=1):
+    """Store a wrong result, as an old engine version would have."""
+    with TestingSessionLocal() as db:
+        db.execute(
+            Calculation.__table__.update()
+            .where(Calculation.__table__.c.id == uuid.UUID(calc_id))
+            .values(result=result, engine_version=engine_version)
+        )
+        db.commit()
+
+
+def stored(calc_id):
+    with TestingSessionLocal() as db:
+        c = Calculation.__table__.c
+        return db.execute(select(c.result, c.engine_version).where(c.id == uuid.UUID(calc_id))).one()
+
+
+def test_new_rows_get_the_current_engine_version(db_session, test_user):
+    calc = Calculation.create("addition", test_user.id, [1, 2])
+    calc.result = calc.get_result()
+    db_session.add(calc)
+    db_session.commit()
+    assert calc.engine_version == calculation_model.ENGINE_VERSIONS["addition"]
+
+
+def test_stale_rows_are_recomputed_on_read_and_persisted(bumped_division):
+    headers = register_and_login()
+    calc = client.post("/calculations", json={"type": "division", "inputs": [9, 3]}, headers=headers).json()
+    fresh = client.post("/calculations", json={"type": "addition", "inputs": [1, 1]}, headers=headers).json()
+    corrupt(calc["id"], 4.0)
+    corrupt(fresh["id"], 7.0, engine_version=calculation_model.ENGINE_VERSIONS["addition"])  # Not stale
+
+    listed = {c["id"]: c["result"] for c in client.get("/calculations", headers=headers).json()}
+    assert listed[calc["id"]] == 3
+    assert listed[fresh["id"]] == 7
+    # The background task wrote the fresh result and version to the primary
+    assert tuple(stored(calc["id"])) == (3.0, bumped_division)
+
+
+def test_single_read_recomputes_stale_row(bumped_division):
+    headers = register_and_login()
+    calc = client.post("/calculations", json={"type": "division", "inputs": [8, 2]}, headers=headers).json()
+    corrupt(calc["id"], 1.0)
+
+    assert client.get(f"/calculations/{calc['id']}", headers=headers).json()["result"] == 4
+    assert tuple(stored(calc["id"])) == (4.0, bumped_division)
+
+
+def test_stale_chains_use_the_fresh_upstream_result(bumped_division):
+    headers = register_and_login()
+    root = client.post("/calculations", json={"type": "division", "inputs": [12, 2]}, headers=headers).json()
+    middle = client.post(
+        "/calculations", json={"type": "division", "inputs": [{"ref": root["id"]}, 3]}, headers=headers
+    ).json()
+    leaf = client.post(
+        "/calculations", json={"type": "addition", "inputs": [{"ref": middle["id"]}, 1]}, headers=headers
+    ).json()
+    corrupt(root["id"], 5.0)
+    corrupt(middle["id"], 9.0)
+    corrupt(leaf["id"], 0.0, engine_version=calculation_model.ENGINE_VERSIONS["addition"])  # Current, its upstream is not
+
+    response = client.get("/calculations", headers=headers)
+    listed = {c["id"]: c["result"] for c in response.json()}
+    assert (listed[root["id"]], listed[middle["id"]], listed[leaf["id"]]) == (6, 2, 3)
+
+    corrupt(root["id"], 5.0)
+    corrupt(middle["id"], 9.0)
+    # The stale upstream is not part of the response, and is loaded in one more query
+    response = client.get(f"/calculations/{middle['id']}", headers=headers)
+    assert response.status_code == 200 and response.json()["result"] == 2
+    assert response.headers["x-query-count"] == "2"
+
+
+def test_backfill_streams_batches_and_cascades_to_dependents(committed_db_session, committed_user, bumped_division):
+    calcs = []
+    for i in range(5):
+        calc = Calculation.create("division", committed_user.id, [10 * (i + 1), 2])
+        calc.result = -1.0  # Wrong, old-engine result
+        calc.engine_version = 1
+        committed_db_session.add(calc)
+        calcs.append(calc)
+    committed_db_session.flush()
+    dependent = create_calculation(committed_db_session, "addition", committed_user.id, [{"ref": str(calcs[0].id)}, 1])
+    committed_db_session.commit()
+    assert dependent.result == 0
+
+    totals = backfill_results(batch_size=2, types=["division"])
+
+    assert totals["refreshed"] >= 5 and totals["failed"] == 0 and totals["batches"] >= 3
+    for i, calc in enumerate(calcs):
+        committed_db_session.refresh(calc)
+        assert (calc.result, calc.engine_version) == (5 * (i + 1), bumped_division)
+    committed_db_session.refresh(dependent)
+    assert dependent.result == 6
+    assert backfill_results(batch_size=2, types=["division"])["refreshed"] == 0
+
+
+def test_backfill_leaves_rows_that_fail_stale(committed_db_session, committed_user, bumped_division):
+    calc = Calculation.create("division", committed_user.id, [1, 0])  # Stored before validation existed
+    calc.result = 0.0
+    calc.engine_version = 1
+    committed_db_session.add(calc)
+    committed_db_session.commit()
+
+    totals = backfill_results(batch_size=100, types=["division"])
+
+    assert totals["failed"] >= 1
+    committed_db_session.refresh(calc)
+    assert calc.engine_version == 1
@@ -0,0 +1,145 @@
+# tests/integration/test_user_deletion.py
+import uuid
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event, inspect
+
+from app import main
+from app.auth import dependencies, redis as token_blacklist
+from app.jobs.user_deletion import purge_user
+from app.main import app
+from app.models.calculation import Calculation
+from app.models.calculation_archive import CalculationArchive
+from app.models.user import User
+
+client = TestClient(app)
+
+
+def add_calculations(db_session, user, count):
+    for i in range(count):
+        calc = Calculation.create("addition", user.id, [i, 1])
+        calc.result = calc.get_result()
+        db_session.add(calc)
+    db_session.commit()
+
+
+def archive_one(db_session, user):
+    calc = db_session.query(Calculation).filter(Calculation.user_id == user.id).first()
+    db_session.add(CalculationArchive(
+        id=calc.id, user_id=user.id, type=calc.type, inputs=calc.inputs, result=calc.result,
+        created_at=calc.created_at, updated_at=calc.updated_at,
+    ))
+    db_session.delete(calc)
+    db_session.commit()
+
+
+def test_purge_deletes_rows_in_batches(committed_db_session, committed_user):
+    add_calculations(committed_db_session, committed_user, 7)
+    archive_one(committed_db_session, committed_user)
+    user_id = committed_user.id
+    committed_db_session.add(committed_user)
+    committed_user.is_active = False
+    committed_db_session.commit()
+
+    deleted = purge_user(user_id, batch_size=2)
+
+    assert deleted == {"calculations": 6, "calculations_archive": 1, "users": 1}
+    committed_db_session.expire_all()
+    assert committed_db_session.get(User, user_id) is None
+    assert committed_db_session.query(Calculation).filter(Calculation.user_id == user_id).count() == 0
+
+
+def test_purge_skips_active_users(db_session, test_user):
+    add_calculations(db_session, test_user, 2)
+    assert purge_user(test_user.id)["users"] == 0
+    assert db_session.query(Calculation).filter(Calculation.user_id == test_user.id).count() == 2
+
+
+def test_orm_delete_does_not_load_calculations(db_session, test_user):
+    add_calculations(db_session, test_user, 3)
+    user_id = test_user.id
+    db_session.expire_all()
+    statements = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(db_session.get_bind(), "before_cursor_execute", listener)
+    try:
+        user = db_session.get(User, user_id)
+        db_session.delete(user)
+        db_session.commit()
+    finally:
+        event.remove(db_session.get_bind(), "before_cursor_execute", listener)
+    assert not any("FROM calculations" in statement for statement in statements)
+    assert "calculations" not in inspect(user).dict
+    assert db_session.query(Calculation).filter(Calculation.user_id == user_id).count() == 0
+
+
+class FakeBlacklist:
+    """In-memory stand-in for the Redis token blacklist."""
+
+    def __init__(self):
+        self.revoked = {}
+
+    async def add(self, jti, ttl):
+        self.revoked[jti] = ttl
+
+    async def contains(self, jti):
+        return jti in self.revoked
+
+
+def test_delete_account_endpoint(db_session, monkeypatch):
+    blacklist = FakeBlacklist()
+    monkeypatch.setattr(main, "add_to_blacklist", blacklist.add)
+    monkeypatch.setattr(token_blacklist, "is_blacklisted", blacklist.contains)
+    monkeypatch.setattr(dependencies, "_blacklist_down_until", 0.0)
+    username = f"leaver_{uuid.uuid4().hex[:8]}"
+    password = "SecurePass123!"
+    client.post("/auth/register", json={
+        "first_name": "Lea", "last_name": "Ver", "email": f"{username}@example.com",
+        "username": username, "password": password, "confirm_password": password,
+    })
+    token = client.post("/auth/login", json={"username": username, "password": password}).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    for inputs in ([1, 2], [3, 4]):
+        client.post("/calculations", json={"type": "addition", "inputs": inputs}, headers=headers)
+
+    # TestClient runs background tasks before returning the response
+    response = client.delete("/users/me", headers=headers)
+    assert response.status_code == 202
+    assert db_session.query(User).filter(User.username == username).first() is None
+
+    [(jti, ttl)] = blacklist.revoked.items()
+    assert jti and 0 < ttl
+    login = client.post("/auth/login", json={"username": username, "password": password})
+    assert login.status_code == 401
+    # The old token no longer reads or writes
+    assert client.get("/calculations", headers=headers).status_code == 401
+    assert client.post("/calculations", json={"type": "addition", "inputs": [5, 6]}, headers=headers).status_code == 401
+    assert client.delete("/users/me", headers=headers).status_code == 401
+
+
+def test_deactivated_user_cannot_write(committed_db_session, committed_user):
+    token = committed_user.create_access_token({"sub": str(committed_user.id)})
+    headers = {"Authorization": f"Bearer {token}"}
+    assert client.post("/calculations", json={"type": "addition", "inputs": [1, 2]}, headers=headers).status_code == 201
+
+    committed_db_session.add(committed_user)
+    committed_user.is_active = False
+    committed_db_session.commit()
+    response = client.post("/calculations", json={"type": "addition", "inputs": [1, 2]}, headers=headers)
+    assert response.status_code == 401
+
+
+def test_unreachable_blacklist_is_skipped_for_a_while(monkeypatch, committed_user):
+    calls = []
+
+    async def unreachable(jti):
+        calls.append(jti)
+        raise ConnectionError("Redis is down")
+
+    monkeypatch.setattr(token_blacklist, "is_blacklisted", unreachable)
+    monkeypatch.setattr(dependencies, "_blacklist_down_until", 0.0)
+    token = committed_user.create_access_token({"sub": str(committed_user.id)})
+    headers = {"Authorization": f"Bearer {token}"}
+    assert client.get("/calculations", headers=headers).status_code == 200
+    assert client.get("/calculations", headers=headers).status_code == 200
+    assert len(calls) == 1
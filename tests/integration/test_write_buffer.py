@@ -0,0 +1,139 @@
+# tests/integration/test_write_buffer.py
+import threading
+import uuid
+from concurrent.futures import Future, wait
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.core.write_buffer import GroupCommitBuffer
+from app.models.calculation import Calculation
+from tests.conftest import TestingSessionLocal
+
+
+def make_row(user_id, value=1.0):
+    return {"user_id": user_id, "type": "addition", "inputs": [value, 1.0], "result": value + 1}
+
+
+@pytest.fixture
+def buffer():
+    buffer = GroupCommitBuffer(TestingSessionLocal, Calculation.__table__, max_rows=10, max_delay_ms=50)
+    yield buffer
+    buffer.stop()
+
+
+def test_concurrent_submits_share_one_commit(committed_user):
+    # Flushes exactly when all 8 rows are waiting, however the threads are scheduled
+    buffer = GroupCommitBuffer(TestingSessionLocal, Calculation.__table__, max_rows=8, max_delay_ms=10_000)
+    futures = []
+    barrier = threading.Barrier(8)
+
+    def submit(i):
+        barrier.wait()
+        futures.append(buffer.submit(make_row(committed_user.id, float(i))))
+
+    threads = [threading.Thread(target=submit, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wait(futures, timeout=5)
+    buffer.stop()
+
+    rows = [future.result() for future in futures]
+    assert buffer.batches == 1 and buffer.rows == 8
+    assert all(row.user_id == committed_user.id and row.id is not None for row in rows)
+    assert sorted(row.inputs[0] for row in rows) == [float(i) for i in range(8)]
+
+
+def test_futures_get_their_own_rows(buffer, committed_user):
+    futures = [buffer.submit(make_row(committed_user.id, float(i))) for i in range(25)]
+    for i, future in enumerate(futures):
+        row = future.result(timeout=5)
+        assert row.inputs == [float(i), 1.0]
+        assert row.result == i + 1
+    assert buffer.rows == 25 and buffer.batches >= 3  # max_rows=10
+
+
+def test_bad_row_only_fails_its_own_request(buffer, committed_user):
+    good = buffer.submit(make_row(committed_user.id))
+    bad = buffer.submit(make_row(uuid.uuid4()))  # No such user: foreign key violation
+    assert good.result(timeout=5).user_id == committed_user.id
+    with pytest.raises(IntegrityError):
+        bad.result(timeout=5)
+
+
+def test_stop_flushes_queued_rows(committed_user):
+    buffer = GroupCommitBuffer(TestingSessionLocal, Calculation.__table__, max_rows=100, max_delay_ms=10_000)
+    future = buffer.submit(make_row(committed_user.id))
+    buffer.stop()
+    assert future.result(timeout=1).user_id == committed_user.id
+
+
+def test_cancelled_rows_are_not_inserted(committed_db_session, committed_user):
+    buffer = GroupCommitBuffer(TestingSessionLocal, Calculation.__table__, max_rows=100, max_delay_ms=10_000)
+    kept = buffer.submit(make_row(committed_user.id, 1.0))
+    withdrawn = buffer.submit(make_row(committed_user.id, 2.0))
+    assert withdrawn.cancel()
+    buffer.stop()
+
+    assert kept.result(timeout=1).inputs == [1.0, 1.0]
+    assert buffer.rows == 1
+    stored = committed_db_session.query(Calculation).filter(Calculation.user_id == committed_user.id).all()
+    assert [calc.inputs for calc in stored] == [[1.0, 1.0]]
+
+
+def buffered_client(monkeypatch, buffer):
+    """A TestClient whose creates go through `buffer`, and auth headers of a new user."""
+    from fastapi.testclient import TestClient
+    import app.main as main
+
+    monkeypatch.setattr(main, "write_buffer", buffer)
+    client = TestClient(main.app)
+    username = f"buffered_{uuid.uuid4().hex[:8]}"
+    client.post("/auth/register", json={
+        "first_name": "Buf", "last_name": "Fered", "email": f"{username}@example.com",
+        "username": username, "password": "SecurePass123!", "confirm_password": "SecurePass123!",
+    })
+    token = client.post("/auth/login", json={"username": username, "password": "SecurePass123!"}).json()["access_token"]
+    return client, {"Authorization": f"Bearer {token}"}
+
+
+def test_create_endpoint_uses_buffer(buffer, monkeypatch):
+    client, headers = buffered_client(monkeypatch, buffer)
+
+    response = client.post("/calculations", json={"type": "multiplication", "inputs": [3, 4]}, headers=headers)
+    assert response.status_code == 201
+    body = response.json()
+    assert body["type"] == "multiplication" and body["result"] == 12
+    assert buffer.rows == 1
+
+    fetched = client.get(f"/calculations/{body['id']}", headers=headers).json()
+    assert fetched["result"] == 12
+
+
+def test_create_endpoint_times_out_with_503(monkeypatch):
+    from app.core.config import settings
+
+    stalled = GroupCommitBuffer(TestingSessionLocal, Calculation.__table__, max_rows=100, max_delay_ms=10_000)
+    client, headers = buffered_client(monkeypatch, stalled)
+    monkeypatch.setattr(settings, "WRITE_BUFFER_TIMEOUT_SECONDS", 0.05)
+    try:
+        response = client.post("/calculations", json={"type": "addition", "inputs": [1, 2]}, headers=headers)
+    finally:
+        stalled.stop()
+    assert response.status_code == 503
+    assert response.json()["detail"].endswith("was not saved.")
+    assert stalled.rows == 0
+
+
+def test_create_endpoint_maps_integrity_error_to_409(monkeypatch):
+    class FailingBuffer:
+        def submit(self, row):
+            future = Future()
+            future.set_exception(IntegrityError("INSERT", {}, Exception("foreign key violation")))
+            return future
+
+    client, headers = buffered_client(monkeypatch, FailingBuffer())
+    response = client.post("/calculations", json={"type": "addition", "inputs": [1, 2]}, headers=headers)
+    assert response.status_code == 409
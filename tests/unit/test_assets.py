@@ -0,0 +1,78 @@
+# tests/unit/test_assets.py
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.build_static import fingerprint_directory, precompress_directory
+from app.core.assets import IMMUTABLE_CACHE_CONTROL, AssetManifest, FingerprintedStaticFiles
+
+
+@pytest.fixture
+def static_dir(tmp_path):
+    (tmp_path / "js").mkdir()
+    (tmp_path / "css").mkdir()
+    (tmp_path / "js" / "dashboard.js").write_text("console.log('dashboard');\n" * 50)
+    (tmp_path / "css" / "style.css").write_text("body { margin: 0; }\n")
+    (tmp_path / "robots.txt").write_text("User-agent: *\n")
+    return tmp_path
+
+
+def test_fingerprint_writes_hashed_copies_and_manifest(static_dir):
+    manifest = fingerprint_directory(static_dir)
+    assert set(manifest) == {"js/dashboard.js", "css/style.css"}
+    hashed = manifest["js/dashboard.js"]
+    assert hashed.startswith("js/dashboard.") and hashed.endswith(".js")
+    assert (static_dir / "dist" / hashed).read_bytes() == (static_dir / "js" / "dashboard.js").read_bytes()
+    on_disk = json.loads((static_dir / "dist" / "manifest.json").read_text())
+    assert on_disk == manifest
+
+
+def test_fingerprint_hash_changes_with_content(static_dir):
+    first = fingerprint_directory(static_dir)["css/style.css"]
+    (static_dir / "css" / "style.css").write_text("body { margin: 1px; }\n")
+    second = fingerprint_directory(static_dir)["css/style.css"]
+    assert first != second
+    # The dist directory is rebuilt, so the stale copy is gone
+    assert not (static_dir / "dist" / first).exists()
+
+
+def test_manifest_url_resolves_hashed_path(static_dir):
+    manifest = fingerprint_directory(static_dir)
+    assets = AssetManifest(directory=str(static_dir), url_prefix="/static")
+    assert assets.url("js/dashboard.js") == f"/static/dist/{manifest['js/dashboard.js']}"
+
+
+def test_manifest_url_falls_back_without_build(static_dir):
+    assets = AssetManifest(directory=str(static_dir), url_prefix="/static/")
+    assert assets.url("js/dashboard.js") == "/static/js/dashboard.js"
+    assert assets.url("/img/favicon.ico") == "/static/img/favicon.ico"
+
+
+def test_fingerprinted_assets_are_immutable(static_dir):
+    fingerprint_directory(static_dir)
+    precompress_directory(static_dir)
+    assets = AssetManifest(directory=str(static_dir))
+    app = FastAPI()
+    app.mount("/static", FingerprintedStaticFiles(directory=static_dir), name="static")
+    client = TestClient(app)
+
+    hashed = client.get(assets.url("js/dashboard.js"), headers={"Accept-Encoding": "br"})
+    assert hashed.status_code == 200
+    assert hashed.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+    assert hashed.headers["content-encoding"] == "br"
+
+    revalidated = client.get(
+        assets.url("js/dashboard.js"),
+        headers={"Accept-Encoding": "br", "If-None-Match": hashed.headers["etag"]},
+    )
+    assert revalidated.status_code == 304
+    assert revalidated.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+
+    original = client.get("/static/js/dashboard.js")
+    assert original.status_code == 200
+    assert "cache-control" not in original.headers
+
+    manifest = client.get("/static/dist/manifest.json")
+    assert "cache-control" not in manifest.headers
@@ -97,4 +97,25 @@ def test_lcm_invalid_zero():
 def test_create_lcm_type():
     calc = AbstractCalculation.create("lcm", uuid.uuid4(), [4, 6])
     assert isinstance(calc, LCM)
-    assert calc.get_result() == 12
\ No newline at end of file
+    assert calc.get_result() == 12
+# --- Engine versions ---
+def test_evaluate_batch_matches_get_result_and_returns_errors():
+    results = Division.evaluate_batch([[10, 4], [1, 0], [9, 3, 3]])
+    assert results[0] == 2.5 and results[2] == 1
+    assert isinstance(results[1], ValueError)
+
+def test_evaluate_batch_rejects_overflow_to_infinity():
+    results = Multiplication.evaluate_batch([[1e308, 10], [2, 3]])
+    assert isinstance(results[0], ValueError) and results[1] == 6
+
+def test_lcm_beyond_float_range_is_rejected():
+    from app.models.calculation import ensure_finite
+    results = LCM.evaluate_batch([[1e300, 9.999999999999999e299], [4, 6]])
+    assert isinstance(results[0], ValueError) and results[1] == 12
+    with pytest.raises(ValueError, match="too large"):
+        ensure_finite(10 ** 400)
+
+def test_engine_versions_cover_every_type():
+    from app.models.calculation import CALCULATION_CLASSES, ENGINE_VERSIONS
+    assert set(ENGINE_VERSIONS) == set(CALCULATION_CLASSES)
+    assert all(version >= 1 for version in ENGINE_VERSIONS.values())
@@ -0,0 +1,81 @@
+# tests/unit/test_calculation_queries.py
+import json
+from datetime import datetime
+from typing import List
+from uuid import uuid4
+
+from pydantic import TypeAdapter
+from sqlalchemy.dialects import postgresql
+
+from app.queries.calculation import dump_calculation_rows, select_user_calculations
+from app.schemas.calculation import CalculationResponse
+
+response_adapter = TypeAdapter(List[CalculationResponse])
+
+
+def make_row(calc_type, inputs, result, created_at):
+    return (calc_type, inputs, uuid4(), uuid4(), created_at, created_at, result)
+
+
+def as_response_json(rows) -> bytes:
+    """Serialize rows the way the response_model path does."""
+    keys = ("type", "inputs", "id", "user_id", "created_at", "updated_at", "result")
+    data = [dict(zip(keys, row)) for row in rows]
+    return response_adapter.dump_json(response_adapter.validate_python(data))
+
+
+def test_dump_matches_response_model_bytes():
+    rows = [
+        make_row("addition", [10.5, 3, 2], 15.5, datetime(2025, 1, 1, 12, 30, 45, 123456)),
+        make_row("lcm", [4, 6], 12.0, datetime(2025, 1, 1)),
+        make_row("division", [1, 3], 1 / 3, datetime(2025, 6, 30, 23, 59, 59, 1)),
+    ]
+    assert dump_calculation_rows(rows) == as_response_json(rows)
+
+
+def test_dump_coerces_integer_inputs_to_float():
+    rows = [
+        make_row("addition", [1, 2], 3.0, datetime(2025, 1, 1)),
+        make_row("lcm", [4.0, 6.0], 12.0, datetime(2025, 1, 1)),
+    ]
+    body = dump_calculation_rows(rows)
+    assert b'"inputs":[1.0,2.0]' in body
+    assert b'"inputs":[4.0,6.0]' in body
+    assert json.loads(body)[1]["result"] == 12.0
+
+
+def test_dump_empty_list():
+    assert dump_calculation_rows([]) == b"[]"
+
+
+def test_select_filters_by_user_and_orders_columns():
+    user_id = uuid4()
+    stmt = select_user_calculations(user_id)
+    compiled = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "WHERE calculations.user_id = " in compiled
+    assert [c.name for c in stmt.selected_columns] == [
+        "type", "inputs", "id", "user_id", "created_at", "updated_at", "result"
+    ]
+
+
+def test_select_excludes_archive_by_default():
+    compiled = str(select_user_calculations(uuid4()).compile(dialect=postgresql.dialect()))
+    assert "calculations_archive" not in compiled
+
+
+def test_select_include_archived_unions_archive_columns():
+    stmt = select_user_calculations(uuid4(), include_archived=True)
+    compiled = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "UNION ALL" in compiled
+    assert "WHERE calculations_archive.user_id = " in compiled
+    assert [c.name for c in stmt.selected_columns] == [
+        "type", "inputs", "id", "user_id", "created_at", "updated_at", "result"
+    ]
+
+
+def test_dump_passes_references_through():
+    ref = str(uuid4())
+    rows = [make_row("multiplication", [{"ref": ref}, 3], 126.0, datetime(2025, 1, 1))]
+    body = dump_calculation_rows(rows)
+    assert body == as_response_json(rows)
+    assert json.loads(body)[0]["inputs"] == [{"ref": ref}, 3.0]
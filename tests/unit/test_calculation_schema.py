@@ -99,3 +99,24 @@ def test_calculation_lcm_inputs_too_many():
         )
     assert "LCM requires exactly two numbers" in str(exc.value)
 
+
+# --- references to other calculations ---
+def test_calculation_inputs_accept_refs():
+    ref = uuid4()
+    calc = CalculationCreate(type="lcm", inputs=[{"ref": str(ref)}, 6.0], user_id=uuid4())
+    assert calc.inputs[0].ref == ref
+    assert calc.inputs[1] == 6 and isinstance(calc.inputs[1], int)
+
+def test_calculation_division_by_ref_is_not_checked_statically():
+    # The referenced result is only known when the calculation is evaluated
+    calc = CalculationCreate(type="division", inputs=[10, {"ref": str(uuid4())}], user_id=uuid4())
+    assert len(calc.inputs) == 2
+
+def test_calculation_ref_rejects_extra_keys():
+    with pytest.raises(ValidationError):
+        CalculationUpdate(inputs=[{"ref": str(uuid4()), "scale": 2}, 1])
+
+@pytest.mark.parametrize("value", [float("nan"), float("inf"), float("-inf")])
+def test_calculation_inputs_must_be_finite(value):
+    with pytest.raises(ValidationError):
+        CalculationCreate(type="addition", inputs=[value, 1], user_id=uuid4())
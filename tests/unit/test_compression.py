@@ -0,0 +1,178 @@
+# tests/unit/test_compression.py
+import gzip
+
+import brotli
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import HTMLResponse, Response
+from fastapi.testclient import TestClient
+
+from app.build_static import precompress_directory
+from app.core.compression import (
+    CompressionMiddleware,
+    PrecompressedStaticFiles,
+    choose_encoding,
+    is_compressible,
+    parse_accept_encoding,
+)
+
+LARGE_JSON = b'{"items":[' + b",".join(b'{"value":%d}' % i for i in range(500)) + b"]}"
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=500)
+
+    @app.get("/large")
+    def large():
+        return Response(LARGE_JSON, media_type="application/json")
+
+    @app.get("/small")
+    def small():
+        return {"status": "ok"}
+
+    @app.get("/page", response_class=HTMLResponse)
+    def page():
+        return "<html>" + "<p>hello</p>" * 200 + "</html>"
+
+    @app.get("/image")
+    def image():
+        return Response(b"\x89PNG" + b"\x00" * 2000, media_type="image/png")
+
+    return TestClient(app)
+
+
+def raw_get(client, path, accept_encoding):
+    """Request without httpx transparently decoding the body."""
+    with client.stream("GET", path, headers={"Accept-Encoding": accept_encoding}) as response:
+        return response, b"".join(response.iter_raw())
+
+
+# --- Accept-Encoding negotiation ---
+def test_parse_accept_encoding():
+    assert parse_accept_encoding("gzip, br;q=0.8, *;q=0") == {"gzip": 1.0, "br": 0.8, "*": 0.0}
+    assert parse_accept_encoding("") == {}
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("gzip, deflate, br", "br"),
+        ("gzip", "gzip"),
+        ("gzip;q=1.0, br;q=0.5", "gzip"),
+        ("br;q=0, gzip;q=0", None),
+        ("*", "br"),
+        ("identity", None),
+        ("", None),
+    ],
+)
+def test_choose_encoding(header, expected):
+    assert choose_encoding(header) == expected
+
+
+def test_is_compressible():
+    assert is_compressible("application/json")
+    assert is_compressible("text/html; charset=utf-8")
+    assert not is_compressible("image/png")
+    assert not is_compressible("")
+
+
+# --- Middleware ---
+def test_large_json_is_brotli_compressed(client):
+    response, body = raw_get(client, "/large", "gzip, br")
+    assert response.headers["content-encoding"] == "br"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert brotli.decompress(body) == LARGE_JSON
+
+
+def test_large_json_is_gzip_compressed(client):
+    response, body = raw_get(client, "/large", "gzip")
+    assert response.headers["content-encoding"] == "gzip"
+    assert gzip.decompress(body) == LARGE_JSON
+
+
+def test_html_is_compressed(client):
+    response, body = raw_get(client, "/page", "br")
+    assert response.headers["content-encoding"] == "br"
+    assert brotli.decompress(body).startswith(b"<html>")
+
+
+def test_small_response_is_not_compressed(client):
+    response, body = raw_get(client, "/small", "gzip, br")
+    assert "content-encoding" not in response.headers
+    assert body == b'{"status":"ok"}'
+
+
+def test_non_allowlisted_type_is_not_compressed(client):
+    response, body = raw_get(client, "/image", "gzip, br")
+    assert "content-encoding" not in response.headers
+    assert body.startswith(b"\x89PNG")
+
+
+def test_identity_when_not_accepted(client):
+    response, body = raw_get(client, "/large", "identity")
+    assert "content-encoding" not in response.headers
+    assert body == LARGE_JSON
+
+
+# --- Precompressed static files ---
+@pytest.fixture
+def static_client(tmp_path):
+    css = tmp_path / "css"
+    css.mkdir()
+    (css / "style.css").write_text("body { color: black; }\n" * 100)
+    (tmp_path / "plain.css").write_text("p { margin: 0; }\n" * 100)
+    precompress_directory(css)
+
+    app = FastAPI()
+    app.mount("/static", PrecompressedStaticFiles(directory=tmp_path), name="static")
+    return TestClient(app), tmp_path
+
+
+def test_build_static_writes_variants(static_client):
+    _, root = static_client
+    assert (root / "css" / "style.css.gz").exists()
+    assert (root / "css" / "style.css.br").exists()
+    assert not (root / "plain.css.gz").exists()
+
+
+def test_serves_brotli_variant(static_client):
+    client, root = static_client
+    response, body = raw_get(client, "/static/css/style.css", "gzip, br")
+    assert response.headers["content-encoding"] == "br"
+    assert response.headers["content-type"].startswith("text/css")
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert brotli.decompress(body) == (root / "css" / "style.css").read_bytes()
+
+
+def test_serves_gzip_variant(static_client):
+    client, root = static_client
+    response, body = raw_get(client, "/static/css/style.css", "gzip")
+    assert response.headers["content-encoding"] == "gzip"
+    assert gzip.decompress(body) == (root / "css" / "style.css").read_bytes()
+
+
+def test_serves_original_when_not_accepted(static_client):
+    client, root = static_client
+    response, body = raw_get(client, "/static/css/style.css", "identity")
+    assert "content-encoding" not in response.headers
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert body == (root / "css" / "style.css").read_bytes()
+
+
+def test_variant_not_modified(static_client):
+    client, _ = static_client
+    response, _ = raw_get(client, "/static/css/style.css", "br")
+    etag = response.headers["etag"]
+    again = client.get(
+        "/static/css/style.css", headers={"Accept-Encoding": "br", "If-None-Match": etag}
+    )
+    assert again.status_code == 304
+
+
+def test_file_without_variants_is_served_as_is(static_client):
+    client, root = static_client
+    response, body = raw_get(client, "/static/plain.css", "br")
+    assert "content-encoding" not in response.headers
+    assert body == (root / "plain.css").read_bytes()
@@ -0,0 +1,87 @@
+# tests/unit/test_page_cache.py
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.templating import Jinja2Templates
+from fastapi.testclient import TestClient
+
+from app.core.page_cache import PageCache
+
+
+@pytest.fixture
+def templates(tmp_path):
+    (tmp_path / "home.html").write_text("<h1>Home</h1>")
+    (tmp_path / "item.html").write_text("<p>Item {{ item_id }}</p>")
+    return Jinja2Templates(directory=str(tmp_path))
+
+
+def test_render_produces_bytes_and_strong_etag(templates):
+    cache = PageCache(templates)
+    page = cache.render("home.html")
+    assert page.body == b"<h1>Home</h1>"
+    assert page.etag.startswith('"') and page.etag.endswith('"')
+
+
+def test_static_pages_render_once(templates, monkeypatch):
+    cache = PageCache(templates)
+    cache.prerender("home.html")
+    calls = []
+    monkeypatch.setattr(cache, "render", lambda *a, **k: calls.append(a))
+    assert cache.get("home.html").body == b"<h1>Home</h1>"
+    assert calls == []
+
+
+def test_parameterized_pages_are_cached_per_parameter(templates):
+    cache = PageCache(templates)
+    first = cache.get("item.html", item_id="a")
+    assert first.body == b"<p>Item a</p>"
+    assert cache.get("item.html", item_id="a") is first
+    assert cache.get("item.html", item_id="b").body == b"<p>Item b</p>"
+    assert cache.get("item.html", item_id="b").etag != first.etag
+
+
+def test_parameters_are_escaped(templates):
+    cache = PageCache(templates)
+    assert cache.get("item.html", item_id="<x>").body == b"<p>Item &lt;x&gt;</p>"
+
+
+def test_lru_is_bounded(templates):
+    cache = PageCache(templates, max_entries=2)
+    a = cache.get("item.html", item_id="a")
+    cache.get("item.html", item_id="b")
+    cache.get("item.html", item_id="a")  # a is now most recently used
+    cache.get("item.html", item_id="c")  # evicts b
+    assert len(cache.parameterized_pages) == 2
+    assert cache.get("item.html", item_id="a") is a
+    assert ("item.html", (("item_id", "b"),)) not in cache.parameterized_pages
+
+
+def test_respond_handles_if_none_match(templates):
+    cache = PageCache(templates)
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    def item(request: Request, item_id: str):
+        return cache.respond(request, "item.html", item_id=item_id)
+
+    client = TestClient(app)
+    response = client.get("/items/1")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/html")
+    assert response.text == "<p>Item 1</p>"
+    etag = response.headers["etag"]
+
+    cached = client.get("/items/1", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+
+    other = client.get("/items/2", headers={"If-None-Match": etag})
+    assert other.status_code == 200
+
+
+def test_clear(templates):
+    cache = PageCache(templates)
+    cache.prerender("home.html")
+    cache.get("item.html", item_id="a")
+    cache.clear()
+    assert not cache.static_pages and not cache.parameterized_pages
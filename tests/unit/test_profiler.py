@@ -0,0 +1,56 @@
+# tests/unit/test_profiler.py
+import sys
+import threading
+import time
+
+from app.core.profiler import SamplingProfiler, collapse, is_idle
+
+
+def busy_loop(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(range(1000))
+
+
+def test_collapse_lists_frames_outermost_first():
+    stack = collapse(sys._getframe())
+    assert stack.endswith("test_collapse_lists_frames_outermost_first (tests/unit/test_profiler.py)")
+    assert ";" in stack and "\n" not in stack
+
+
+def test_profiler_counts_stacks_of_busy_threads_only():
+    stop, idle = threading.Event(), threading.Event()
+    busy = threading.Thread(target=busy_loop, args=(stop,))
+    waiting = threading.Thread(target=idle.wait)
+    busy.start()
+    waiting.start()
+    profiler = SamplingProfiler(interval=0.001).start()
+    time.sleep(0.1)
+    profiler.stop()
+    stop.set()
+    idle.set()
+    busy.join()
+    waiting.join()
+
+    assert profiler.samples > 0
+    lines = profiler.collapsed().splitlines()
+    assert any("busy_loop (tests/unit/test_profiler.py)" in line for line in lines)
+    assert not any("sampling-profiler" in line or "Event.wait" in line.rsplit(" ", 1)[0].split(";")[-1] for line in lines)
+    stack, count = lines[0].rsplit(" ", 1)
+    assert int(count) >= 1
+
+
+def test_include_filter_restricts_threads():
+    profiler = SamplingProfiler(include=lambda thread_id, frame: thread_id == threading.main_thread().ident)
+    profiler.sample()
+    assert all("test_include_filter_restricts_threads" in stack for stack in profiler.stacks)
+
+
+def test_waiting_threads_are_idle():
+    event = threading.Event()
+    waiting = threading.Thread(target=event.wait)
+    waiting.start()
+    time.sleep(0.01)
+    assert is_idle(sys._current_frames()[waiting.ident])
+    event.set()
+    waiting.join()
+    assert not is_idle(sys._getframe())
@@ -0,0 +1,101 @@
+# tests/unit/test_responses.py
+"""
+Golden tests: FastJSONResponse must render the same JSON as JSONResponse
+for the payloads FastAPI hands to the response class (response_model output
+serialized in JSON mode). Bytes only differ in how some floats are written
+(see FastJSONResponse), so payloads are compared after parsing.
+"""
+import json
+from datetime import datetime, timezone
+from typing import List
+from uuid import UUID, uuid4
+
+import pytest
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from app.core.responses import FastJSONResponse, dumps_json
+from app.schemas.calculation import CalculationResponse
+from app.schemas.token import TokenResponse
+from app.schemas.user import UserResponse
+
+NOW = datetime(2025, 1, 1, 12, 30, 45, 123456)
+
+
+def as_content(model_type, value):
+    """Mimic FastAPI's serialize_response for a response_model."""
+    adapter = TypeAdapter(model_type)
+    return adapter.dump_python(adapter.validate_python(value), mode="json")
+
+
+def calculation(calc_type, inputs, result):
+    return {
+        "id": uuid4(), "user_id": uuid4(), "type": calc_type, "inputs": inputs,
+        "result": result, "created_at": NOW, "updated_at": NOW,
+    }
+
+
+GOLDEN_PAYLOADS = {
+    "calculation_list": as_content(List[CalculationResponse], [
+        calculation("addition", [10.5, 3, 2], 15.5),
+        calculation("division", [1, 3], 1 / 3),
+        calculation("multiplication", [1e10, 1e10], 1e20),
+        calculation("subtraction", [0.1, 0.2], -0.1),
+        calculation("lcm", [4, 6], 12),
+    ]),
+    "empty_list": as_content(List[CalculationResponse], []),
+    "token": as_content(TokenResponse, {
+        "access_token": "a.b.c", "refresh_token": "d.e.f", "token_type": "bearer",
+        "expires_at": datetime(2025, 1, 1, tzinfo=timezone.utc), "user_id": uuid4(),
+        "username": "johndoe", "email": "john.doe@example.com", "first_name": "John",
+        "last_name": "Doe", "is_active": True, "is_verified": False,
+    }),
+    "user_unicode": as_content(UserResponse, {
+        "id": uuid4(), "username": "zoë", "email": "zoe@example.com", "first_name": "Zoë",
+        "last_name": "Ñúñez 😀", "is_active": True, "is_verified": False,
+        "created_at": NOW, "updated_at": NOW,
+    }),
+    "health": {"status": "ok"},
+    "error": {"detail": "Calculation not found."},
+}
+
+
+@pytest.mark.parametrize("name", sorted(GOLDEN_PAYLOADS))
+def test_fast_json_response_matches_json_response(name):
+    content = GOLDEN_PAYLOADS[name]
+    assert json.loads(FastJSONResponse(content).body) == json.loads(JSONResponse(content).body)
+
+
+def test_payloads_without_extreme_floats_are_byte_identical():
+    for name in ("empty_list", "token", "user_unicode", "health", "error"):
+        content = GOLDEN_PAYLOADS[name]
+        assert FastJSONResponse(content).body == JSONResponse(content).body, name
+
+
+@pytest.mark.parametrize("value, fast, standard", [
+    (1e20, b"1e20", b"1e+20"),
+    (2.5e-05, b"0.000025", b"2.5e-05"),
+    (1e-07, b"1e-7", b"1e-07"),
+    (1 / 3, b"0.3333333333333333", b"0.3333333333333333"),
+])
+def test_float_spelling_differs_but_value_does_not(value, fast, standard):
+    assert FastJSONResponse(value).body == fast
+    assert JSONResponse(value).body == standard
+    assert json.loads(fast) == json.loads(standard) == value
+
+
+def test_fast_json_response_headers():
+    response = FastJSONResponse({"status": "ok"}, status_code=201)
+    assert response.status_code == 201
+    assert response.headers["content-type"] == "application/json"
+    assert response.headers["content-length"] == str(len(b'{"status":"ok"}'))
+
+
+def test_dumps_json_handles_uuid_and_datetime_natively():
+    calc_id = UUID("123e4567-e89b-12d3-a456-426614174000")
+    body = dumps_json({"id": calc_id, "created_at": NOW, calc_id: 1})
+    assert body == (
+        b'{"id":"123e4567-e89b-12d3-a456-426614174000",'
+        b'"created_at":"2025-01-01T12:30:45.123456",'
+        b'"123e4567-e89b-12d3-a456-426614174000":1}'
+    )
@@ -0,0 +1,125 @@
+# tests/unit/test_result_cache.py
+import pytest
+
+from app.core.result_cache import (
+    MemoryResultStore,
+    RedisResultStore,
+    ResultCache,
+    cache_key,
+    canonical_payload,
+)
+
+
+class BrokenStore:
+    name = "broken"
+
+    def __init__(self):
+        self.calls = 0
+
+    def get_many(self, keys):
+        self.calls += 1
+        raise ConnectionError("store is down")
+
+    def set_many(self, items):
+        self.calls += 1
+        raise ConnectionError("store is down")
+
+
+def test_key_normalizes_numbers_and_type_but_keeps_order():
+    assert cache_key("LCM", [4, 6]) == cache_key("lcm", [4.0, 6.0])
+    assert cache_key("division", [10, 2]) != cache_key("division", [2, 10])
+    assert cache_key("addition", [1, 2]) != cache_key("multiplication", [1, 2])
+    assert canonical_payload("addition", [1, 2.5]) == b'["addition",1,[1.0,2.5]]'
+
+
+def test_key_includes_engine_version(monkeypatch):
+    from app.models import calculation as calculation_model
+    before = cache_key("division", [1, 2])
+    monkeypatch.setitem(calculation_model.ENGINE_VERSIONS, "division", 2)
+    assert cache_key("division", [1, 2]) != before
+
+
+def test_memory_store_evicts_least_recently_used():
+    store = MemoryResultStore(max_entries=2)
+    store.set_many({"a": 1.0, "b": 2.0})
+    store.get_many(["a"])
+    store.set_many({"c": 3.0})
+    assert store.get_many(["a", "b", "c"]) == [1.0, None, 3.0]
+
+
+def test_get_or_compute_counts_hits_and_bytes_saved():
+    cache = ResultCache([MemoryResultStore()])
+    calls = []
+    compute = lambda: calls.append(1) or 42.0
+
+    assert cache.get_or_compute("multiplication", [6, 7], compute) == 42.0
+    assert cache.get_or_compute("multiplication", [6.0, 7.0], compute) == 42.0
+    assert len(calls) == 1
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["hit_ratio"]) == (1, 1, 0.5)
+    assert stats["bytes_saved"] == len(canonical_payload("multiplication", [6, 7])) + 8
+
+
+def test_errors_are_not_cached():
+    cache = ResultCache([MemoryResultStore()])
+
+    def divide_by_zero():
+        raise ValueError("Cannot divide by zero.")
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            cache.get_or_compute("division", [1, 0], divide_by_zero)
+    assert cache.stats()["misses"] == 2
+
+
+def test_failing_store_falls_through_and_backs_off():
+    broken, memory = BrokenStore(), MemoryResultStore()
+    cache = ResultCache([broken, memory], retry_after_seconds=60)
+
+    assert cache.get_or_compute("addition", [1, 2], lambda: 3.0) == 3.0
+    assert cache.get_or_compute("addition", [1, 2], lambda: pytest.fail("should hit memory")) == 3.0
+    assert broken.calls == 1  # Skipped after the first failure
+    assert cache.stats()["errors"] == 1
+
+
+def test_hit_in_slower_tier_is_copied_into_faster_tiers():
+    fast, slow = MemoryResultStore(), MemoryResultStore()
+    fast.name, slow.name = "fast", "slow"
+    slow.set_many({cache_key("addition", [2, 2]): 4.0})
+    cache = ResultCache([fast, slow])
+
+    assert cache.lookup_many("addition", [[2, 2], [3, 3]]) == [4.0, None]
+    assert fast.get_many([cache_key("addition", [2, 2])]) == [4.0]
+
+
+def test_redis_store_uses_mget_and_pipelined_sets():
+    class FakePipeline:
+        def __init__(self, data):
+            self.data, self.commands = data, []
+
+        def set(self, key, value, ex=None):
+            self.commands.append((key, value, ex))
+
+        def execute(self):
+            for key, value, _ in self.commands:
+                self.data[key] = value
+
+    class FakeRedis:
+        def __init__(self):
+            self.data = {}
+            self.pipelines = []
+
+        def mget(self, keys):
+            return [self.data.get(key) for key in keys]
+
+        def pipeline(self, transaction=True):
+            self.pipelines.append(FakePipeline(self.data))
+            return self.pipelines[-1]
+
+    client = FakeRedis()
+    store = RedisResultStore(client, ttl_seconds=60)
+    store.set_many({"k1": 1.5, "k2": 2.0})
+    assert store.get_many(["k1", "k2", "k3"]) == [1.5, 2.0, None]
+    assert len(client.pipelines) == 1
+    assert all(ex == 60 for _, _, ex in client.pipelines[0].commands)
@@ -0,0 +1,26 @@
+# tests/unit/test_slow_query_log.py
+from app.database import redact_parameters, statement_shape
+
+
+def test_shape_ignores_values_and_in_list_lengths():
+    one = "SELECT id FROM calculations WHERE user_id = %(user_id_1)s AND id IN (%(id_1_1)s)"
+    three = "SELECT id\nFROM calculations WHERE user_id = %(user_id_1)s AND id IN (%(id_1_1)s, %(id_1_2)s, %(id_1_3)s)"
+    assert statement_shape(one) == statement_shape(three)
+    assert statement_shape(one) == "SELECT id FROM calculations WHERE user_id = ? AND id IN (?)"
+
+
+def test_shape_replaces_literals_but_not_identifiers():
+    shape = statement_shape("SELECT col1 FROM t2 WHERE name = 'it''s' AND x > 4.5 LIMIT 10")
+    assert shape == "SELECT col1 FROM t2 WHERE name = '?' AND x > ? LIMIT ?"
+
+
+def test_parameters_are_redacted_to_type_names():
+    assert redact_parameters({"email": "a@b.c", "n": 3, "missing": None}) == {
+        "email": "<str>", "n": "<int>", "missing": None,
+    }
+    assert redact_parameters(("secret", 1.5)) == ["<str>", "<float>"]
+
+
+def test_executemany_parameters_describe_the_first_set_only():
+    sets = [{"password": "hunter2"}, {"password": "swordfish"}]
+    assert redact_parameters(sets, executemany=True) == {"sets": 2, "first": {"password": "<str>"}}